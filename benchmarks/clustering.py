@@ -0,0 +1,218 @@
+"""Benchmark de agrupación de historias (MinHash/LSH) sobre un año sintético.
+
+Uso:
+    python -m benchmarks.clustering                    # 365 días, 3 medios
+    python -m benchmarks.clustering --days 30 --brute-days 30
+    python -m benchmarks.clustering --save clustering.json
+
+Genera titulares de tres medios que cubren los mismos hechos con palabras
+distintas (y noticias propias de cada medio), los agrupa con StoryClusterer
+día a día como llegarían las ejecuciones y mide titulares por segundo y la
+precisión/exhaustividad por pares respecto de los hechos reales. Para los
+primeros `--brute-days` días compara con la búsqueda exhaustiva (cada
+titular contra todos los anteriores), que es cuadrática.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from news_scraper.utils.clustering import StoryClusterer, shingles
+from news_scraper.utils.constants import CLUSTER_THRESHOLD
+
+OUTLETS = ["QueDigital", "0223", "La Capital"]
+SYLLABLES = [
+    "ba", "ca", "da", "fe", "go", "la", "ma", "ne", "pi", "ra",
+    "sa", "to", "ve", "ri", "con", "tor", "mun", "dad", "cion", "tes",
+]  # fmt: skip
+FILLERS = ["de", "la", "en", "el", "por", "con", "tras", "y", "un", "los"]
+
+DEFAULT_DAYS = 365
+DEFAULT_EVENTS_PER_DAY = 40  # hechos cubiertos por uno o más medios
+DEFAULT_OWN_PER_DAY = 30  # noticias propias de cada medio
+DEFAULT_BRUTE_DAYS = 7
+
+# (fecha, medio, url, titular, hecho)
+Headline = Tuple[str, str, str, str, int]
+
+
+def _vocabulary(rng: random.Random, size: int = 8000) -> List[str]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def _write_headline(rng: random.Random, keywords: List[str], vocab: List[str]) -> str:
+    """Titular de un medio sobre un hecho: parte de sus palabras clave, en otro
+    orden, con alguna palabra propia y palabras vacías."""
+    words = [word for word in keywords if rng.random() < 0.8] or keywords[:1]
+    words += rng.sample(vocab, rng.randint(0, 2))
+    rng.shuffle(words)
+    for _ in range(rng.randint(1, 3)):
+        words.insert(rng.randrange(len(words) + 1), rng.choice(FILLERS))
+    return " ".join(words).capitalize()
+
+
+def synthetic_headlines(
+    days: int, events_per_day: int, own_per_day: int, seed: int = 7
+) -> List[Headline]:
+    rng = random.Random(seed)
+    vocab = _vocabulary(rng)
+    start = date(2025, 1, 1)
+    headlines: List[Headline] = []
+    event = 0
+    for day in range(days):
+        fecha = (start + timedelta(days=day)).isoformat()
+        for _ in range(events_per_day):
+            event += 1
+            keywords = rng.sample(vocab, rng.randint(5, 8))
+            outlets = [outlet for outlet in OUTLETS if rng.random() < 0.6]
+            for outlet in outlets or [rng.choice(OUTLETS)]:
+                url = f"https://{outlet.lower().replace(' ', '')}.example/{event}"
+                title = _write_headline(rng, keywords, vocab)
+                headlines.append((fecha, outlet, url, title, event))
+        for outlet in OUTLETS:
+            for _ in range(own_per_day):
+                event += 1
+                keywords = rng.sample(vocab, rng.randint(5, 8))
+                url = f"https://{outlet.lower().replace(' ', '')}.example/{event}"
+                title = _write_headline(rng, keywords, vocab)
+                headlines.append((fecha, outlet, url, title, event))
+    return headlines
+
+
+def _pairs(groups: Dict[Any, int]) -> int:
+    return sum(size * (size - 1) // 2 for size in groups.values())
+
+
+def pair_scores(predicted: List[int], truth: List[int]) -> Dict[str, float]:
+    """Precisión y exhaustividad sobre los pares de titulares de una misma historia."""
+    by_predicted: Dict[int, int] = {}
+    by_truth: Dict[int, int] = {}
+    by_both: Dict[Tuple[int, int], int] = {}
+    for cluster, event in zip(predicted, truth):
+        by_predicted[cluster] = by_predicted.get(cluster, 0) + 1
+        by_truth[event] = by_truth.get(event, 0) + 1
+        by_both[cluster, event] = by_both.get((cluster, event), 0) + 1
+    hits = _pairs(by_both)
+    predicted_pairs = _pairs(by_predicted)
+    true_pairs = _pairs(by_truth)
+    return {
+        "precision": round(hits / predicted_pairs, 4) if predicted_pairs else 1.0,
+        "recall": round(hits / true_pairs, 4) if true_pairs else 1.0,
+    }
+
+
+def bench_lsh(headlines: List[Headline]) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        clusterer = StoryClusterer(os.path.join(tmp, "historias.sqlite3"))
+        predicted = []
+        start = time.perf_counter()
+        for fecha, outlet, url, title, _ in headlines:
+            cluster = clusterer.assign(
+                {"fecha": fecha, "medio": outlet, "url": url, "titular": title}
+            )
+            predicted.append(cluster)
+        elapsed = time.perf_counter() - start
+        clusterer.close()
+    return {
+        "headlines": len(headlines),
+        "elapsed_s": round(elapsed, 3),
+        "headlines_per_s": round(len(headlines) / elapsed, 1),
+        "stories": len(set(predicted)),
+        "cross_outlet": clusterer.cross_outlet,
+        **pair_scores(predicted, [headline[4] for headline in headlines]),
+    }
+
+
+def bench_brute_force(headlines: List[Headline]) -> Dict[str, Any]:
+    """Jaccard exacto de cada titular contra todos los anteriores."""
+    sets = []
+    clusters: List[int] = []
+    start = time.perf_counter()
+    for _, _, _, title, _ in headlines:
+        pieces = shingles(title)
+        best, best_score = None, CLUSTER_THRESHOLD
+        for i, other in enumerate(sets):
+            union = len(pieces | other)
+            score = len(pieces & other) / union if union else 0.0
+            if score >= best_score:
+                best, best_score = i, score
+        clusters.append(clusters[best] if best is not None else len(sets))
+        sets.append(pieces)
+    elapsed = time.perf_counter() - start
+    return {
+        "headlines": len(headlines),
+        "elapsed_s": round(elapsed, 3),
+        "headlines_per_s": round(len(headlines) / elapsed, 1),
+        "stories": len(set(clusters)),
+        **pair_scores(clusters, [headline[4] for headline in headlines]),
+    }
+
+
+def run(
+    days: int, events_per_day: int, own_per_day: int, brute_days: int
+) -> Dict[str, Any]:
+    headlines = synthetic_headlines(days, events_per_day, own_per_day)
+    first_days = {headline[0] for headline in headlines}
+    first_days = set(sorted(first_days)[:brute_days])
+    sample = [headline for headline in headlines if headline[0] in first_days]
+    results = {"lsh_year": bench_lsh(headlines)}
+    if brute_days:
+        results["lsh_sample"] = bench_lsh(sample)
+        results["brute_force_sample"] = bench_brute_force(sample)
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "days": days,
+        "brute_days": brute_days,
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"  {'benchmark':<22}{'titulares':>10}{'seg':>9}{'tit/s':>10}"
+        f"{'historias':>10}{'precisión':>11}{'exhaust.':>10}"
+    )
+    for bench, stats in report["results"].items():
+        print(
+            f"  {bench:<22}{stats['headlines']:>10}{stats['elapsed_s']:>9.2f}"
+            f"{stats['headlines_per_s']:>10.0f}{stats['stories']:>10}"
+            f"{stats['precision']:>11.3f}{stats['recall']:>10.3f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.clustering")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS)
+    parser.add_argument("--events-per-day", type=int, default=DEFAULT_EVENTS_PER_DAY)
+    parser.add_argument("--own-per-day", type=int, default=DEFAULT_OWN_PER_DAY)
+    parser.add_argument(
+        "--brute-days",
+        type=int,
+        default=DEFAULT_BRUTE_DAYS,
+        help="Días iniciales comparados con la búsqueda exhaustiva (0 = ninguno)",
+    )
+    parser.add_argument("--save", metavar="JSON", help="Guarda los resultados")
+    args = parser.parse_args(argv)
+
+    report = run(args.days, args.events_per_day, args.own_per_day, args.brute_days)
+    print_report(report)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
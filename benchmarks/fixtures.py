@@ -0,0 +1,66 @@
+"""Portadas grabadas para ejecutar los scrapers sin red.
+
+Los HTML de `fixtures/` reproducen el marcado que busca cada scraper (todas
+sus zonas) con relleno de anuncios y scripts como en la portada real.
+"""
+
+import io
+import os
+from typing import Dict, Type
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from news_scraper.scrapers.base import NewsScraper
+from news_scraper.scrapers.cerodosdostres import CerodosdostresScraper
+from news_scraper.scrapers.lacapital import LaCapitalScraper
+from news_scraper.scrapers.quedigital import QueDigitalScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# fixture -> scraper que la consume
+FIXTURES: Dict[str, Type[NewsScraper]] = {
+    "quedigital": QueDigitalScraper,
+    "cerodosdostres": CerodosdostresScraper,
+    "lacapital": LaCapitalScraper,
+}
+
+
+def load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, f"{name}.html"), "rb") as file:
+        return file.read()
+
+
+class FixtureAdapter(HTTPAdapter):
+    """Adaptador de requests que sirve una portada grabada para cualquier URL
+    del host del scraper y 404 para el resto."""
+
+    def __init__(self, host: str, content: bytes):
+        super().__init__()
+        self.host = host
+        self.content = content
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        parsed = urlparse(request.url)
+        if parsed.netloc == self.host and parsed.path != "/robots.txt":
+            response.status_code = 200
+            response.headers["Content-Type"] = "text/html; charset=utf-8"
+            response.encoding = "utf-8"
+            response.raw = io.BytesIO(self.content)
+        else:
+            response.status_code = 404
+            response.raw = io.BytesIO(b"")
+        return response
+
+
+def offline_scraper(name: str, **kwargs) -> NewsScraper:
+    """Instancia el scraper de la fixture con la red sustituida por la grabación."""
+    scraper = FIXTURES[name](**kwargs)
+    adapter = FixtureAdapter(urlparse(scraper.url).netloc, load_fixture(name))
+    scraper.session.mount("https://", adapter)
+    scraper.session.mount("http://", adapter)
+    return scraper
@@ -0,0 +1,158 @@
+"""Benchmark de extracción sobre las portadas grabadas.
+
+Uso:
+    python -m benchmarks.run                          # imprime resultados
+    python -m benchmarks.run --save baseline.json     # guarda la línea base
+    python -m benchmarks.run --compare baseline.json  # marca regresiones
+
+Para cada medio mide la construcción del árbol (equivalente a _get_soup sin
+red), cada método _parse_* y el scrape() completo. Informa la mediana de
+`--repeat` ejecuciones y el pico de memoria (tracemalloc, en una pasada aparte
+para no contaminar los tiempos).
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.fixtures import FIXTURES, load_fixture, offline_scraper
+
+DEFAULT_REPEAT = 20
+DEFAULT_THRESHOLD = 0.2  # 20% más lento que la línea base = regresión
+
+
+def _median_time(func: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    func()  # calentamiento
+    for _ in range(repeat):
+        # Los árboles de BeautifulSoup tienen ciclos: recogerlos fuera de la
+        # muestra evita que una recolección caiga dentro de la medición
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_outlet(name: str, repeat: int) -> Dict[str, Dict[str, Any]]:
+    """Devuelve {benchmark: {median_s, peak_kb, rows}} para un medio."""
+    logger = logging.getLogger("benchmark")
+    html = load_fixture(name).decode("utf-8")
+    scraper = offline_scraper(name, logger=logger)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def record(bench: str, func: Callable[[], Any], rows: Optional[int] = None):
+        results[bench] = {
+            "median_s": _median_time(func, repeat),
+            "peak_kb": round(_peak_memory(func) / 1024, 1),
+        }
+        if rows is not None:
+            results[bench]["rows"] = rows
+
+    record("soup", lambda: scraper._make_soup(html))
+
+    # Los métodos de zona se miden sobre un árbol ya construido
+    soup = scraper._make_soup(html)
+    for method in scraper._get_parsing_methods():
+        record(method.__name__, lambda: method(soup), len(method(soup)))
+
+    record("scrape", scraper.scrape, len(scraper.scrape()))
+    scraper.close()
+    return results
+
+
+def run(names: List[str], repeat: int) -> Dict[str, Any]:
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "results": {name: bench_outlet(name, repeat) for name in names},
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Lista de regresiones de tiempo (> threshold) y de cambios en filas extraídas."""
+    problems = []
+    for name, benches in current["results"].items():
+        for bench, stats in benches.items():
+            base = baseline.get("results", {}).get(name, {}).get(bench)
+            if not base:
+                continue
+            ratio = stats["median_s"] / base["median_s"] if base["median_s"] else 1.0
+            if ratio > 1 + threshold:
+                problems.append(
+                    f"{name}.{bench}: {base['median_s'] * 1000:.2f} ms -> "
+                    f"{stats['median_s'] * 1000:.2f} ms ({ratio - 1:+.0%})"
+                )
+            if "rows" in base and stats.get("rows") != base["rows"]:
+                problems.append(
+                    f"{name}.{bench}: filas {base['rows']} -> {stats.get('rows')}"
+                )
+    return problems
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    for name, benches in report["results"].items():
+        print(f"\n{name}")
+        print(f"  {'benchmark':<38}{'mediana ms':>12}{'pico KB':>10}{'filas':>7}")
+        for bench, stats in benches.items():
+            print(
+                f"  {bench:<38}{stats['median_s'] * 1000:>12.3f}"
+                f"{stats['peak_kb']:>10.1f}{stats.get('rows', ''):>7}"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.run")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--only", help="Fixtures a medir, separadas por comas", default=""
+    )
+    parser.add_argument("--save", metavar="JSON", help="Guarda los resultados")
+    parser.add_argument("--compare", metavar="JSON", help="Línea base a comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    names = [n for n in args.only.split(",") if n] or list(FIXTURES)
+    report = run(names, args.repeat)
+    print_report(report)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        problems = compare(report, baseline, args.threshold)
+        if problems:
+            print(f"\n⚠️  {len(problems)} regresiones respecto a {args.compare}:")
+            for problem in problems:
+                print(f"  - {problem}")
+            return 1
+        print(f"\n✅ Sin regresiones respecto a {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,1297 @@
-from news_scraper.scrapers.lacapital import LaCapitalScraper
-from news_scraper.utils.csv_writer import CSVWriter
+import argparse
+import csv
+import glob
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from news_scraper.fetcher import FetchScheduler
+from news_scraper.importer import BulkImporter
+from news_scraper.pipeline import Pipeline, observer
+from news_scraper.runner import run_scraper
+from news_scraper.scheduler import AdaptiveInterval, Scheduler, SchedulerState
+from news_scraper.scrapers.registry import registry
+from news_scraper.utils.clustering import ClusterWriter, StoryClusterer
+from news_scraper.utils.csv_writer import CSVWriter, MultiWriter
+from news_scraper.utils.budget import RunBudget
+from news_scraper.utils.dedup import Deduplicator
 from news_scraper.utils.log_writer import LogWriter
-from news_scraper.utils.constants import CSV_FILENAME, LOG_FILENAME
-from news_scraper.scrapers.quedigital import QueDigitalScraper
-from news_scraper.scrapers.cerodosdostres import CerodosdostresScraper
+from news_scraper.utils.profiling import ScraperProfiler
+from news_scraper.utils.rate_limit import rate_limiter
+from news_scraper.utils.search_index import IndexWriter, SearchIndex
+from news_scraper.utils.seen_index import NewOnlyWriter, SeenIndex
+from news_scraper.utils.snapshots import EventWriter, SnapshotDiffer
+from news_scraper.utils.term_counts import TermCounts, TermCountWriter
+from news_scraper.utils.versions import VersionTracker, VersionWriter
+from news_scraper.utils.resilience import CircuitBreakers, RetryPolicy
+from news_scraper.warc_ingest import WarcIngest
+from news_scraper.utils.timing import StageTimings
+from news_scraper.utils.constants import (
+    ARCHIVE_PATTERN,
+    BREAKER_COOLDOWN,
+    CIRCUIT_STATE_FILENAME,
+    CSV_FILENAME,
+    CSV_HEADERS,
+    DEFAULT_CONNECTIONS_PER_HOST,
+    DEFAULT_CRAWL_DEPTH,
+    DEFAULT_HOST_BURST,
+    DEFAULT_HOST_RATE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_PIPELINE_ENRICH_WORKERS,
+    DEFAULT_PIPELINE_FETCH_WORKERS,
+    DEFAULT_PIPELINE_PARSE_WORKERS,
+    DEFAULT_PIPELINE_QUEUE_SIZE,
+    DEFAULT_POLL_JITTER,
+    IMPORT_STORES,
+    LOG_FILENAME,
+    PIPELINE_METRICS_FILENAME,
+    RETRY_ATTEMPTS,
+    SCHEDULER_STATE_FILENAME,
+    SEARCH_DB_FILENAME,
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_HEADERS,
+    TERM_SERIES_HEADERS,
+    TERMS_DB_FILENAME,
+    TIMINGS_FILENAME,
+    get_monthly_filename,
+)
+
+# Opciones globales de la ejecución diaria (destinos de argparse)
+_GLOBAL_OPTIONS = (
+    "timings",
+    "profile",
+    "profile_top",
+    "max_memory_mb",
+    "only",
+    "exclude",
+    "crawl_depth",
+    "per_host",
+    "rate",
+    "burst",
+    "retries",
+    "breaker_cooldown",
+    "deadline",
+    "dedup",
+    "new_only",
+    "diff",
+    "versions",
+    "index",
+    "terms",
+    "clusters",
+)
+
+# Opciones globales que un subcomando no puede aplicar: el servicio no tiene
+# un plazo total ni un único proceso que perfilar, el pipeline mide sus etapas
+# y reparte las descargas con sus propias opciones, warc no descarga nada y
+# los subcomandos sobre el archivo no ejecutan scrapers
+_DAILY_RUN_OPTIONS = {
+    "serve": ("deadline", "profile", "profile_top", "max_memory_mb"),
+    "pipeline": (
+        "deadline",
+        "timings",
+        "profile",
+        "profile_top",
+        "per_host",
+        "max_memory_mb",
+    ),
+    "warc": tuple(
+        dest for dest in _GLOBAL_OPTIONS if dest not in ("dedup", "only", "exclude")
+    ),
+    "import": _GLOBAL_OPTIONS,
+    "search": _GLOBAL_OPTIONS,
+    "terms": _GLOBAL_OPTIONS,
+    "stats": _GLOBAL_OPTIONS,
+}
+
+
+def main(
+    timings: bool = False,
+    profile: bool = False,
+    profile_top: int = 20,
+    max_memory_mb: Optional[float] = None,
+    only: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    crawl_depth: int = DEFAULT_CRAWL_DEPTH,
+    per_host: int = DEFAULT_CONNECTIONS_PER_HOST,
+    rate: float = DEFAULT_HOST_RATE,
+    burst: int = DEFAULT_HOST_BURST,
+    retries: int = RETRY_ATTEMPTS,
+    breaker_cooldown: float = BREAKER_COOLDOWN,
+    deadline: Optional[float] = None,
+    dedup: bool = False,
+    new_only: bool = False,
+    diff: bool = False,
+    versions: bool = False,
+    clusters: bool = False,
+    index: bool = False,
+    terms: bool = False,
+):
+    """Ejecución diaria de todos los medios seleccionados.
+
+    Con `deadline` (segundos), el tiempo se reparte entre los medios y los que
+    se pasan de su parte se cortan escribiendo lo ya extraído, de modo que la
+    ejecución termina antes del timeout de Lambda.
+
+    Con `new_only`, solo se escriben las URLs que nunca aparecieron en
+    ejecuciones anteriores; las repetidas actualizan su last_seen. Con `diff`,
+    se escriben los cambios de cada portada respecto de la ejecución anterior,
+    y con `versions` las ediciones de titular o sección como filas versionadas.
+    Con `clusters`, cada noticia nueva se asigna a una historia compartida con
+    las de otros medios que cuentan lo mismo; con `index` los titulares se
+    añaden al índice de búsqueda y con `terms` a los contadores de términos.
+    """
+    # Solo se importan los scrapers seleccionados (útil para repartir medios
+    # entre invocaciones de Lambda)
+    scrapers = registry.load_selected(only, exclude)
+
+    log_writer = LogWriter(LOG_FILENAME)
+    logger = log_writer.get_logger()
+    # Un único planificador de descargas para todos los medios
+    fetcher = FetchScheduler(per_host=per_host)
+    rate_limiter.configure(rate, burst)
+    # El circuito de cada medio sobrevive entre ejecuciones diarias
+    breakers = CircuitBreakers(CIRCUIT_STATE_FILENAME, cooldown=breaker_cooldown)
+    breakers.load()
+    seen_index = SeenIndex() if new_only else None
+    version_tracker = VersionTracker() if versions else None
+    clusterer = StoryClusterer() if clusters else None
+    search_index = SearchIndex() if index else None
+    term_counts = TermCounts() if terms else None
+
+    try:
+        logger.info("🚀 Inicio del scraping diario")
+
+        writer = CSVWriter(CSV_FILENAME, CSV_HEADERS, index=True)
+        writer.write_headers()
+        output = _make_output(
+            writer,
+            seen_index,
+            version_tracker,
+            clusterer,
+            search_index,
+            term_counts,
+        )
+        differ = _make_differ(logger) if diff else None
+
+        # Con la instrumentación desactivada, cada etapa cuesta una llamada vacía
+        stage_timings = StageTimings(enabled=timings)
+        profiler = (
+            ScraperProfiler.next_to_log(LOG_FILENAME, profile_top) if profile else None
+        )
+
+        run_budget = RunBudget(deadline) if deadline else None
+        truncated: Dict[str, str] = {}
+        for i, scraper_class in enumerate(scrapers):
+            budget = None
+            if run_budget:
+                budget = run_budget.for_outlet(len(scrapers) - i)
+                if budget is None:
+                    truncated[scraper_class.__name__] = "omitido"
+                    continue
+            reason = run_scraper(
+                scraper_class,
+                logger,
+                output,
+                stage_timings,
+                profiler,
+                max_memory_mb=max_memory_mb,
+                crawl_depth=crawl_depth,
+                fetcher=fetcher,
+                retry=RetryPolicy(retries),
+                breakers=breakers,
+                budget=budget,
+                dedup=dedup,
+                differ=differ,
+            )
+            if reason:
+                truncated[scraper_class.__name__] = reason
+        breakers.save()
+
+        if truncated:
+            logger.warning(
+                "Medios truncados por el plazo o el techo de memoria: "
+                + ", ".join(f"{name} ({reason})" for name, reason in truncated.items()),
+                extra={"truncated": truncated},
+            )
+
+        stage_timings.log_summary(logger)
+        rate_limiter.log_summary(logger)
+        _log_seen_summary(logger, seen_index)
+        _log_versions_summary(logger, version_tracker)
+        _log_clusters_summary(logger, clusterer)
+        stage_timings.write_json(TIMINGS_FILENAME)
+        if profiler:
+            profiler.write_summary(logger)
+
+        logger.info("✅ Fin del scraping diario")
+    finally:
+        if seen_index:
+            seen_index.close()
+        if version_tracker:
+            version_tracker.close()
+        if clusterer:
+            clusterer.close()
+        if search_index:
+            search_index.close()
+        if term_counts:
+            term_counts.close()
+        fetcher.close()
+        log_writer.close()
+
+
+def run_pipeline(
+    fetch_workers: int = DEFAULT_PIPELINE_FETCH_WORKERS,
+    parse_workers: int = DEFAULT_PIPELINE_PARSE_WORKERS,
+    parse_processes: bool = False,
+    queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE,
+    enrich_workers: int = DEFAULT_PIPELINE_ENRICH_WORKERS,
+    only: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    crawl_depth: int = DEFAULT_CRAWL_DEPTH,
+    rate: float = DEFAULT_HOST_RATE,
+    burst: int = DEFAULT_HOST_BURST,
+    retries: int = RETRY_ATTEMPTS,
+    breaker_cooldown: float = BREAKER_COOLDOWN,
+    dedup: bool = False,
+    new_only: bool = False,
+    diff: bool = False,
+    versions: bool = False,
+    clusters: bool = False,
+    index: bool = False,
+    terms: bool = False,
+):
+    """Ejecución diaria por etapas (descarga → parseo → enriquecimiento → CSV).
+
+    Versiones, historias, índice y contadores de términos se calculan en la
+    etapa de enriquecimiento, con `enrich_workers` hilos, sobre todas las filas.
+    """
+    scraper_classes = registry.load_selected(only, exclude)
 
+    log_writer = LogWriter(LOG_FILENAME)
+    logger = log_writer.get_logger()
+    rate_limiter.configure(rate, burst)
+    breakers = CircuitBreakers(CIRCUIT_STATE_FILENAME, cooldown=breaker_cooldown)
+    breakers.load()
+
+    seen_index = SeenIndex() if new_only else None
+    version_tracker = VersionTracker() if versions else None
+    clusterer = StoryClusterer() if clusters else None
+    search_index = SearchIndex() if index else None
+    term_counts = TermCounts() if terms else None
 
-def run_scraper(scraper_class, logger, writer):
+    scrapers = [scraper_class(logger=logger) for scraper_class in scraper_classes]
     try:
-        scraper = scraper_class(logger=logger)
-        logger.info(f"Iniciando scraping de {scraper.name}")
-        titulares = scraper.scrape()
+        logger.info("🚀 Inicio del scraping diario (pipeline)")
+
+        writer = CSVWriter(CSV_FILENAME, CSV_HEADERS, index=True)
+        writer.write_headers()
+
+        for scraper in scrapers:
+            scraper.max_pages = crawl_depth
+            scraper.retry = RetryPolicy(retries)
+            scraper.breaker = breakers.get(scraper.name)
+
+        output = _make_output(writer, seen_index, None)
+        enrichers = [
+            observer(store_writer)
+            for store_writer in _store_writers(
+                version_tracker, clusterer, search_index, term_counts
+            )
+        ]
+        deduplicator = Deduplicator(output) if dedup else None
+        # El comparador recibe todas las filas, antes de --new-only
+        differ = _make_differ(logger) if diff else None
+        pipeline = Pipeline(
+            [scraper for scraper in scrapers if not scraper.breaker.is_open()],
+            [deduplicator or output] + ([differ] if differ else []),
+            logger,
+            fetch_workers=fetch_workers,
+            parse_workers=parse_workers,
+            parse_processes=parse_processes,
+            enrich_workers=enrich_workers,
+            enrichers=enrichers,
+            queue_size=queue_size,
+        )
+        rows = pipeline.run()
+        breakers.save()
+        if deduplicator:
+            deduplicator.flush()
+            logger.info(
+                f"{deduplicator.duplicates} titulares repetidos fusionados",
+                extra={"count": deduplicator.duplicates},
+            )
+        if differ:
+            differ.flush(skip=pipeline.partial)
 
-        if not titulares:
-            logger.warning(f"No se obtuvieron titulares de {scraper.name}")
-            return
+        for name, count in rows.items():
+            logger.info(
+                f"Obtenidos {count} titulares de {name}",
+                extra={"outlet": name, "count": count},
+            )
+        pipeline.log_summary()
+        pipeline.write_json(PIPELINE_METRICS_FILENAME)
+        rate_limiter.log_summary(logger)
+        _log_seen_summary(logger, seen_index)
+        _log_versions_summary(logger, version_tracker)
+        _log_clusters_summary(logger, clusterer)
 
-        logger.info(f"Obtenidos {len(titulares)} titulares de {scraper.name}")
+        logger.info("✅ Fin del scraping diario")
+    finally:
+        for scraper in scrapers:
+            scraper.close()
+        if seen_index:
+            seen_index.close()
+        if version_tracker:
+            version_tracker.close()
+        if clusterer:
+            clusterer.close()
+        if search_index:
+            search_index.close()
+        if term_counts:
+            term_counts.close()
+        log_writer.close()
 
-        for titular in titulares:
-            try:
-                writer.append_data(titular)
-                logger.debug(f"[{scraper.name}] Escrito: {titular['titular']}")
-            except Exception as e:
-                logger.error(f"[{scraper.name}] Error al escribir en CSV: {e}")
 
-    except Exception as e:
-        logger.error(f"[{scraper_class.__name__}] Falló el scraping: {e}")
+def serve(
+    interval: Optional[float] = None,
+    jitter: float = DEFAULT_POLL_JITTER,
+    outlet_intervals: Optional[Dict[str, float]] = None,
+    adaptive: bool = False,
+    min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    state_file: str = SCHEDULER_STATE_FILENAME,
+    only: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    timings: bool = False,
+    crawl_depth: int = DEFAULT_CRAWL_DEPTH,
+    per_host: int = DEFAULT_CONNECTIONS_PER_HOST,
+    rate: float = DEFAULT_HOST_RATE,
+    burst: int = DEFAULT_HOST_BURST,
+    retries: int = RETRY_ATTEMPTS,
+    breaker_cooldown: float = BREAKER_COOLDOWN,
+    dedup: bool = False,
+    new_only: bool = False,
+    diff: bool = False,
+    versions: bool = False,
+    clusters: bool = False,
+    index: bool = False,
+    terms: bool = False,
+):
+    """Modo servicio: sondea los medios de forma continua hasta SIGTERM/SIGINT.
 
+    `outlet_intervals` va por nombre de registro (p. ej. "lacapital").
+    """
+    names = registry.select(only, exclude)
+    scrapers = [registry.load(name) for name in names]
+    scraper_intervals = {
+        registry.load(name): seconds
+        for name, seconds in (outlet_intervals or {}).items()
+        if name in names
+    }
 
-def main():
     log_writer = LogWriter(LOG_FILENAME)
     logger = log_writer.get_logger()
+    fetcher = FetchScheduler(per_host=per_host)
+    stage_timings = StageTimings(enabled=timings)
+    rate_limiter.configure(rate, burst)
+    seen_index = SeenIndex() if new_only else None
+    version_tracker = VersionTracker() if versions else None
+    clusterer = StoryClusterer() if clusters else None
+    search_index = SearchIndex() if index else None
+    term_counts = TermCounts() if terms else None
+
+    state = None
+    adaptive_interval = None
+    if adaptive:
+        adaptive_interval = AdaptiveInterval(min_interval, max_interval)
+        state = SchedulerState(state_file)
+        state.load()
+
+    scheduler = Scheduler(
+        scrapers,
+        logger,
+        interval=interval,
+        jitter=jitter,
+        outlet_intervals=scraper_intervals,
+        adaptive=adaptive_interval,
+        state=state,
+        breakers=CircuitBreakers(cooldown=breaker_cooldown),
+        crawl_depth=crawl_depth,
+        retry=RetryPolicy(retries),
+        fetcher=fetcher,
+        timings=stage_timings,
+        dedup=dedup,
+        seen=seen_index,
+        differ=_make_differ(logger) if diff else None,
+        versions=VersionWriter(version_tracker) if version_tracker else None,
+        clusters=ClusterWriter(clusterer) if clusterer else None,
+        index=IndexWriter(search_index) if search_index else None,
+        terms=TermCountWriter(term_counts) if term_counts else None,
+    )
+
+    def handle_signal(signum, frame):
+        logger.info(f"Recibida señal {signal.Signals(signum).name}")
+        scheduler.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    try:
+        scheduler.run()
+    finally:
+        stage_timings.log_summary(logger)
+        stage_timings.write_json(get_monthly_filename("tiempos.jsonl"))
+        rate_limiter.log_summary(logger)
+        _log_seen_summary(logger, seen_index)
+        _log_versions_summary(logger, version_tracker)
+        _log_clusters_summary(logger, clusterer)
+        if seen_index:
+            seen_index.close()
+        if version_tracker:
+            version_tracker.close()
+        if clusterer:
+            clusterer.close()
+        if search_index:
+            search_index.close()
+        if term_counts:
+            term_counts.close()
+        fetcher.close()
+        log_writer.close()
+
+
+def search(
+    query: str,
+    date_from: str = "",
+    date_to: str = "",
+    medios: Optional[List[str]] = None,
+    limit: int = SEARCH_DEFAULT_LIMIT,
+    index_file: str = SEARCH_DB_FILENAME,
+):
+    """Busca titulares en el índice y los escribe como CSV en la salida estándar."""
+    search_index = SearchIndex(index_file)
+    try:
+        started = time.perf_counter()
+        total, rows = search_index.search(
+            query, date_from, date_to, medios, limit=limit or None
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        search_index.close()
+
+    writer = csv.DictWriter(sys.stdout, fieldnames=SEARCH_HEADERS)
+    writer.writeheader()
+    writer.writerows(rows)
+    print(
+        f"{total} titulares ({len(rows)} mostrados) en {elapsed * 1000:.1f} ms",
+        file=sys.stderr,
+    )
+
+
+def term_series(
+    terms: List[str],
+    date_from: str = "",
+    date_to: str = "",
+    medios: Optional[List[str]] = None,
+    by_month: bool = False,
+    counts_file: str = TERMS_DB_FILENAME,
+):
+    """Series temporales de términos como CSV en la salida estándar."""
+    counts = TermCounts(counts_file)
+    try:
+        started = time.perf_counter()
+        rows = [
+            row
+            for term in terms
+            for row in counts.series(term, date_from, date_to, medios, by_month)
+        ]
+        elapsed = time.perf_counter() - started
+    finally:
+        counts.close()
+
+    writer = csv.DictWriter(sys.stdout, fieldnames=TERM_SERIES_HEADERS)
+    writer.writeheader()
+    writer.writerows(rows)
+    print(f"{len(rows)} puntos en {elapsed * 1000:.1f} ms", file=sys.stderr)
+
 
-    logger.info("🚀 Inicio del scraping diario")
+def stats(
+    report: str,
+    topic: str = "",
+    top: int = 10,
+    date_from: str = "",
+    date_to: str = "",
+    medios: Optional[List[str]] = None,
+):
+    """Informe de cobertura sobre el archivo de CSV mensuales, como CSV en la
+    salida estándar."""
+    # NumPy solo hace falta para los informes, no para el scraping (Lambda)
+    from news_scraper.stats import CoverageStats
 
-    headers = ["fecha", "medio", "titular", "zona_portada", "seccion", "url"]
-    writer = CSVWriter(CSV_FILENAME, headers)
-    writer.write_headers()
+    started = time.perf_counter()
+    coverage = CoverageStats().load()
+    loaded = time.perf_counter()
+    if report == "secciones":
+        rows = coverage.section_shares(date_from, date_to, medios)
+    elif report == "permanencia":
+        rows = coverage.dwell_times(date_from, date_to, medios)
+    else:
+        rows = coverage.top_zones(topic, top, date_from, date_to, medios)
+    elapsed = time.perf_counter() - loaded
 
-    # Lista de scrapers a ejecutar
-    scrapers = [QueDigitalScraper, CerodosdostresScraper, LaCapitalScraper]
+    if rows:
+        writer = csv.DictWriter(sys.stdout, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    print(
+        f"{len(coverage.columns)} titulares ({coverage.parsed_rows} leídos del CSV, "
+        f"{coverage.cached_rows} de caché) cargados en {loaded - started:.2f} s; "
+        f"informe en {elapsed * 1000:.1f} ms",
+        file=sys.stderr,
+    )
+    if coverage.invalid_rows:
+        print(
+            f"{coverage.invalid_rows} filas descartadas por fecha no válida",
+            file=sys.stderr,
+        )
 
-    for scraper_class in scrapers:
-        run_scraper(scraper_class, logger, writer)
 
-    logger.info("✅ Fin del scraping diario")
+def import_archives(
+    patterns: List[str],
+    stores: List[str],
+    workers: Optional[int] = None,
+    index_file: str = SEARCH_DB_FILENAME,
+    counts_file: str = TERMS_DB_FILENAME,
+):
+    """Importa CSV históricos a los almacenes indexados e informa filas/s."""
+    filenames = sorted({name for pattern in patterns for name in glob.glob(pattern)})
+    if not filenames:
+        print("No hay archivos que importar", file=sys.stderr)
+        return
+
+    importer = BulkImporter(stores, workers, index_file, counts_file)
+    started = time.perf_counter()
+    total = 0
+    try:
+        for imported in importer.run(filenames):
+            if imported.error:
+                print(f"⚠️ {imported.filename}: {imported.error}", file=sys.stderr)
+                continue
+            total += imported.imported_rows
+            print(
+                f"{imported.filename}: {imported.imported_rows} filas "
+                f"({imported.rejected} descartadas), {imported.added} nuevas en el "
+                f"índice, {imported.counted} contadas, {imported.cached_rows} en "
+                f"caché, {imported.indexed_rows} en el índice lateral; "
+                f"lectura {imported.read_s:.2f} s, carga {imported.load_s:.2f} s",
+                file=sys.stderr,
+            )
+    finally:
+        importer.close()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{total} filas de {len(filenames)} archivos en {elapsed:.1f} s "
+        f"({total / elapsed:.0f} filas/s)",
+        file=sys.stderr,
+    )
+
+
+def _make_output(
+    writer: CSVWriter,
+    seen_index: Optional[SeenIndex],
+    version_tracker: Optional[VersionTracker],
+    clusterer: Optional[StoryClusterer] = None,
+    search_index: Optional[SearchIndex] = None,
+    term_counts: Optional[TermCounts] = None,
+):
+    """Writer de salida según --new-only, --versions, --clusters, --index y
+    --terms."""
+    output = NewOnlyWriter(writer, seen_index) if seen_index else writer
+    # Versiones e historias se calculan sobre todas las filas, no solo las nuevas
+    extra_writers = _store_writers(
+        version_tracker, clusterer, search_index, term_counts
+    )
+    if extra_writers:
+        output = MultiWriter(output, *extra_writers)
+    return output
+
+
+def _store_writers(
+    version_tracker: Optional[VersionTracker],
+    clusterer: Optional[StoryClusterer],
+    search_index: Optional[SearchIndex],
+    term_counts: Optional[TermCounts],
+) -> List[Any]:
+    """Writers de los almacenes activos (--versions, --clusters, --index, --terms)."""
+    writers: List[Any] = []
+    if version_tracker:
+        writers.append(VersionWriter(version_tracker))
+    if clusterer:
+        writers.append(ClusterWriter(clusterer))
+    if search_index:
+        writers.append(IndexWriter(search_index))
+    if term_counts:
+        writers.append(TermCountWriter(term_counts))
+    return writers
+
+
+def _make_differ(logger) -> SnapshotDiffer:
+    """Comparador de portadas que escribe en el CSV mensual de eventos."""
+    differ = SnapshotDiffer(EventWriter(), logger=logger)
+    differ.load()
+    return differ
+
+
+def _log_seen_summary(logger, seen_index: Optional[SeenIndex]) -> None:
+    if seen_index:
+        logger.info(
+            f"Titulares nuevos: {seen_index.new}, ya vistos: {seen_index.repeated}",
+            extra={"count": seen_index.new},
+        )
+
+
+def _log_versions_summary(logger, version_tracker: Optional[VersionTracker]) -> None:
+    if version_tracker:
+        logger.info(
+            f"Titulares editados: {version_tracker.edits}",
+            extra={"count": version_tracker.edits},
+        )
+
+
+def _log_clusters_summary(logger, clusterer: Optional[StoryClusterer]) -> None:
+    if clusterer:
+        logger.info(
+            f"Historias nuevas: {clusterer.new_stories}, noticias unidas a una "
+            f"historia: {clusterer.joined} ({clusterer.cross_outlet} de otro medio)",
+            extra={"count": clusterer.new_stories, "joined": clusterer.joined},
+        )
+
+
+def _parse_outlet_intervals(values: List[str]) -> Dict[str, float]:
+    intervals = {}
+    for value in values:
+        name, sep, seconds = value.rpartition("=")
+        if not sep or not name:
+            raise argparse.ArgumentTypeError(
+                f"Formato inválido '{value}', se esperaba MEDIO=SEGUNDOS"
+            )
+        name = name.lower()
+        if name not in registry.names():
+            raise argparse.ArgumentTypeError(
+                f"Medio desconocido '{name}' en --outlet-interval. "
+                f"Disponibles: {', '.join(registry.names())}"
+            )
+        try:
+            intervals[name] = float(seconds)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"Intervalo inválido en '{value}', SEGUNDOS debe ser un número"
+            )
+    return intervals
+
+
+def ingest_warc(
+    patterns: List[str],
+    workers: Optional[int] = None,
+    all_captures: bool = False,
+    dedup: bool = False,
+    only: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+):
+    """Extrae los titulares de las portadas archivadas en ficheros WARC y los
+    escribe en el CSV mensual de la fecha de cada captura."""
+    filenames = sorted({name for pattern in patterns for name in glob.glob(pattern)})
+    if not filenames:
+        print("No hay ficheros WARC que leer", file=sys.stderr)
+        return
+
+    ingest = WarcIngest(registry.load_selected(only, exclude), workers, all_captures)
+    writers: Dict[str, CSVWriter] = {}
+    started = time.perf_counter()
+    rows = 0
+    for capture, headlines in ingest.run(filenames):
+        if capture.error:
+            print(
+                f"⚠️ {capture.uri} ({capture.captured_at:%Y-%m-%d %H:%M}): "
+                f"{capture.error}",
+                file=sys.stderr,
+            )
+            continue
+        filename = get_monthly_filename(
+            "titulares.csv", datetime.fromisoformat(capture.fecha)
+        )
+        writer = writers.get(filename)
+        if writer is None:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            writer = writers[filename] = CSVWriter(filename, CSV_HEADERS, index=True)
+            writer.write_headers()
+        if dedup:
+            deduplicator = Deduplicator()
+            for headline in headlines:
+                deduplicator.append_data(headline)
+            headlines = deduplicator.flush()
+        for headline in headlines:
+            writer.append_data(headline)
+        rows += len(headlines)
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"{ingest.captures_found} portadas de {ingest.records} registros en "
+        f"{len(filenames)} ficheros ({ingest.repeated} del mismo día omitidas, "
+        f"{ingest.invalid} no válidas): {rows} titulares en {len(writers)} CSV "
+        f"mensuales en {elapsed:.1f} s "
+        f"({ingest.captures_found / elapsed:.1f} portadas/s)",
+        file=sys.stderr,
+    )
+
+
+def _split_names(value: str) -> List[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def _date_option(value: str) -> str:
+    """Fecha de --from/--to: AAAA-MM o AAAA-MM-DD ("" = sin límite)."""
+    if not value:
+        return value
+    date_format = {7: "%Y-%m", 10: "%Y-%m-%d"}.get(len(value))
+    try:
+        if date_format:
+            datetime.strptime(value, date_format)
+            return value
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(
+        f"fecha no válida: '{value}' (AAAA-MM o AAAA-MM-DD)"
+    )
+
+
+def _split_stores(value: str) -> List[str]:
+    stores = _split_names(value)
+    unknown = [store for store in stores if store not in IMPORT_STORES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Almacén desconocido '{unknown[0]}'. "
+            f"Disponibles: {', '.join(IMPORT_STORES)}"
+        )
+    return stores
+
+
+def cli(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="news_scraper")
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Mide cada etapa (fetch, decode, parse, _parse_*, write) y guarda un resumen JSON",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Perfila cada scraper con cProfile y tracemalloc (informes junto al log)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Número de funciones y líneas de memoria en los informes de perfil",
+    )
+    parser.add_argument(
+        "--max-memory-mb",
+        type=float,
+        help="Techo de RSS: no se arranca un medio si el proceso ya lo supera, "
+        "y se corta entre zonas o listados si lo supera durante el scraping",
+    )
+    parser.add_argument(
+        "--only",
+        type=_split_names,
+        default=[],
+        metavar="MEDIOS",
+        help=f"Ejecuta solo estos medios, separados por comas ({', '.join(registry.names())})",
+    )
+    parser.add_argument(
+        "--exclude",
+        type=_split_names,
+        default=[],
+        metavar="MEDIOS",
+        help="Omite estos medios, separados por comas",
+    )
+    parser.add_argument(
+        "--crawl-depth",
+        type=int,
+        default=DEFAULT_CRAWL_DEPTH,
+        metavar="PÁGINAS",
+        help="Recorre también los listados de sección de cada medio hasta esta "
+        "página (0 = solo la portada)",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_CONNECTIONS_PER_HOST,
+        help="Descargas simultáneas máximas por host al recorrer listados",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_HOST_RATE,
+        help="Peticiones por segundo por host (0 = sin límite); "
+        "el Crawl-delay de robots.txt puede reducirlo",
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=DEFAULT_HOST_BURST,
+        help="Peticiones seguidas permitidas a un host antes de aplicar el ritmo",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=RETRY_ATTEMPTS,
+        help="Intentos por descarga ante errores pasajeros (red, timeout, 5xx)",
+    )
+    parser.add_argument(
+        "--breaker-cooldown",
+        type=float,
+        default=BREAKER_COOLDOWN,
+        help="Segundos que se omite un medio tras fallos repetidos",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SEGUNDOS",
+        help="Plazo total de la ejecución; los medios que se excedan se cortan "
+        "escribiendo lo ya extraído",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Normaliza las URLs y escribe una fila por noticia, con todas sus "
+        "zonas en zona_portada separadas por '|'",
+    )
+    parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help="Escribe solo las noticias que no aparecieron en ejecuciones "
+        "anteriores (índice en data/vistas.sqlite3)",
+    )
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="Escribe los cambios de cada portada (entra, sale, mueve, edita) "
+        "respecto de la anterior en el CSV de eventos",
+    )
+    parser.add_argument(
+        "--versions",
+        action="store_true",
+        help="Escribe una fila versionada en el CSV de versiones solo cuando "
+        "cambia el titular o la sección de una noticia",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Añade los titulares al índice de búsqueda (data/indice.sqlite3) "
+        "para el subcomando search",
+    )
+    parser.add_argument(
+        "--terms",
+        action="store_true",
+        help="Cuenta los términos de los titulares por día y medio "
+        "(data/terminos.sqlite3) para el subcomando terms",
+    )
+    parser.add_argument(
+        "--clusters",
+        action="store_true",
+        help="Agrupa los titulares parecidos de todos los medios en historias "
+        "(MinHash/LSH) y escribe cada noticia nueva en el CSV de historias",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Sondea los medios de forma continua"
+    )
+    serve_parser.add_argument(
+        "--interval",
+        type=float,
+        help="Segundos entre sondeos (por defecto, el POLL_INTERVAL de cada medio)",
+    )
+    serve_parser.add_argument(
+        "--jitter",
+        type=float,
+        default=DEFAULT_POLL_JITTER,
+        help="Fracción aleatoria aplicada a cada intervalo (0.1 = ±10%%)",
+    )
+    serve_parser.add_argument(
+        "--outlet-interval",
+        action="append",
+        default=[],
+        metavar="MEDIO=SEGUNDOS",
+        help="Intervalo específico para un medio por su nombre de registro "
+        "(p. ej. lacapital=300); repetible",
+    )
+    serve_parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Ajusta el intervalo de cada medio según la rotación de su portada",
+    )
+    serve_parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=DEFAULT_MIN_POLL_INTERVAL,
+        help="Intervalo mínimo en modo adaptativo (segundos)",
+    )
+    serve_parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=DEFAULT_MAX_POLL_INTERVAL,
+        help="Intervalo máximo en modo adaptativo (segundos)",
+    )
+    serve_parser.add_argument(
+        "--state-file",
+        default=SCHEDULER_STATE_FILENAME,
+        help="Fichero donde se persiste el estado aprendido",
+    )
+
+    pipeline_parser = subparsers.add_parser(
+        "pipeline",
+        help="Ejecución diaria por etapas con colas acotadas y métricas por etapa",
+    )
+    pipeline_parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=DEFAULT_PIPELINE_FETCH_WORKERS,
+        help="Descargas concurrentes",
+    )
+    pipeline_parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=DEFAULT_PIPELINE_PARSE_WORKERS,
+        help="Páginas parseadas en paralelo",
+    )
+    pipeline_parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Parsea en un pool de procesos en lugar de hilos",
+    )
+    pipeline_parser.add_argument(
+        "--enrich-workers",
+        type=int,
+        default=DEFAULT_PIPELINE_ENRICH_WORKERS,
+        help="Hilos que actualizan versiones, historias, índice y términos",
+    )
+    pipeline_parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_PIPELINE_QUEUE_SIZE,
+        help="Capacidad de cada cola entre etapas",
+    )
+
+    search_parser = subparsers.add_parser(
+        "search", help="Busca titulares en el índice (términos sin tildes, AND)"
+    )
+    search_parser.add_argument(
+        "query", help='Términos a buscar; "palabra*" busca por prefijo'
+    )
+    search_parser.add_argument(
+        "--from",
+        dest="date_from",
+        default="",
+        metavar="FECHA",
+        help="Desde este mes o día (AAAA-MM o AAAA-MM-DD)",
+    )
+    search_parser.add_argument(
+        "--to",
+        dest="date_to",
+        default="",
+        metavar="FECHA",
+        help="Hasta este mes o día, incluido (AAAA-MM o AAAA-MM-DD)",
+    )
+    search_parser.add_argument(
+        "--medio",
+        type=_split_names,
+        default=[],
+        metavar="MEDIOS",
+        help="Solo estos medios, separados por comas (p. ej. 0223)",
+    )
+    search_parser.add_argument(
+        "--limit",
+        type=int,
+        default=SEARCH_DEFAULT_LIMIT,
+        help="Máximo de titulares mostrados (0 = todos)",
+    )
+    search_parser.add_argument(
+        "--index-file",
+        default=SEARCH_DB_FILENAME,
+        help="Índice en el que buscar",
+    )
+
+    terms_parser = subparsers.add_parser(
+        "terms", help="Serie temporal de términos por día (o mes) y medio"
+    )
+    terms_parser.add_argument(
+        "term", nargs="+", help="Términos (una palabra cada uno, sin tildes)"
+    )
+    terms_parser.add_argument(
+        "--from",
+        dest="date_from",
+        default="",
+        metavar="FECHA",
+        help="Desde este mes o día (AAAA-MM o AAAA-MM-DD)",
+    )
+    terms_parser.add_argument(
+        "--to",
+        dest="date_to",
+        default="",
+        metavar="FECHA",
+        help="Hasta este mes o día, incluido (AAAA-MM o AAAA-MM-DD)",
+    )
+    terms_parser.add_argument(
+        "--medio",
+        type=_split_names,
+        default=[],
+        metavar="MEDIOS",
+        help="Solo estos medios, separados por comas",
+    )
+    terms_parser.add_argument(
+        "--by-month", action="store_true", help="Agrega la serie por mes"
+    )
+    terms_parser.add_argument(
+        "--counts-file",
+        default=TERMS_DB_FILENAME,
+        help="Contadores en los que consultar",
+    )
+
+    stats_parser = subparsers.add_parser(
+        "stats", help="Informes de cobertura sobre el archivo de CSV mensuales"
+    )
+    stats_parser.add_argument(
+        "report",
+        choices=["secciones", "permanencia", "zonas"],
+        help="secciones: proporción de cada sección por medio y día; "
+        "permanencia: días en portada de cada noticia; "
+        "zonas: zonas de portada donde aparece un tema",
+    )
+    stats_parser.add_argument(
+        "--tema", default="", help="Términos del tema (informe zonas)"
+    )
+    stats_parser.add_argument(
+        "--top", type=int, default=10, help="Zonas por medio (informe zonas)"
+    )
+    stats_parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=_date_option,
+        default="",
+        metavar="FECHA",
+        help="Desde este mes o día (AAAA-MM o AAAA-MM-DD)",
+    )
+    stats_parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=_date_option,
+        default="",
+        metavar="FECHA",
+        help="Hasta este mes o día, incluido (AAAA-MM o AAAA-MM-DD)",
+    )
+    stats_parser.add_argument(
+        "--medio",
+        type=_split_names,
+        default=[],
+        metavar="MEDIOS",
+        help="Solo estos medios, separados por comas",
+    )
+
+    import_parser = subparsers.add_parser(
+        "import", help="Importa CSV históricos a los almacenes indexados"
+    )
+    import_parser.add_argument(
+        "files",
+        nargs="*",
+        default=[ARCHIVE_PATTERN],
+        metavar="CSV",
+        help=f"Archivos o patrones a importar (por defecto {ARCHIVE_PATTERN})",
+    )
+    import_parser.add_argument(
+        "--stores",
+        type=_split_stores,
+        default=list(IMPORT_STORES),
+        help=f"Almacenes a cargar, separados por comas ({','.join(IMPORT_STORES)})",
+    )
+    import_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Procesos que leen archivos en paralelo (por defecto, uno por CPU)",
+    )
+    import_parser.add_argument(
+        "--index-file",
+        default=SEARCH_DB_FILENAME,
+        help="Índice de búsqueda en el que importar",
+    )
+    import_parser.add_argument(
+        "--counts-file",
+        default=TERMS_DB_FILENAME,
+        help="Contadores de términos en los que importar",
+    )
+
+    warc_parser = subparsers.add_parser(
+        "warc", help="Extrae titulares de portadas archivadas en ficheros WARC"
+    )
+    warc_parser.add_argument(
+        "files", nargs="+", metavar="WARC", help="Ficheros .warc o .warc.gz, o patrones"
+    )
+    warc_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Procesos que parsean portadas en paralelo (por defecto, uno por CPU)",
+    )
+    warc_parser.add_argument(
+        "--all-captures",
+        action="store_true",
+        help="Procesa todas las capturas, no solo la primera de cada medio y día",
+    )
+
+    args = parser.parse_args(argv)
+
+    unsupported = [
+        f"--{dest.replace('_', '-')}"
+        for dest in _DAILY_RUN_OPTIONS.get(args.command, ())
+        if getattr(args, dest) != parser.get_default(dest)
+    ]
+    if unsupported:
+        parser.error(f"{args.command} no admite {', '.join(unsupported)}")
+
+    try:
+        registry.select(args.only, args.exclude)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    if args.command == "warc":
+        ingest_warc(
+            args.files,
+            workers=args.workers,
+            all_captures=args.all_captures,
+            dedup=args.dedup,
+            only=args.only,
+            exclude=args.exclude,
+        )
+    elif args.command == "import":
+        import_archives(
+            args.files,
+            stores=args.stores,
+            workers=args.workers,
+            index_file=args.index_file,
+            counts_file=args.counts_file,
+        )
+    elif args.command == "terms":
+        try:
+            term_series(
+                args.term,
+                date_from=args.date_from,
+                date_to=args.date_to,
+                medios=args.medio,
+                by_month=args.by_month,
+                counts_file=args.counts_file,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.command == "stats":
+        if args.report == "zonas" and not args.tema:
+            parser.error("el informe zonas necesita --tema")
+        stats(
+            args.report,
+            topic=args.tema,
+            top=args.top,
+            date_from=args.date_from,
+            date_to=args.date_to,
+            medios=args.medio,
+        )
+    elif args.command == "search":
+        search(
+            args.query,
+            date_from=args.date_from,
+            date_to=args.date_to,
+            medios=args.medio,
+            limit=args.limit,
+            index_file=args.index_file,
+        )
+    elif args.command == "pipeline":
+        run_pipeline(
+            fetch_workers=args.fetch_workers,
+            parse_workers=args.parse_workers,
+            parse_processes=args.processes,
+            queue_size=args.queue_size,
+            enrich_workers=args.enrich_workers,
+            only=args.only,
+            exclude=args.exclude,
+            crawl_depth=args.crawl_depth,
+            rate=args.rate,
+            burst=args.burst,
+            retries=args.retries,
+            breaker_cooldown=args.breaker_cooldown,
+            dedup=args.dedup,
+            new_only=args.new_only,
+            diff=args.diff,
+            versions=args.versions,
+            clusters=args.clusters,
+            index=args.index,
+            terms=args.terms,
+        )
+    elif args.command == "serve":
+        try:
+            outlet_intervals = _parse_outlet_intervals(args.outlet_interval)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+        serve(
+            interval=args.interval,
+            jitter=args.jitter,
+            outlet_intervals=outlet_intervals,
+            adaptive=args.adaptive,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            state_file=args.state_file,
+            only=args.only,
+            exclude=args.exclude,
+            timings=args.timings,
+            crawl_depth=args.crawl_depth,
+            per_host=args.per_host,
+            rate=args.rate,
+            burst=args.burst,
+            retries=args.retries,
+            breaker_cooldown=args.breaker_cooldown,
+            dedup=args.dedup,
+            new_only=args.new_only,
+            diff=args.diff,
+            versions=args.versions,
+            clusters=args.clusters,
+            index=args.index,
+            terms=args.terms,
+        )
+    else:
+        main(
+            timings=args.timings,
+            profile=args.profile,
+            profile_top=args.profile_top,
+            max_memory_mb=args.max_memory_mb,
+            only=args.only,
+            exclude=args.exclude,
+            crawl_depth=args.crawl_depth,
+            per_host=args.per_host,
+            rate=args.rate,
+            burst=args.burst,
+            retries=args.retries,
+            breaker_cooldown=args.breaker_cooldown,
+            deadline=args.deadline,
+            dedup=args.dedup,
+            new_only=args.new_only,
+            diff=args.diff,
+            versions=args.versions,
+            clusters=args.clusters,
+            index=args.index,
+            terms=args.terms,
+        )
 
 
 if __name__ == "__main__":
-    main()
+    cli()
@@ -0,0 +1,74 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+from news_scraper.utils.constants import (
+    DEFAULT_CONNECTIONS_PER_HOST,
+    DEFAULT_FETCH_WORKERS,
+)
+
+T = TypeVar("T")
+
+
+class FetchScheduler:
+    """Ejecuta descargas en paralelo con un límite de conexiones simultáneas por host.
+
+    Lo comparten todos los scrapers: el límite por host se respeta aunque
+    varios medios o páginas de un mismo medio se descarguen a la vez, mientras
+    que hosts distintos avanzan en paralelo.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_FETCH_WORKERS,
+        per_host: int = DEFAULT_CONNECTIONS_PER_HOST,
+    ):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="fetch"
+                )
+            return self._executor
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._slots[host]
+
+    def _run(self, fetch: Callable[[str], T], url: str) -> T:
+        with self._host_slot(url):
+            return fetch(url)
+
+    def map(
+        self, fetch: Callable[[str], T], urls: List[str]
+    ) -> List[Tuple[Optional[T], Optional[Exception]]]:
+        """Aplica `fetch` a cada URL y devuelve (resultado, error) en el mismo orden."""
+        executor = self._get_executor()
+        futures = [executor.submit(self._run, fetch, url) for url in urls]
+        results: List[Tuple[Optional[T], Optional[Exception]]] = []
+        for future in futures:
+            try:
+                results.append((future.result(), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+# Planificador compartido por defecto
+default_fetcher = FetchScheduler()
@@ -0,0 +1,278 @@
+import csv
+import glob
+import io
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, partial
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from news_scraper.utils.constants import (
+    ARCHIVE_PATTERN,
+    IMPORT_CHUNK_BYTES,
+    IMPORT_DATE_FORMATS,
+    IMPORT_STORES,
+    OUTLET_NAMES,
+    SEARCH_DB_FILENAME,
+    TERMS_DB_FILENAME,
+)
+from news_scraper.utils.csv_reader import CSVIndex
+from news_scraper.utils.search_index import SearchIndex
+from news_scraper.utils.term_counts import TermCounts
+from news_scraper.utils.text import fold_accents, index_terms
+from news_scraper.utils.urls import canonicalize_url
+
+# Columnas de una fila normalizada, en el orden de las tuplas importadas
+IMPORT_COLUMNS = ("fecha", "medio", "titular", "zona_portada", "seccion", "url")
+# Sin estas columnas no se puede importar un archivo
+REQUIRED_COLUMNS = ("fecha", "medio", "titular", "url")
+
+_NON_WORD_RE = re.compile(r"\W+")
+
+# Columnas de IMPORT_COLUMNS y términos del titular (vacío si no hacen falta)
+ImportedRow = Tuple[str, str, str, str, str, str, List[str]]
+
+
+def iter_chunks(file: IO[bytes], size: int = IMPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """Bloques de unos `size` bytes que terminan siempre en fin de registro."""
+    rest = b""
+    while True:
+        block = file.read(size)
+        if not block:
+            break
+        data = rest + block
+        cut = _record_boundary(data)
+        if cut:
+            yield data[:cut]
+        rest = data[cut:]
+    if rest:
+        yield rest
+
+
+def _record_boundary(data: bytes) -> int:
+    """Offset tras el último salto de línea que cierra un registro (0 si no hay).
+
+    Un salto de línea cierra un registro si las comillas anteriores son pares;
+    el bloque empieza siempre al principio de un registro.
+    """
+    end = data.rfind(b"\n")
+    quotes = data.count(b'"', 0, end + 1)
+    while end >= 0 and quotes % 2:
+        previous = data.rfind(b"\n", 0, end)
+        quotes -= data.count(b'"', previous + 1, end + 1)
+        end = previous
+    return end + 1
+
+
+@lru_cache(maxsize=16384)
+def normalize_date(value: str) -> Optional[str]:
+    """Fecha en formato ISO (AAAA-MM-DD), o None si no se reconoce.
+
+    Acepta también fechas con hora ("2025-07-14 10:30") y los formatos de
+    IMPORT_DATE_FORMATS ("14/07/2025"...).
+    """
+    value = value.strip()
+    head = value[:10]
+    for date_format in IMPORT_DATE_FORMATS:
+        try:
+            return datetime.strptime(head, date_format).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=1024)
+def normalize_outlet(value: str) -> str:
+    """Nombre del medio como lo escribe su scraper ("La Capital" -> "La capital")."""
+    name = " ".join(value.split())
+    return OUTLET_NAMES.get(_NON_WORD_RE.sub("", fold_accents(name)), name)
+
+
+class ImportedFile:
+    """Resultado de leer un archivo: filas normalizadas y contadores."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.rows: List[ImportedRow] = []
+        self.imported_rows = 0
+        self.rejected = 0
+        self.indexed_rows = 0  # filas en el índice lateral del CSV
+        self.cached_rows = 0  # filas guardadas en la caché de estadísticas
+        self.read_s = 0.0
+        self.load_s = 0.0
+        self.added = 0  # documentos nuevos en el índice de búsqueda
+        self.counted = 0  # titulares nuevos en los contadores de términos
+        self.error: Optional[str] = None
+
+
+def _normalize_rows(
+    records: Iterable[List[str]],
+    headers: List[str],
+    imported: ImportedFile,
+    with_terms: bool,
+) -> None:
+    positions = {column: i for i, column in enumerate(headers)}
+    missing = [column for column in REQUIRED_COLUMNS if column not in positions]
+    if missing:
+        imported.error = f"faltan las columnas {', '.join(missing)}"
+        return
+    fecha_at, medio_at, titular_at, url_at = (
+        positions[column] for column in REQUIRED_COLUMNS
+    )
+    # Los CSV más antiguos pueden no tener zona ni sección
+    zona_at = positions.get("zona_portada")
+    seccion_at = positions.get("seccion")
+    width = len(headers)
+
+    append = imported.rows.append
+    for values in records:
+        if len(values) != width:
+            imported.rejected += 1
+            continue
+        fecha = normalize_date(values[fecha_at])
+        titular = " ".join(values[titular_at].split())
+        url = values[url_at].strip()
+        if fecha is None or not titular or not url:
+            imported.rejected += 1
+            continue
+        append(
+            (
+                fecha,
+                normalize_outlet(values[medio_at]),
+                titular,
+                values[zona_at].strip() if zona_at is not None else "",
+                values[seccion_at].strip() if seccion_at is not None else "",
+                canonicalize_url(url),
+                index_terms(titular) if with_terms else [],
+            )
+        )
+
+
+def read_archive(
+    filename: str,
+    stores: Sequence[str] = IMPORT_STORES,
+    stats_files: Sequence[str] = (),
+    today: Optional[date] = None,
+) -> ImportedFile:
+    """Lee y normaliza un CSV histórico por bloques grandes.
+
+    Se ejecuta en un proceso por archivo: además de devolver las filas, pone
+    al día lo que pertenece solo a ese archivo (su índice lateral y, si está
+    en `stats_files`, su caché de estadísticas).
+    """
+    imported = ImportedFile(filename)
+    # Tokenizar es lo más costoso de la carga: se hace aquí, en paralelo
+    with_terms = any(store in stores for store in ("search", "terms", "stats"))
+    started = time.perf_counter()
+    try:
+        with open(filename, "rb") as file:
+            headers: Optional[List[str]] = None
+            offset = 0
+            for chunk in iter_chunks(file):
+                offset += len(chunk)
+                encoding = "utf-8-sig" if headers is None else "utf-8"
+                text = chunk.decode(encoding, "replace")
+                records = csv.reader(io.StringIO(text, newline=""))
+                if headers is None:
+                    headers = [header.strip() for header in next(records, [])]
+                _normalize_rows(records, headers, imported, with_terms)
+                if imported.error:
+                    return imported
+            imported.imported_rows = len(imported.rows)
+
+            if "stats" in stores and os.path.abspath(filename) in stats_files:
+                imported.cached_rows = _save_stats_cache(
+                    filename, file, offset, imported.rows, today
+                )
+        if "csv-index" in stores:
+            groups = CSVIndex(filename).refresh()
+            imported.indexed_rows = sum(len(offsets) for offsets, _ in groups.values())
+    except (OSError, csv.Error) as e:
+        imported.error = str(e)
+    finally:
+        imported.read_s = time.perf_counter() - started
+    return imported
+
+
+def _save_stats_cache(
+    filename: str,
+    file: IO[bytes],
+    offset: int,
+    rows: List[ImportedRow],
+    today: Optional[date],
+) -> int:
+    # NumPy solo hace falta si se importa a la caché de estadísticas
+    from news_scraper.stats import Columns, Partition
+
+    # La caché guarda días cerrados: un archivo con filas de hoy se deja a stats
+    today_iso = (today or date.today()).isoformat()
+    if not rows or max(row[0] for row in rows) >= today_iso:
+        return 0
+    columns = Columns.encode(
+        [dict(zip(IMPORT_COLUMNS, row[:-1])) for row in rows],
+        [row[-1] for row in rows],
+    )
+    Partition(filename).save(columns, file, offset)
+    return len(rows)
+
+
+class BulkImporter:
+    """Carga archivos de CSV mensuales en los almacenes indexados.
+
+    Cada archivo se lee y normaliza en su propio proceso; el proceso
+    principal añade las filas al índice de búsqueda y a los contadores de
+    términos (SQLite admite un solo escritor) a medida que llegan. Los días
+    que ya tenían titulares contados no se vuelven a contar, de modo que
+    repetir la importación no duplica nada.
+    """
+
+    def __init__(
+        self,
+        stores: Sequence[str] = IMPORT_STORES,
+        workers: Optional[int] = None,
+        index_file: str = SEARCH_DB_FILENAME,
+        counts_file: str = TERMS_DB_FILENAME,
+        today: Optional[date] = None,
+    ):
+        self.stores = stores
+        self.workers = workers
+        self.today = today
+        self.search_index = SearchIndex(index_file) if "search" in stores else None
+        self.term_counts = TermCounts(counts_file) if "terms" in stores else None
+
+    def run(self, filenames: List[str]) -> Iterator[ImportedFile]:
+        """Importa los archivos y devuelve el resultado de cada uno al cargarlo."""
+        stats_files = [os.path.abspath(name) for name in glob.glob(ARCHIVE_PATTERN)]
+        read = partial(
+            read_archive, stores=self.stores, stats_files=stats_files, today=self.today
+        )
+        counted_days = self.term_counts.days() if self.term_counts else set()
+
+        if self.workers == 1 or len(filenames) == 1:
+            yield from (self._load(read(name), counted_days) for name in filenames)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for imported in executor.map(read, filenames):
+                yield self._load(imported, counted_days)
+
+    def _load(self, imported: ImportedFile, counted_days: set) -> ImportedFile:
+        started = time.perf_counter()
+        for *values, terms in imported.rows:
+            data: Dict[str, Any] = dict(zip(IMPORT_COLUMNS, values))
+            if self.search_index and self.search_index.add(data, terms):
+                imported.added += 1
+            if self.term_counts and (data["fecha"], data["medio"]) not in counted_days:
+                if self.term_counts.add(data, terms):
+                    imported.counted += 1
+        imported.load_s = time.perf_counter() - started
+        # Las filas ya están en los almacenes: no hace falta retenerlas
+        imported.rows = []
+        return imported
+
+    def close(self) -> None:
+        if self.search_index:
+            self.search_index.close()
+        if self.term_counts:
+            self.term_counts.close()
@@ -0,0 +1,354 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from news_scraper.scrapers.base import NewsScraper
+from news_scraper.utils.constants import (
+    DEFAULT_PIPELINE_ENRICH_WORKERS,
+    DEFAULT_PIPELINE_FETCH_WORKERS,
+    DEFAULT_PIPELINE_PARSE_WORKERS,
+    DEFAULT_PIPELINE_QUEUE_SIZE,
+)
+
+# Marca de fin de flujo que cada etapa pasa a la siguiente
+_DONE = object()
+
+# Un enriquecedor recibe una fila y devuelve la fila (modificada) o None para descartarla
+Enricher = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def observer(writer: Any) -> Enricher:
+    """Enriquecedor que entrega cada fila a un writer (versiones, historias,
+    índice...) y la deja pasar sin cambios."""
+
+    def observe(row: Dict[str, Any]) -> Dict[str, Any]:
+        writer.append_data(row)
+        return row
+
+    return observe
+
+
+# Scrapers instanciados en cada proceso de parseo (uno por clase)
+_PROCESS_SCRAPERS: Dict[Type[NewsScraper], NewsScraper] = {}
+
+
+class PageTask:
+    """Página a descargar y parsear: la portada (zone None) o un listado."""
+
+    __slots__ = ("scraper", "url", "zone", "page", "html")
+
+    def __init__(
+        self,
+        scraper: NewsScraper,
+        url: str,
+        zone: Optional[str] = None,
+        page: int = 0,
+    ):
+        self.scraper = scraper
+        self.url = url
+        self.zone = zone
+        self.page = page
+        self.html: Optional[str] = None
+
+
+def parse_page(
+    scraper: NewsScraper, html: str, zone: Optional[str], page: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Parsea una portada o una página de listado ya descargada.
+
+    Devuelve los titulares y la zona que falló si la portada quedó incompleta.
+    """
+    if zone is None:
+        scraper.partial = None
+        rows = scraper.parse_html(html)
+        return rows, scraper.partial
+    soup = scraper._make_soup(html, front_page=False)
+    try:
+        return scraper._parse_listing_page(soup, zone, page), None
+    finally:
+        soup.decompose()
+
+
+def _parse_in_process(
+    scraper_class: Type[NewsScraper], html: str, zone: Optional[str], page: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    # Dentro del proceso hijo no viaja la instancia (sesión, logger): se crea una
+    scraper = _PROCESS_SCRAPERS.get(scraper_class)
+    if scraper is None:
+        scraper = _PROCESS_SCRAPERS[scraper_class] = scraper_class()
+    return parse_page(scraper, html, zone, page)
+
+
+class StageMetrics:
+    """Contadores de una etapa y ocupación de su cola de entrada."""
+
+    def __init__(self, name: str, workers: int, inbox: queue.Queue):
+        self.name = name
+        self.workers = workers
+        self.inbox = inbox
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_s = 0.0
+        self.queue_max = 0
+        self._queue_total = 0
+        self._lock = threading.Lock()
+
+    def record_get(self) -> None:
+        occupancy = self.inbox.qsize()
+        with self._lock:
+            self.items_in += 1
+            self._queue_total += occupancy
+            self.queue_max = max(self.queue_max, occupancy)
+
+    def record_item(self, busy: float, produced: int, failed: bool) -> None:
+        with self._lock:
+            self.busy_s += busy
+            self.items_out += produced
+            self.errors += failed
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "items_in": self.items_in,
+                "items_out": self.items_out,
+                "errors": self.errors,
+                "throughput_per_s": round(self.items_out / elapsed, 3) if elapsed else 0.0,
+                # Fracción del tiempo en que los hilos de la etapa trabajaron
+                "utilization": round(self.busy_s / (elapsed * self.workers), 3)
+                if elapsed
+                else 0.0,
+                "queue_size": self.inbox.maxsize,
+                "queue_max": self.queue_max,
+                "queue_mean": round(self._queue_total / self.items_in, 3)
+                if self.items_in
+                else 0.0,
+            }
+
+
+class Stage:
+    """Etapa con `workers` hilos que leen de `inbox` y escriben en `outbox`.
+
+    `func` devuelve un iterable con los elementos producidos por cada entrada.
+    Las colas están acotadas: si la etapa siguiente va lenta, put() bloquea y
+    la presión se propaga hacia atrás hasta la descarga.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Any], Iterable[Any]],
+        workers: int,
+        inbox: queue.Queue,
+        outbox: Optional[queue.Queue],
+        logger: logging.Logger,
+    ):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.inbox = inbox
+        self.outbox = outbox
+        self.logger = logger
+        self.metrics = StageMetrics(name, self.workers, inbox)
+        self._alive = self.workers
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"{name}-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+
+    def start(self) -> None:
+        for thread in self._threads:
+            thread.start()
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self) -> None:
+        while True:
+            item = self.inbox.get()
+            if item is _DONE:
+                # Se devuelve la marca para el resto de hilos de la etapa
+                self.inbox.put(_DONE)
+                break
+            self.metrics.record_get()
+            started = time.perf_counter()
+            produced = 0
+            failed = False
+            try:
+                for result in self.func(item):
+                    produced += 1
+                    if self.outbox is not None:
+                        self.outbox.put(result)
+            except Exception as e:
+                failed = True
+                self.logger.error(f"[pipeline] Error en la etapa {self.name}: {e}")
+            self.metrics.record_item(time.perf_counter() - started, produced, failed)
+
+        with self._lock:
+            self._alive -= 1
+            last = self._alive == 0
+        if last and self.outbox is not None:
+            self.outbox.put(_DONE)
+
+
+class Pipeline:
+    """Scraping por etapas conectadas con colas acotadas:
+    descarga → parseo → enriquecimiento → escritura.
+
+    Cada etapa tiene su propio paralelismo: la descarga es concurrente (E/S),
+    el parseo usa hilos o, con `parse_processes`, un pool de procesos, el
+    enriquecimiento aplica `enrichers` en orden y la escritura usa un único
+    hilo por fichero. Las métricas por etapa permiten ver cuál es la más lenta.
+
+    `partial` reúne los medios con alguna página o zona fallida, cuya
+    portada no debe compararse con la anterior.
+    """
+
+    def __init__(
+        self,
+        scrapers: List[NewsScraper],
+        sinks: List[Any],
+        logger: logging.Logger,
+        fetch_workers: int = DEFAULT_PIPELINE_FETCH_WORKERS,
+        parse_workers: int = DEFAULT_PIPELINE_PARSE_WORKERS,
+        parse_processes: bool = False,
+        enrich_workers: int = DEFAULT_PIPELINE_ENRICH_WORKERS,
+        enrichers: Optional[List[Enricher]] = None,
+        queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE,
+    ):
+        self.scrapers = scrapers
+        self.sinks = sinks
+        self.logger = logger
+        self.enrichers = enrichers or []
+        self.parse_processes = parse_processes
+        self.rows: Dict[str, int] = {scraper.name: 0 for scraper in scrapers}
+        self.partial: Set[str] = set()
+        self.started = datetime.now()
+        self.elapsed = 0.0
+        self._rows_lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+
+        fetch_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        parse_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        enrich_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        sink_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._source = fetch_queue
+        self.stages = [
+            Stage("fetch", self._fetch, fetch_workers, fetch_queue, parse_queue, logger),
+            Stage("parse", self._parse, parse_workers, parse_queue, enrich_queue, logger),
+            Stage(
+                "enrich", self._enrich, enrich_workers, enrich_queue, sink_queue, logger
+            ),
+            Stage("sink", self._sink, 1, sink_queue, None, logger),
+        ]
+        if parse_processes:
+            # Los procesos arrancan con el primer parseo, cuando ya hay hilos:
+            # con fork heredarían locks tomados por otros hilos y podrían colgarse
+            self._executor = ProcessPoolExecutor(
+                max_workers=max(1, parse_workers), mp_context=get_context("spawn")
+            )
+
+    def _tasks(self) -> Iterable[PageTask]:
+        for scraper in self.scrapers:
+            yield PageTask(scraper, scraper.url)
+            for url, zone, page in scraper._listing_urls():
+                yield PageTask(scraper, url, zone, page)
+
+    def _mark_partial(self, scraper: NewsScraper) -> None:
+        with self._rows_lock:
+            self.partial.add(scraper.name)
+
+    def _fetch(self, task: PageTask) -> Iterable[PageTask]:
+        try:
+            task.html = task.scraper._fetch_html(
+                task.url, front_page=task.zone is None
+            )
+        except Exception:
+            self._mark_partial(task.scraper)
+            raise
+        return (task,)
+
+    def _parse(self, task: PageTask) -> Iterable[Dict[str, Any]]:
+        html = task.html or ""
+        task.html = None
+        try:
+            if self._executor is not None:
+                rows, failed_zone = self._executor.submit(
+                    _parse_in_process, type(task.scraper), html, task.zone, task.page
+                ).result()
+            else:
+                rows, failed_zone = parse_page(task.scraper, html, task.zone, task.page)
+        except Exception:
+            self._mark_partial(task.scraper)
+            raise
+        if failed_zone:
+            self._mark_partial(task.scraper)
+        return rows
+
+    def _enrich(self, row: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+        for enricher in self.enrichers:
+            enriched = enricher(row)
+            if enriched is None:
+                return ()
+            row = enriched
+        return (row,)
+
+    def _sink(self, row: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+        for sink in self.sinks:
+            sink.append_data(row)
+        with self._rows_lock:
+            self.rows[row["medio"]] = self.rows.get(row["medio"], 0) + 1
+        return (row,)
+
+    def run(self) -> Dict[str, int]:
+        """Ejecuta todas las etapas hasta vaciar el flujo; devuelve filas por medio."""
+        self.started = datetime.now()
+        started = time.perf_counter()
+        for stage in self.stages:
+            stage.start()
+        try:
+            for task in self._tasks():
+                self._source.put(task)
+            self._source.put(_DONE)
+            for stage in self.stages:
+                stage.join()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self.elapsed = time.perf_counter() - started
+        return self.rows
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "started": self.started.isoformat(timespec="seconds"),
+            "elapsed_s": round(self.elapsed, 3),
+            "rows": dict(self.rows),
+            "stages": {
+                stage.name: stage.metrics.summary(self.elapsed) for stage in self.stages
+            },
+        }
+
+    def log_summary(self) -> None:
+        for name, stats in self.summary()["stages"].items():
+            self.logger.info(
+                f"[pipeline] {name}: {stats['items_out']} elementos, "
+                f"{stats['throughput_per_s']:.1f}/s, ocupación {stats['utilization']:.0%}, "
+                f"cola máx {stats['queue_max']}/{stats['queue_size']}",
+                extra={"stage": name, **stats},
+            )
+
+    def write_json(self, filename: str) -> None:
+        """Añade las métricas de la ejecución como una línea JSON al fichero."""
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        with open(filename, mode="a", encoding="utf-8") as file:
+            file.write(json.dumps(self.summary(), ensure_ascii=False) + "\n")
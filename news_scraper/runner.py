@@ -0,0 +1,175 @@
+import logging
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Set, Type
+
+from news_scraper.fetcher import FetchScheduler
+from news_scraper.scrapers.base import NewsScraper
+from news_scraper.utils.budget import OutletBudget
+from news_scraper.utils.csv_writer import CSVWriter
+from news_scraper.utils.dedup import Deduplicator
+from news_scraper.utils.memory import current_rss_mb, peak_rss_mb, reset_peak_rss
+from news_scraper.utils.profiling import ScraperProfiler
+from news_scraper.utils.resilience import CircuitBreakers, RetryPolicy
+from news_scraper.utils.snapshots import SnapshotDiffer
+from news_scraper.utils.timing import NULL_TIMINGS, StageTimings
+
+
+def scrape_and_write(
+    scraper: NewsScraper,
+    logger: logging.Logger,
+    writer: CSVWriter,
+    dedup: bool = False,
+    differ: Optional[SnapshotDiffer] = None,
+    urls: Optional[Set[str]] = None,
+) -> int:
+    """Ejecuta un scraper ya instanciado y escribe sus titulares en el CSV.
+
+    Consume iter_scrape(): cada titular se escribe en cuanto se extrae su
+    zona, así que las primeras filas llegan al CSV antes de que termine el
+    medio y un fallo posterior no pierde las ya escritas.
+
+    Con `dedup`, las filas se acumulan por URL canónica y se escriben al
+    terminar el medio, una por noticia con todas sus zonas. Con `differ`, la
+    portada se compara con la anterior del medio si está completa (no se
+    cortó ni falló ninguna zona o listado); solo entonces se retienen los
+    titulares. Si se pasa `urls`, se añaden a
+    ese conjunto las URLs de la portada (sondeo adaptativo).
+
+    No cierra la sesión del scraper, de modo que el modo servicio puede
+    reutilizar conexiones y cookies entre sondeos.
+
+    Returns:
+        int: Número de titulares obtenidos.
+    """
+    fields = {"outlet": scraper.name}
+    logger.info(f"Iniciando scraping de {scraper.name}", extra=fields)
+
+    # El modo servicio reutiliza el scraper: el estado es de cada sondeo
+    scraper.truncated = None
+    scraper.partial = None
+    sink = Deduplicator(writer) if dedup else writer
+    titulares: Optional[List[Dict[str, Any]]] = [] if differ else None
+    total = 0
+    try:
+        for titular in scraper.iter_scrape():
+            total += 1
+            if titulares is not None:
+                titulares.append(titular)
+            if urls is not None:
+                urls.add(titular["url"])
+            try:
+                with scraper.timings.stage(scraper.name, "write"):
+                    sink.append_data(titular)
+                # Formateo perezoso: a nivel INFO esta línea no construye nada
+                logger.debug("[%s] Escrito: %s", scraper.name, titular["titular"])
+            except Exception as e:
+                logger.error(
+                    f"[{scraper.name}] Error al escribir en CSV: {e}", extra=fields
+                )
+    finally:
+        if isinstance(sink, Deduplicator):
+            # También ante un fallo: lo ya extraído se escribe
+            with scraper.timings.stage(scraper.name, "write"):
+                sink.flush()
+            if sink.duplicates:
+                logger.info(
+                    f"[{scraper.name}] {sink.duplicates} titulares repetidos fusionados",
+                    extra={**fields, "count": sink.duplicates},
+                )
+
+    if not total:
+        logger.warning(f"No se obtuvieron titulares de {scraper.name}", extra=fields)
+        return 0
+
+    logger.info(
+        f"Obtenidos {total} titulares de {scraper.name}",
+        extra={**fields, "count": total},
+    )
+    if differ and titulares:
+        incomplete = scraper.truncated or scraper.partial
+        if incomplete:
+            logger.warning(
+                f"[{scraper.name}] Portada incompleta ({incomplete}): "
+                "no se compara con la anterior",
+                extra=fields,
+            )
+        else:
+            differ.observe(scraper.name, titulares)
+    return total
+
+
+def run_scraper(
+    scraper_class: Type[NewsScraper],
+    logger: logging.Logger,
+    writer: CSVWriter,
+    timings: StageTimings = NULL_TIMINGS,
+    profiler: Optional[ScraperProfiler] = None,
+    max_memory_mb: Optional[float] = None,
+    crawl_depth: int = 0,
+    fetcher: Optional[FetchScheduler] = None,
+    retry: Optional[RetryPolicy] = None,
+    breakers: Optional[CircuitBreakers] = None,
+    budget: Optional[OutletBudget] = None,
+    dedup: bool = False,
+    differ: Optional[SnapshotDiffer] = None,
+) -> Optional[str]:
+    """Ejecución única: crea el scraper, lo ejecuta y libera la sesión.
+
+    Registra el pico de RSS del medio y, con `max_memory_mb`, no arranca el
+    scraper si el proceso ya supera ese techo, y lo corta como con `budget`
+    si lo supera entre zonas o listados. Con `crawl_depth` > 0 recorre
+    además esa cantidad de páginas de cada listado declarado por el scraper.
+    Con `breakers`, un medio cuyo circuito está abierto se omite sin conectarse.
+
+    Con `budget`, el scraper se corta al agotar su tiempo y se escriben los
+    titulares ya extraídos; devuelve la etapa en la que se cortó (o None).
+    """
+    rss = current_rss_mb()
+    if max_memory_mb and rss is not None and rss > max_memory_mb:
+        logger.error(
+            f"[{scraper_class.__name__}] Omitido: RSS {rss:.1f} MB supera el "
+            f"techo de {max_memory_mb:.0f} MB",
+            extra={"rss_mb": round(rss, 1)},
+        )
+        return None
+
+    truncated = None
+    per_outlet = reset_peak_rss()
+    try:
+        with scraper_class(logger=logger) as scraper:
+            if breakers:
+                breaker = breakers.get(scraper.name)
+                if breaker.is_open():
+                    logger.warning(
+                        f"[{scraper.name}] Omitido: circuito abierto tras "
+                        f"{breaker.failures} fallos, reintento en "
+                        f"{breaker.retry_in():.0f}s",
+                        extra={"outlet": scraper.name, "count": breaker.failures},
+                    )
+                    return None
+                scraper.breaker = breaker
+            if retry:
+                scraper.retry = retry
+            scraper.timings = timings
+            scraper.max_pages = crawl_depth
+            if fetcher:
+                scraper.fetcher = fetcher
+            scraper.budget = budget
+            scraper.max_memory_mb = max_memory_mb
+            try:
+                with profiler.profile(scraper.name) if profiler else nullcontext():
+                    scrape_and_write(scraper, logger, writer, dedup, differ)
+            finally:
+                truncated = scraper.truncated
+    except Exception as e:
+        logger.error(f"[{scraper_class.__name__}] Falló el scraping: {e}")
+
+    peak = peak_rss_mb()
+    level = logging.WARNING if max_memory_mb and peak > max_memory_mb else logging.INFO
+    logger.log(
+        level,
+        f"[{scraper_class.__name__}] Pico de RSS: {peak:.1f} MB"
+        + ("" if per_outlet else " (acumulado del proceso)"),
+        extra={"peak_rss_mb": round(peak, 1)},
+    )
+    return truncated
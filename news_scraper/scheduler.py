@@ -0,0 +1,333 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from news_scraper.fetcher import FetchScheduler
+from news_scraper.runner import scrape_and_write
+from news_scraper.scrapers.base import NewsScraper
+from news_scraper.utils.constants import (
+    CHURN_HIGH,
+    CHURN_LOW,
+    CSV_HEADERS,
+    DEFAULT_CRAWL_DEPTH,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_POLL_JITTER,
+    INTERVAL_GROW,
+    INTERVAL_SHRINK,
+    get_monthly_filename,
+)
+from news_scraper.utils.clustering import ClusterWriter
+from news_scraper.utils.csv_writer import CSVWriter, MultiWriter
+from news_scraper.utils.resilience import CircuitBreakers, RetryPolicy
+from news_scraper.utils.search_index import IndexWriter
+from news_scraper.utils.seen_index import NewOnlyWriter, SeenIndex
+from news_scraper.utils.snapshots import SnapshotDiffer
+from news_scraper.utils.term_counts import TermCountWriter
+from news_scraper.utils.timing import NULL_TIMINGS, StageTimings
+from news_scraper.utils.versions import VersionWriter
+
+
+class OutletJob:
+    """Estado de sondeo de un medio dentro del planificador."""
+
+    def __init__(self, scraper: NewsScraper, interval: float):
+        self.scraper = scraper
+        self.interval = interval
+        self.next_run = time.monotonic()
+        self.running = False
+        self.polls = 0
+        # URLs de la última portada observada (None hasta el primer sondeo)
+        self.urls: Optional[Set[str]] = None
+
+
+class AdaptiveInterval:
+    """Ajusta el intervalo de un medio según la rotación de titulares en portada.
+
+    La rotación (churn) es la fracción de URLs que entraron o salieron de la
+    portada respecto de la unión de los dos últimos sondeos.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        churn_high: float = CHURN_HIGH,
+        churn_low: float = CHURN_LOW,
+        shrink: float = INTERVAL_SHRINK,
+        grow: float = INTERVAL_GROW,
+    ):
+        if min_interval > max_interval:
+            raise ValueError("min_interval no puede ser mayor que max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.churn_high = churn_high
+        self.churn_low = churn_low
+        self.shrink = shrink
+        self.grow = grow
+
+    @staticmethod
+    def measure(previous: Set[str], current: Set[str]) -> Tuple[int, int, float]:
+        """Devuelve (entradas, salidas, churn) entre dos portadas."""
+        entered = len(current - previous)
+        left = len(previous - current)
+        union = len(previous | current)
+        return entered, left, (entered + left) / union if union else 0.0
+
+    def clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def next_interval(self, interval: float, churn: float) -> float:
+        if churn >= self.churn_high:
+            interval *= self.shrink
+        elif churn <= self.churn_low:
+            interval *= self.grow
+        return self.clamp(interval)
+
+
+class SchedulerState:
+    """Persiste en JSON el intervalo aprendido y la última portada de cada medio."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.outlets: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> None:
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, encoding="utf-8") as file:
+            self.outlets = json.load(file).get("outlets", {})
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.filename) or ".", exist_ok=True)
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as file:
+            json.dump({"outlets": self.outlets}, file, ensure_ascii=False)
+        # Reemplazo atómico: un corte a mitad de escritura no corrompe el estado
+        os.replace(tmp_filename, self.filename)
+
+    def restore(self, job: OutletJob) -> None:
+        saved = self.outlets.get(job.scraper.name)
+        if saved:
+            job.interval = saved.get("interval", job.interval)
+            job.urls = set(saved.get("urls", []))
+
+    def update(self, job: OutletJob) -> None:
+        self.outlets[job.scraper.name] = {
+            "interval": job.interval,
+            "urls": sorted(job.urls or ()),
+            "updated": datetime.now().isoformat(timespec="seconds"),
+        }
+
+
+class Scheduler:
+    """Sondea cada medio con su propio intervalo (con jitter) hasta recibir stop().
+
+    Cada medio tiene una única instancia de scraper durante toda la vida del
+    servicio, así que la sesión HTTP (pool de conexiones y cookies) se reutiliza
+    entre sondeos. Un medio nunca se ejecuta dos veces en paralelo: el siguiente
+    sondeo se programa cuando termina el anterior. `outlet_intervals` asigna
+    un intervalo propio a algunas clases de scraper.
+
+    Con `adaptive`, el intervalo de cada medio se acorta o alarga según la
+    rotación observada en su portada; con `state`, lo aprendido sobrevive a
+    los reinicios. Con `breakers`, un medio que falla repetidamente deja de
+    sondearse hasta que pasa el enfriamiento de su circuito. `crawl_depth`,
+    `retry`, `fetcher` y `timings` se aplican a todos los scrapers como en la
+    ejecución diaria. Con `dedup`, cada
+    sondeo escribe una fila por noticia con todas sus zonas, y con `seen` solo
+    las URLs que no se habían visto nunca. Con `differ`,
+    cada sondeo emite los cambios de portada respecto del anterior; con
+    `versions`, solo las ediciones de titulares generan filas de versión;
+    con `clusters` cada noticia nueva se asigna a su historia entre medios,
+    con `index` los titulares se añaden al índice de búsqueda y con `terms`
+    a los contadores de términos por día.
+    """
+
+    def __init__(
+        self,
+        scraper_classes: List[Type[NewsScraper]],
+        logger: logging.Logger,
+        interval: Optional[float] = None,
+        jitter: float = DEFAULT_POLL_JITTER,
+        outlet_intervals: Optional[Dict[Type[NewsScraper], float]] = None,
+        adaptive: Optional[AdaptiveInterval] = None,
+        state: Optional[SchedulerState] = None,
+        breakers: Optional[CircuitBreakers] = None,
+        crawl_depth: int = DEFAULT_CRAWL_DEPTH,
+        retry: Optional[RetryPolicy] = None,
+        fetcher: Optional[FetchScheduler] = None,
+        timings: StageTimings = NULL_TIMINGS,
+        dedup: bool = False,
+        seen: Optional[SeenIndex] = None,
+        differ: Optional[SnapshotDiffer] = None,
+        versions: Optional[VersionWriter] = None,
+        clusters: Optional[ClusterWriter] = None,
+        index: Optional[IndexWriter] = None,
+        terms: Optional[TermCountWriter] = None,
+    ):
+        self.logger = logger
+        self.jitter = jitter
+        self.adaptive = adaptive
+        self.state = state
+        self.dedup = dedup
+        self.seen = seen
+        self.differ = differ
+        self.versions = versions
+        self.clusters = clusters
+        self.index = index
+        self.terms = terms
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._writer: Optional[CSVWriter] = None
+
+        outlet_intervals = outlet_intervals or {}
+        self.jobs: List[OutletJob] = []
+        for scraper_class in scraper_classes:
+            scraper = scraper_class(logger=logger)
+            job_interval = outlet_intervals.get(
+                scraper_class, interval or scraper.POLL_INTERVAL
+            )
+            if breakers:
+                scraper.breaker = breakers.get(scraper.name)
+            if retry:
+                scraper.retry = retry
+            if fetcher:
+                scraper.fetcher = fetcher
+            scraper.max_pages = crawl_depth
+            scraper.timings = timings
+            job = OutletJob(scraper, job_interval)
+            if state:
+                state.restore(job)
+            if adaptive:
+                # Los límites pueden haber cambiado desde que se guardó el estado
+                job.interval = adaptive.clamp(job.interval)
+            self.jobs.append(job)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.jobs)), thread_name_prefix="poll"
+        )
+
+    def _get_writer(self) -> CSVWriter:
+        """Devuelve el writer del mes en curso, rotando el fichero al cambiar de mes."""
+        filename = get_monthly_filename("titulares.csv")
+        with self._lock:
+            if self._writer is None or self._writer.filename != filename:
+                self._writer = CSVWriter(filename, CSV_HEADERS, index=True)
+                self._writer.write_headers()
+            return self._writer
+
+    def _next_delay(self, interval: float) -> float:
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _adapt(self, job: OutletJob, urls: Set[str]) -> None:
+        """Recalcula el intervalo del medio a partir de las URLs de su portada."""
+        if self.adaptive and job.urls is not None:
+            entered, left, churn = self.adaptive.measure(job.urls, urls)
+            previous_interval = job.interval
+            job.interval = self.adaptive.next_interval(job.interval, churn)
+            self.logger.info(
+                f"[{job.scraper.name}] Rotación de portada: +{entered} -{left} "
+                f"({churn:.1%}), intervalo {previous_interval:.0f}s -> {job.interval:.0f}s"
+            )
+        job.urls = urls
+        if self.state:
+            self.state.update(job)
+            self.state.save()
+
+    def _poll(self, job: OutletJob) -> None:
+        try:
+            writer = self._get_writer()
+            if self.seen:
+                writer = NewOnlyWriter(writer, self.seen)
+            # Versiones e historias se calculan sobre todas las filas
+            extra_writers = [
+                w
+                for w in (self.versions, self.clusters, self.index, self.terms)
+                if w
+            ]
+            if extra_writers:
+                writer = MultiWriter(writer, *extra_writers)
+            urls: Set[str] = set()
+            total = scrape_and_write(
+                job.scraper,
+                self.logger,
+                writer,
+                dedup=self.dedup,
+                differ=self.differ,
+                urls=urls,
+            )
+            # Un sondeo fallido o vacío no dice nada sobre la rotación de la portada
+            if total:
+                with self._lock:
+                    self._adapt(job, urls)
+        except Exception as e:
+            self.logger.error(f"[{job.scraper.name}] Falló el sondeo: {e}")
+        finally:
+            with self._lock:
+                job.polls += 1
+                job.running = False
+                job.next_run = time.monotonic() + self._next_delay(job.interval)
+            self._wakeup.set()
+
+    def _dispatch_due_jobs(self) -> float:
+        """Lanza los medios pendientes y devuelve cuánto esperar hasta el próximo."""
+        now = time.monotonic()
+        wait = None
+        with self._lock:
+            for job in self.jobs:
+                if job.running:
+                    continue
+                breaker = job.scraper.breaker
+                if job.next_run <= now and breaker and breaker.is_open():
+                    # No se gasta un timeout contra un medio caído
+                    job.next_run = now + breaker.retry_in()
+                    self.logger.warning(
+                        f"[{job.scraper.name}] Circuito abierto: próximo intento "
+                        f"en {breaker.retry_in():.0f}s"
+                    )
+                if job.next_run <= now:
+                    job.running = True
+                    self._executor.submit(self._poll, job)
+                    continue
+                delay = job.next_run - now
+                wait = delay if wait is None else min(wait, delay)
+        # Si todos los medios están en curso, esperamos a que alguno termine
+        return wait if wait is not None else 60.0
+
+    def run(self) -> None:
+        """Bucle principal; bloquea hasta que se llama a stop()."""
+        self.logger.info(
+            "Servicio iniciado: "
+            + ", ".join(f"{job.scraper.name} cada {job.interval:.0f}s" for job in self.jobs)
+        )
+        try:
+            while not self._stop.is_set():
+                wait = self._dispatch_due_jobs()
+                self._wakeup.wait(timeout=wait)
+                self._wakeup.clear()
+        finally:
+            self.shutdown()
+
+    def stop(self) -> None:
+        """Solicita la parada; es seguro llamarlo desde un manejador de señales."""
+        self._stop.set()
+        self._wakeup.set()
+
+    def shutdown(self) -> None:
+        """Espera a los sondeos en curso (que vuelcan sus filas) y cierra sesiones."""
+        self.logger.info("Deteniendo servicio: esperando sondeos en curso")
+        self._executor.shutdown(wait=True)
+        for job in self.jobs:
+            job.scraper.close()
+        self.logger.info(
+            "Servicio detenido: "
+            + ", ".join(f"{job.scraper.name}={job.polls} sondeos" for job in self.jobs)
+        )
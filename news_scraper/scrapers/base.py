@@ -1,9 +1,73 @@
 from abc import ABC, abstractmethod
 import logging
-from typing import Optional, Dict, List, Any
+import time
+from contextlib import nullcontext
+from itertools import chain
+from typing import Callable, Iterator, Optional, Dict, List, Any, Tuple
 from datetime import date
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
 
+from news_scraper.fetcher import FetchScheduler, default_fetcher
+from news_scraper.utils.budget import DeadlineExceeded, OutletBudget
+from news_scraper.utils.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_transient,
+)
+from news_scraper.utils.rate_limit import RateLimitedAdapter, rate_limiter
+from news_scraper.utils.constants import (
+    DEFAULT_CRAWL_DEPTH,
+    DEFAULT_POLL_INTERVAL,
+    MAX_RESPONSE_BYTES,
+)
+from news_scraper.utils.memory import current_rss_mb
+from news_scraper.utils.timing import NULL_TIMINGS, StageTimings
+
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+class FragmentStrainer(SoupStrainer):
+    """Conserva solo los contenedores de zona indicados (con todo su contenido).
+
+    Cada regla es (etiqueta, atributo, valor): para "class" basta con que el
+    valor sea una de las clases del elemento; para el resto debe ser igual.
+    Se usa como `parse_only` para no construir el resto de la portada.
+    """
+
+    def __init__(self, *rules: Tuple[str, str, str]):
+        super().__init__()
+        self.rules = rules
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if not attrs:
+            return False
+        for tag, attr, value in self.rules:
+            if name != tag:
+                continue
+            raw = attrs.get(attr)
+            if raw is None:
+                continue
+            if attr == "class":
+                tokens = raw.split() if isinstance(raw, str) else raw
+                if value in tokens:
+                    return True
+            elif raw == value:
+                return True
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        # Texto fuera de los contenedores conservados
+        return False
+
 
 class NewsScraper(ABC):
     DEFAULT_USER_AGENT = (
@@ -12,6 +76,18 @@ class NewsScraper(ABC):
         "Chrome/91.0.4472.124 Safari/537.36"
     )
     DEFAULT_TIMEOUT = 10
+    # Intervalo de sondeo en modo servicio; cada medio puede redefinirlo
+    POLL_INTERVAL = DEFAULT_POLL_INTERVAL
+    # Codificación forzada de las respuestas (None = la que detecte requests)
+    RESPONSE_ENCODING: Optional[str] = None
+    # Tamaño máximo del cuerpo de la respuesta; lo que exceda se descarta
+    MAX_RESPONSE_BYTES = MAX_RESPONSE_BYTES
+    # Fragmentos de la portada que se construyen (None = todo el documento)
+    PARSE_ONLY: Optional[SoupStrainer] = None
+    # Páginas de listado adicionales: (ruta, zona). Se recorren con
+    # max_pages > 0, usando PAGINATION para las páginas siguientes a la primera
+    LISTING_PAGES: List[Tuple[str, str]] = []
+    PAGINATION = "{path}/page/{page}/"
 
     def __init__(
         self,
@@ -26,6 +102,21 @@ class NewsScraper(ABC):
         self.logger = logger or logging.getLogger("scraper")
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
         self.timeout = timeout
+        self.timings: StageTimings = NULL_TIMINGS
+        self.fetcher: FetchScheduler = default_fetcher
+        self.max_pages = DEFAULT_CRAWL_DEPTH
+        self.retry = RetryPolicy()
+        # Lo asigna el runner o el planificador; None = sin circuito
+        self.breaker: Optional[CircuitBreaker] = None
+        # Presupuesto de tiempo (--deadline) y motivo si se cortó el scraping
+        self.budget: Optional[OutletBudget] = None
+        self.truncated: Optional[str] = None
+        # Techo de RSS (--max-memory-mb), comprobado junto con el plazo
+        self.max_memory_mb: Optional[float] = None
+        # Zona o listado que falló: la portada obtenida está incompleta
+        self.partial: Optional[str] = None
+        # Fecha fija de los titulares al procesar capturas archivadas (WARC)
+        self.capture_date: Optional[str] = None
         self.session = requests.Session()
         self._configure_session()
 
@@ -38,11 +129,303 @@ class NewsScraper(ABC):
                 "Accept-Language": "es-ES;q=0.5",
             }
         )
+        # Todas las peticiones pasan por el limitador por host compartido
+        adapter = RateLimitedAdapter(rate_limiter)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _get_soup(self, url: str, front_page: bool = True) -> BeautifulSoup:
+        """Obtiene el contenido HTML y lo parsea con BeautifulSoup"""
+        return self._make_soup(self._fetch_html(url, front_page), front_page)
+
+    def _fetch_timeout(self, front_page: bool) -> float:
+        """Timeout de la petición, acotado por el presupuesto restante."""
+        if not self.budget:
+            return self.timeout
+        remaining = self.budget.fetch_remaining(front_page)
+        if remaining <= 0:
+            self.truncated = self.truncated or ("fetch" if front_page else "listados")
+            raise DeadlineExceeded(f"Sin tiempo para descargar en {self.name}")
+        return min(self.timeout, remaining)
+
+    def _fetch_html(self, url: str, front_page: bool = True) -> str:
+        """Descarga y decodifica una página, reintentando los fallos pasajeros."""
+        if self.breaker and not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Circuito abierto para {self.name} durante "
+                f"{self.breaker.retry_in():.0f}s más"
+            )
+
+        try:
+            attempt = 0
+            while True:
+                timeout = self._fetch_timeout(front_page)
+                try:
+                    with (
+                        rate_limiter.deadline(self.budget.fetch_remaining(front_page))
+                        if self.budget
+                        else nullcontext()
+                    ):
+                        response, body = self._download(url, timeout)
+                    break
+                except DeadlineExceeded:
+                    # El limitador no puede esperar más allá del plazo
+                    self.truncated = self.truncated or (
+                        "fetch" if front_page else "listados"
+                    )
+                    raise
+                except requests.RequestException as e:
+                    if self.budget and self.budget.fetch_remaining(front_page) <= 0:
+                        # El timeout lo impuso el plazo: no es un fallo del medio
+                        self.truncated = self.truncated or (
+                            "fetch" if front_page else "listados"
+                        )
+                        raise DeadlineExceeded(
+                            f"Plazo agotado descargando {url}: {e}"
+                        ) from e
+                    if not self.retry.should_retry(e, attempt):
+                        self.log(f"Error al obtener la página: {e}", level="error")
+                        if self.breaker and is_transient(e):
+                            self.breaker.record_failure()
+                        raise
+                    delay = self.retry.delay(attempt)
+                    if self.budget:
+                        delay = min(delay, self.budget.fetch_remaining(front_page))
+                    attempt += 1
+                    self.log(
+                        f"Reintento {attempt}/{self.retry.attempts - 1} de {url} "
+                        f"en {delay:.1f}s: {e}",
+                        level="warning",
+                    )
+                    time.sleep(delay)
+
+            if self.breaker:
+                self.breaker.record_success()
+        finally:
+            if self.breaker:
+                # Sin resultado registrado, la prueba del semiabierto queda libre
+                self.breaker.release()
+
+        with self.timings.stage(self.name, "decode"):
+            return self._decode(body, self.RESPONSE_ENCODING or response.encoding)
+
+    def _download(
+        self, url: str, timeout: float
+    ) -> Tuple[requests.Response, bytes]:
+        """Un intento de descarga: (respuesta ya cerrada, cuerpo)."""
+        with self.timings.stage(self.name, "fetch"):
+            response = self.session.get(url, timeout=timeout, stream=True)
+            try:
+                response.raise_for_status()
+                body = self._read_body(response)
+            finally:
+                # Devuelve la conexión al pool sin retener el cuerpo en la respuesta
+                response.close()
+        return response, body
+
+    def _read_body(self, response: requests.Response) -> bytes:
+        """Lee el cuerpo por bloques hasta MAX_RESPONSE_BYTES."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > self.MAX_RESPONSE_BYTES:
+                chunks.append(chunk[: len(chunk) - (size - self.MAX_RESPONSE_BYTES)])
+                self.log(
+                    f"Respuesta de {response.url} truncada a "
+                    f"{self.MAX_RESPONSE_BYTES} bytes",
+                    level="warning",
+                )
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _decode(body: bytes, encoding: Optional[str]) -> str:
+        try:
+            return body.decode(encoding or "utf-8", errors="replace")
+        except LookupError:
+            # Codificación desconocida anunciada por el servidor
+            return body.decode("utf-8", errors="replace")
+
+    def _make_soup(self, html: str, front_page: bool = True) -> BeautifulSoup:
+        """Construye el árbol de BeautifulSoup a partir del HTML ya decodificado.
+
+        PARSE_ONLY describe la portada; los listados se construyen enteros.
+        """
+        with self.timings.stage(self.name, "parse"):
+            return BeautifulSoup(
+                html, "html.parser", parse_only=self.PARSE_ONLY if front_page else None
+            )
 
     @abstractmethod
+    def _get_parsing_methods(
+        self,
+    ) -> List[Callable[[BeautifulSoup], List[Dict[str, Any]]]]:
+        """Métodos _parse_* que extraen cada zona de la portada, en orden."""
+
+    def parse_html(self, html: str) -> List[Dict[str, Any]]:
+        """Extrae los titulares de un HTML de portada ya descargado (sin red)."""
+        return self._extract(self._make_soup(html))
+
+    def _extract(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        return list(self._iter_extract(soup))
+
+    def _iter_extract(self, soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
+        """Recorre todas las zonas y destruye el árbol en cuanto terminan.
+
+        Los titulares son str independientes del árbol, así que decompose()
+        libera la portada sin esperar a que el recolector rompa sus ciclos.
+        """
+        try:
+            yield from self._iter_parsing_methods(soup, self._get_parsing_methods())
+        finally:
+            soup.decompose()
+
+    def _listing_urls(self) -> List[Tuple[str, str, int]]:
+        """(url, zona, página) de cada página de listado a recorrer."""
+        targets = []
+        for path, zone in self.LISTING_PAGES:
+            for page in range(1, self.max_pages + 1):
+                page_path = (
+                    path
+                    if page == 1
+                    else self.PAGINATION.format(path=path.rstrip("/"), page=page)
+                )
+                targets.append((urljoin(self.url, page_path), zone, page))
+        return targets
+
+    def _parse_listing_page(
+        self, soup: BeautifulSoup, zone: str, page: int
+    ) -> List[Dict[str, Any]]:
+        """Extrae los titulares de una página de listado (sección).
+
+        Solo hace falta implementarlo si el scraper declara LISTING_PAGES.
+        """
+        return []
+
+    def _limit_reached(self) -> Optional[str]:
+        """Motivo para cortar el scraping (plazo o techo de RSS), o None."""
+        if self.budget and self.budget.expired():
+            return "Plazo agotado"
+        if self.max_memory_mb:
+            rss = current_rss_mb()
+            if rss is not None and rss > self.max_memory_mb:
+                return (
+                    f"RSS {rss:.1f} MB por encima del techo de "
+                    f"{self.max_memory_mb:.0f} MB"
+                )
+        return None
+
+    def _crawl_listing_pages(self) -> List[Dict[str, Any]]:
+        return list(self._iter_listing_pages())
+
+    def _iter_listing_pages(self) -> Iterator[Dict[str, Any]]:
+        """Descarga en paralelo los listados declarados y extrae sus titulares."""
+        targets = self._listing_urls()
+        if not targets:
+            return
+        limit = self._limit_reached()
+        if limit:
+            self.truncated = self.truncated or "listados"
+            self.log(f"{limit}: se omiten los listados", level="warning")
+            return
+
+        results = self.fetcher.map(
+            lambda url: self._get_soup(url, front_page=False),
+            [url for url, _, _ in targets],
+        )
+
+        pages = zip(targets, results)
+        for i, ((url, zone, page), (soup, error)) in enumerate(pages):
+            limit = self._limit_reached()
+            if limit:
+                self.truncated = self.truncated or "listados"
+                self.log(
+                    f"{limit}: {len(targets) - i} listados sin procesar",
+                    level="warning",
+                    count=len(targets) - i,
+                )
+                break
+            if soup is None:
+                self.partial = self.partial or f"listado_{zone}"
+                self.log(f"No se pudo obtener el listado {url}: {error}", level="warning")
+                continue
+            try:
+                with self.timings.stage(self.name, "_parse_listing_page"):
+                    articles = self._parse_listing_page(soup, zone, page)
+                self.log(
+                    f"Se encontraron {len(articles)} artículos en el listado {zone} "
+                    f"(página {page})",
+                    zone=f"listado_{zone}",
+                    count=len(articles),
+                )
+            except Exception as e:
+                self.partial = self.partial or f"listado_{zone}"
+                self.log(f"Error al parsear el listado {url}: {e}", level="error")
+                continue
+            finally:
+                soup.decompose()
+            yield from articles
+
+    def _run_parsing_methods(
+        self,
+        soup: BeautifulSoup,
+        parsing_methods: List[Callable[[BeautifulSoup], List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        return list(self._iter_parsing_methods(soup, parsing_methods))
+
+    def _iter_parsing_methods(
+        self,
+        soup: BeautifulSoup,
+        parsing_methods: List[Callable[[BeautifulSoup], List[Dict[str, Any]]]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Ejecuta cada método _parse_* sobre la portada y entrega sus titulares
+        en cuanto termina la zona; un fallo no detiene al resto."""
+        for i, method in enumerate(parsing_methods):
+            limit = self._limit_reached()
+            if limit:
+                # Cancelación cooperativa: se conservan las zonas ya extraídas
+                self.truncated = self.truncated or "parse"
+                self.log(
+                    f"{limit}: {len(parsing_methods) - i} zonas sin procesar",
+                    level="warning",
+                    count=len(parsing_methods) - i,
+                )
+                break
+            try:
+                with self.timings.stage(self.name, method.__name__):
+                    articles = method(soup)
+                self.log(
+                    "%s: %d titulares",
+                    method.__name__,
+                    len(articles),
+                    level="debug",
+                    zone=method.__name__,
+                    count=len(articles),
+                )
+            except Exception as e:
+                self.partial = self.partial or method.__name__
+                self.log(f"Error en {method.__name__}: {e}", level="error")
+                continue
+            yield from articles
+
+    def iter_scrape(self) -> Iterator[Dict[str, Any]]:
+        """Realiza el scraping entregando cada titular en cuanto se extrae su zona.
+
+        Por defecto descarga la portada, recorre las zonas de
+        _get_parsing_methods() y después los listados declarados.
+        """
+        self.log(f"Inicio del scraping de {self.name}")
+        soup = self._get_soup(self.url)
+        yield from chain(self._iter_extract(soup), self._iter_listing_pages())
+        self.log("Fin del scraping")
+
     def scrape(self) -> List[Dict[str, Any]]:
         """Método principal que realiza el scraping.
 
+        Envoltorio de iter_scrape() que devuelve todos los titulares juntos.
+
         Returns:
             List[Dict[str, Any]]: Lista de diccionarios con la información de cada noticia,
                                  donde cada dict debe contener al menos:
@@ -51,17 +434,34 @@ class NewsScraper(ABC):
                                  - titular (str): Título de la noticia
                                  - url (str): URL completa de la noticia
         """
-        pass
+        return list(self.iter_scrape())
 
-    def log(self, message: str, level: str = "info") -> None:
-        """Método helper para logging consistente."""
+    def log(
+        self, message: str, *args: Any, level: str = "info", **fields: Any
+    ) -> None:
+        """Método helper para logging consistente.
+
+        Los `fields` (zone, count...) viajan como campos estructurados del
+        registro. Con `args`, el mensaje se formatea con % solo si el nivel
+        está activo, como en logging; un f-string se construye siempre.
+        """
         if self.logger:
-            log_method = getattr(self.logger, level, self.logger.info)
-            log_method(f"[{self.name}] {message}")
+            levelno = _LOG_LEVELS.get(level, logging.INFO)
+            if self.logger.isEnabledFor(levelno):
+                if args:
+                    message = message % args
+                self.logger.log(
+                    levelno,
+                    "[%s] %s",
+                    self.name,
+                    message,
+                    extra={"outlet": self.name, **fields},
+                )
 
     def get_current_date(self) -> str:
-        """Devuelve la fecha actual en formato ISO."""
-        return date.today().isoformat()
+        """Devuelve la fecha actual en formato ISO, o la de la captura archivada
+        que se está procesando."""
+        return self.capture_date or date.today().isoformat()
 
     def clean_text(self, text: str) -> str:
         """Limpia el texto eliminando espacios extras y caracteres especiales."""
@@ -1,13 +1,38 @@
 from bs4 import BeautifulSoup, Tag
-from typing import List, Dict, Optional, cast
+from itertools import chain
+from typing import Callable, Iterator, List, Dict, Optional, cast
 from urllib.parse import urljoin
 import logging
-import requests
 
-from news_scraper.scrapers.base import NewsScraper
+from news_scraper.scrapers.base import FragmentStrainer, NewsScraper
 
 
 class CerodosdostresScraper(NewsScraper):
+    # Contenedores de zona; se conservan todos los div.grid para que el
+    # selector :has() de _parse_section elija el mismo que en el documento entero
+    PARSE_ONLY = FragmentStrainer(
+        ("div", "class", "grid"),
+        ("div", "class", "apertura"),
+        ("div", "class", "relleno"),
+        ("div", "class", "bloque-prop"),
+        ("div", "class", "mas_leidas"),
+        ("div", "class", "bloque-3Notas"),
+        ("div", "class", "bloque-historiasAca"),
+        ("div", "class", "bloque-mundial"),
+        ("div", "class", "bloque_sabana"),
+        ("div", "class", "d_4Notas"),
+    )
+    # Mismas secciones que los bloques de portada de _parse_section
+    LISTING_PAGES = [
+        ("/mar-del-plata", "mar_del_plata"),
+        ("/mas-alla-de-la-ciudad", "argentina"),
+        ("/seguridad", "seguridad"),
+        ("/edicion5", "edicion5"),
+        ("/deportes", "deportes"),
+        ("/arte-espectaculos", "espectaculos"),
+    ]
+    PAGINATION = "{path}?page={page}"
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(
             name="0223",
@@ -16,16 +41,6 @@ class CerodosdostresScraper(NewsScraper):
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         )
 
-    def _get_soup(self, url: str) -> BeautifulSoup:
-        """Obtiene el contenido HTML y lo parsea con BeautifulSoup"""
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
-        except requests.RequestException as e:
-            self.log(f"Error al obtener la página: {e}", level="error")
-            raise
-
     def _parse_generic_article(
         self, article_tag: Tag, zone_name: str
     ) -> Optional[Dict[str, str]]:
@@ -98,6 +113,21 @@ class CerodosdostresScraper(NewsScraper):
         )
         return articles
 
+    def _parse_listing_page(
+        self, soup: BeautifulSoup, zone: str, page: int
+    ) -> List[Dict[str, str]]:
+        """Extrae los artículos de la página de una sección"""
+        articles: List[Dict[str, str]] = []
+        for i, article_tag in enumerate(soup.find_all("article"), 1):
+            article_tag = cast(Tag, article_tag)
+            if not article_tag.find("div", class_="nota__titulo"):
+                continue
+            article_data = self._parse_generic_article(article_tag, f"{zone}_{i}")
+            if article_data:
+                article_data["zona_portada"] = f"listado_{zone}_p{page}_{i}"
+                articles.append(article_data)
+        return articles
+
     def _parse_apertura_articles(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
         """Extrae los artículos de la sección apertura (destacados)"""
         main_title = ""
@@ -567,46 +597,45 @@ class CerodosdostresScraper(NewsScraper):
     def _parse_espectaculos_section(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
         return self._parse_section(soup, "espectaculos", "/arte-espectaculos")
 
-    def scrape(self) -> List[Dict[str, str]]:
-        """Método principal que realiza el scraping"""
+    def _get_parsing_methods(
+        self,
+    ) -> List[Callable[[BeautifulSoup], List[Dict[str, str]]]]:
+        """Métodos que extraen cada zona de la portada, en orden"""
+        # Obtener artículos de todas las secciones
+        return [
+            self._parse_apertura_articles,
+            self._parse_notas_relleno,  # contiene dos bloques de 8
+            self._parse_mar_del_plata_section,
+            self._parse_argentina_section,
+            self._parse_seguridad_section,
+            self._parse_deportes_section,
+            self._parse_propiedades_section,
+            self._parse_espectaculos_section,
+            self._parse_mas_leidas,
+            self._parse_historias_aca,
+            self._parse_edicion_5_section,
+            self._parse_bloque_3notas_sections,  # Virales y columnas
+            self._parse_bloque_sabana,  # 4 notas debajo de columnas
+            self._parse_liga_profesional,
+            self._parse_d_4notas,  # 4 notas debajo de la liga
+        ]
+
+    def iter_scrape(self) -> Iterator[Dict[str, str]]:
+        """Método principal que realiza el scraping, zona a zona"""
         self.log("Inicio del scraping de 0223")
-        titulares: List[Dict[str, str]] = []
 
         try:
-            with self:  # Usamos el context manager para manejo de recursos
-                soup = self._get_soup(self.url)
-
-                # Obtener artículos de todas las secciones
-                parsing_methods = [
-                    self._parse_apertura_articles,
-                    self._parse_notas_relleno,  # contiene dos bloques de 8
-                    self._parse_mar_del_plata_section,
-                    self._parse_argentina_section,
-                    self._parse_seguridad_section,
-                    self._parse_deportes_section,
-                    self._parse_propiedades_section,
-                    self._parse_espectaculos_section,
-                    self._parse_mas_leidas,
-                    self._parse_historias_aca,
-                    self._parse_edicion_5_section,
-                    self._parse_bloque_3notas_sections,  # Virales y columnas
-                    self._parse_bloque_sabana,  # 4 notas debajo de columnas
-                    self._parse_liga_profesional,
-                    self._parse_d_4notas,  # 4 notas debajo de la liga
-                ]
-
-                for method in parsing_methods:
-                    try:
-                        titulares.extend(method(soup))
-                    except Exception as e:
-                        self.log(f"Error en {method.__name__}: {e}", level="error")
-                        continue
+            soup = self._get_soup(self.url)
+
+            total = 0
+            for titular in chain(self._iter_extract(soup), self._iter_listing_pages()):
+                total += 1
+                yield titular
 
-                self.log(f"Total de titulares encontrados: {len(titulares)}")
+            self.log(f"Total de titulares encontrados: {total}")
 
         except Exception as e:
             self.log(f"Error durante el scraping: {e}", level="error")
             raise
 
         self.log("Fin del scraping")
-        return titulares
@@ -1,14 +1,21 @@
 import logging
 import re
-from typing import List, Dict, Optional, Any
+from itertools import chain
+from typing import Callable, Iterator, List, Dict, Optional, Any
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup, Tag
-import requests
 
 from news_scraper.scrapers.base import NewsScraper
 
 
 class LaCapitalScraper(NewsScraper):
+    RESPONSE_ENCODING = "utf-8"
+    LISTING_PAGES = [
+        ("policiales/", "Policiales"),
+        ("la-ciudad/", "La Ciudad"),
+        ("el-mundo/", "El Mundo"),
+        ("interes-general/", "Interés General"),
+    ]
 
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(
@@ -18,17 +25,6 @@ class LaCapitalScraper(NewsScraper):
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         )
 
-    def _get_soup(self, url: str) -> BeautifulSoup:
-        """Obtiene el contenido HTML y lo parsea con BeautifulSoup"""
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            response.encoding = "utf-8"
-            return BeautifulSoup(response.text, "html.parser")
-        except requests.RequestException as e:
-            self.log(f"Error al obtener la página: {e}", level="error")
-            raise
-
     def _extract_section_from_url(self, url: str) -> str:
         """Extrae la categoría temática de la URL del artículo"""
         try:
@@ -444,6 +440,19 @@ class LaCapitalScraper(NewsScraper):
         )
         return articles
 
+    def _parse_listing_page(
+        self, soup: BeautifulSoup, zone: str, page: int
+    ) -> List[Dict[str, Any]]:
+        """Extrae los artículos de la página de una sección"""
+        articles = []
+        for article in soup.find_all("article"):
+            article_data = self._extract_article_data(
+                article, f"Listado {zone} - Página {page}"
+            )
+            if article_data:
+                articles.append(article_data)
+        return articles
+
     def _extract_article_data(
         self, article: Tag, zone_name: str
     ) -> Optional[Dict[str, Any]]:
@@ -468,8 +477,12 @@ class LaCapitalScraper(NewsScraper):
             # WARN: Cambios, medio raro no anda
             category_tag = article.find("h3", class_="nota__categoria")
             if category_tag:
-                print("category_tag len => ", len(category_tag))
-                print("category_tag => ", category_tag)
+                self.log(
+                    "category_tag (%d): %s",
+                    len(category_tag),
+                    category_tag,
+                    level="debug",
+                )
                 if len(category_tag) > 30:
                     seccion = "Ranking"
                 else:
@@ -489,25 +502,34 @@ class LaCapitalScraper(NewsScraper):
             self.log(f"Error al procesar artículo en {zone_name}: {e}", level="error")
             return None
 
-    def scrape(self) -> List[Dict[str, Any]]:
-        """Método principal que realiza el scraping de La Capital"""
+    def _get_parsing_methods(
+        self,
+    ) -> List[Callable[[BeautifulSoup], List[Dict[str, Any]]]]:
+        """Métodos que extraen cada zona de la portada, en orden"""
+        return [
+            self._parse_principal_section,
+            self._parse_regular_sections,
+            self._parse_el_pais_section,
+            self._parse_tecnologia_section,
+            self._parse_deportes_section,
+            self._parse_espectaculos_section,
+            self._parse_ranking_section,
+        ]
+
+    def iter_scrape(self) -> Iterator[Dict[str, Any]]:
+        """Método principal que realiza el scraping de La Capital, zona a zona"""
         self.log("Inicio del scraping de La Capital")
-        news = []
 
         try:
             soup = self._get_soup(self.url)
 
-            news.extend(self._parse_principal_section(soup))
-            news.extend(self._parse_regular_sections(soup))
-            news.extend(self._parse_el_pais_section(soup))
-            news.extend(self._parse_tecnologia_section(soup))
-            news.extend(self._parse_deportes_section(soup))
-            news.extend(self._parse_espectaculos_section(soup))
-            news.extend(self._parse_ranking_section(soup))
+            total = 0
+            for news in chain(self._iter_extract(soup), self._iter_listing_pages()):
+                total += 1
+                yield news
 
-            self.log(f"Total de noticias encontradas: {len(news)}", level="info")
-            return news
+            self.log(f"Total de noticias encontradas: {total}", level="info")
 
         except Exception as e:
+            # Las noticias ya entregadas se conservan
             self.log(f"Error en el scraping: {e}", level="error")
-            return []
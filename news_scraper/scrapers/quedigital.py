@@ -1,13 +1,28 @@
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from itertools import chain
+from typing import Callable, Iterator, List, Dict, Optional
 from urllib.parse import urljoin
 import logging
-import requests
 
-from news_scraper.scrapers.base import NewsScraper
+from news_scraper.scrapers.base import FragmentStrainer, NewsScraper
 
 
 class QueDigitalScraper(NewsScraper):
+    RESPONSE_ENCODING = "utf-8"
+    # Cada zona se busca desde su propio contenedor: el resto no se construye
+    PARSE_ONLY = FragmentStrainer(
+        ("div", "id", "featured"),
+        ("div", "class", "super-destacada"),
+        ("section", "class", "recent-module"),
+        ("div", "class", "especiales"),
+        ("div", "id", "sidebar-grupo-doble-inferior"),
+        ("div", "id", "sidebar-grupo-cuadruple-inferior"),
+        ("div", "id", "sidebar-grupo-triple-inferior"),
+        ("div", "class", "popular-posts"),
+        ("section", "class", "recent-deportes"),
+        ("section", "class", "recent-cultura"),
+    )
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(
             name="QueDigital",
@@ -25,17 +40,6 @@ class QueDigitalScraper(NewsScraper):
         # print(f"Requests version: {requests.__version__}")
         # print(f"Session headers: {self.session.headers}")
 
-    def _get_soup(self, url: str) -> BeautifulSoup:
-        """Obtiene el contenido HTML y lo parsea con BeautifulSoup"""
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            response.encoding = "utf-8"
-            return BeautifulSoup(response.text, "html.parser")
-        except requests.RequestException as e:
-            self.log(f"Error al obtener la página: {e}", level="error")
-            raise
-
     def _extract_section_from_url(self, url: str) -> str:
         """Extrae la categoría temática de la URL del artículo"""
         try:
@@ -464,40 +468,39 @@ class QueDigitalScraper(NewsScraper):
         self.log(f"Se encontraron {len(articles)} artículos en cultura", level="info")
         return articles
 
-    def scrape(self) -> List[Dict]:
-        """Método principal que realiza el scraping"""
+    def _get_parsing_methods(
+        self,
+    ) -> List[Callable[[BeautifulSoup], List[Dict]]]:
+        """Métodos que extraen cada zona de la portada, en orden"""
+        return [
+            self._parse_featured_articles,
+            self._parse_recent_articles,
+            self._parse_special_articles,
+            self._parse_superfeatured_articles,
+            self._parse_double_inferior_articles,
+            self._parse_quadruple_inferior_articles,
+            self._parse_triple_inferior_articles,
+            self._parse_mas_vistas_articles,
+            self._parse_deportes_articles,
+            self._parse_cultura_articles,
+        ]
+
+    def iter_scrape(self) -> Iterator[Dict]:
+        """Método principal que realiza el scraping, zona a zona"""
         self.log("Inicio del scraping de QueDigital")
-        titulares = []
 
         try:
-            with self:  # Usamos el context manager
-                soup = self._get_soup(self.url)
-
-                parsing_methods = [
-                    self._parse_featured_articles,
-                    self._parse_recent_articles,
-                    self._parse_special_articles,
-                    self._parse_superfeatured_articles,
-                    self._parse_double_inferior_articles,
-                    self._parse_quadruple_inferior_articles,
-                    self._parse_triple_inferior_articles,
-                    self._parse_mas_vistas_articles,
-                    self._parse_deportes_articles,
-                    self._parse_cultura_articles,
-                ]
-
-                for method in parsing_methods:
-                    try:
-                        titulares.extend(method(soup))
-                    except Exception as e:
-                        self.log(f"Error en {method.__name__}: {e}", level="error")
-                        continue
+            soup = self._get_soup(self.url)
+
+            total = 0
+            for titular in chain(self._iter_extract(soup), self._iter_listing_pages()):
+                total += 1
+                yield titular
 
-                self.log(f"Total de titulares encontrados: {len(titulares)}")
+            self.log(f"Total de titulares encontrados: {total}")
 
         except Exception as e:
             self.log(f"Error durante el scraping: {e}", level="error")
             raise
 
         self.log("Fin del scraping")
-        return titulares
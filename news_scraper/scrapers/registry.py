@@ -0,0 +1,105 @@
+import importlib
+from importlib.metadata import entry_points
+from typing import Dict, Iterable, List, Optional, Type, Union
+
+from news_scraper.scrapers.base import NewsScraper
+
+# Grupo de entry points para scrapers de terceros, p. ej. en su pyproject.toml:
+#   [project.entry-points."news_scraper.scrapers"]
+#   mdphoy = "mdphoy_scraper:MdpHoyScraper"
+ENTRY_POINT_GROUP = "news_scraper.scrapers"
+
+# Scrapers incluidos; se importan solo cuando se seleccionan
+BUILTIN_SCRAPERS: Dict[str, str] = {
+    "quedigital": "news_scraper.scrapers.quedigital:QueDigitalScraper",
+    "0223": "news_scraper.scrapers.cerodosdostres:CerodosdostresScraper",
+    "lacapital": "news_scraper.scrapers.lacapital:LaCapitalScraper",
+}
+
+
+class ScraperRegistry:
+    """Registro de subclases de NewsScraper por nombre corto.
+
+    Guarda referencias "modulo:Clase" (o entry points) y solo importa el
+    módulo de un scraper cuando se pide con load(), de modo que una ejecución
+    parcial (--only 0223) no importa el resto.
+    """
+
+    def __init__(self, discover_plugins: bool = True):
+        self._targets: Dict[str, Union[str, object]] = dict(BUILTIN_SCRAPERS)
+        self._loaded: Dict[str, Type[NewsScraper]] = {}
+        if discover_plugins:
+            self.discover()
+
+    def discover(self) -> None:
+        """Añade los scrapers publicados por paquetes instalados (sin importarlos)."""
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            self._targets[entry_point.name.lower()] = entry_point
+
+    def register(
+        self, name: str, target: Union[str, Type[NewsScraper]]
+    ) -> None:
+        """Registra un scraper como "modulo:Clase" o directamente como clase."""
+        name = name.lower()
+        if isinstance(target, str):
+            self._targets[name] = target
+            self._loaded.pop(name, None)
+        else:
+            self._targets[name] = f"{target.__module__}:{target.__qualname__}"
+            self._loaded[name] = target
+
+    def names(self) -> List[str]:
+        return list(self._targets)
+
+    def load(self, name: str) -> Type[NewsScraper]:
+        name = name.lower()
+        if name in self._loaded:
+            return self._loaded[name]
+        if name not in self._targets:
+            raise KeyError(
+                f"Scraper desconocido '{name}'. Disponibles: {', '.join(self.names())}"
+            )
+
+        target = self._targets[name]
+        if isinstance(target, str):
+            module_name, _, class_name = target.partition(":")
+            scraper_class = getattr(importlib.import_module(module_name), class_name)
+        else:
+            scraper_class = target.load()  # type: ignore[attr-defined]
+
+        if not (
+            isinstance(scraper_class, type) and issubclass(scraper_class, NewsScraper)
+        ):
+            raise TypeError(f"'{name}' no es una subclase de NewsScraper")
+        self._loaded[name] = scraper_class
+        return scraper_class
+
+    def select(
+        self,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """Nombres a ejecutar, en orden de registro, tras aplicar --only/--exclude."""
+        only = [name.lower() for name in only or []]
+        exclude = [name.lower() for name in exclude or []]
+        unknown = [name for name in only + exclude if name not in self._targets]
+        if unknown:
+            raise KeyError(
+                f"Scrapers desconocidos: {', '.join(unknown)}. "
+                f"Disponibles: {', '.join(self.names())}"
+            )
+        return [
+            name
+            for name in self._targets
+            if (not only or name in only) and name not in exclude
+        ]
+
+    def load_selected(
+        self,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> List[Type[NewsScraper]]:
+        return [self.load(name) for name in self.select(only, exclude)]
+
+
+registry = ScraperRegistry()
@@ -0,0 +1,387 @@
+import glob
+import hashlib
+import os
+from datetime import date
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from news_scraper.importer import normalize_date
+from news_scraper.utils.constants import ARCHIVE_PATTERN, STATS_CACHE_DIR
+from news_scraper.utils.csv_reader import iter_records, parse_record
+from news_scraper.utils.text import index_terms
+from news_scraper.utils.urls import canonicalize_url
+
+# Columnas de texto codificadas con diccionario (código entero + vocabulario)
+ENCODED_COLUMNS = ("medio", "seccion", "zona_portada")
+
+# Bytes previos al offset guardados para comprobar que el CSV no se reescribió
+_CHECK_BYTES = 256
+
+
+def url_hash(url: str) -> int:
+    digest = hashlib.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little", signed=True)
+
+
+class Columns:
+    """Filas del archivo en arrays de NumPy.
+
+    `day` es el número de día (días desde 1970-01-01), `url` un hash de 64
+    bits de la URL canónica, cada columna de ENCODED_COLUMNS un array de
+    códigos con su vocabulario ordenado en `<columna>_vocab`, y los términos
+    de cada titular van en formato CSR (`terms_indptr`, `terms`, `terms_vocab`).
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+
+    def __len__(self) -> int:
+        return len(self.arrays["day"])
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+    @classmethod
+    def encode(
+        cls, rows: List[Dict[str, str]], row_terms: Optional[List[List[str]]] = None
+    ) -> "Columns":
+        """`row_terms` son los términos de cada titular si ya se calcularon."""
+        arrays = {
+            "day": np.array(
+                [row["fecha"] for row in rows], dtype="datetime64[D]"
+            ).astype(np.int32),
+            "url": np.array([url_hash(row["url"]) for row in rows], dtype=np.int64),
+        }
+        for column in ENCODED_COLUMNS:
+            values = np.array([row[column] for row in rows], dtype=str)
+            vocab, codes = np.unique(values, return_inverse=True)
+            arrays[f"{column}_vocab"] = vocab
+            arrays[column] = codes.astype(np.int32).reshape(-1)
+
+        if row_terms is None:
+            row_terms = [index_terms(row["titular"]) for row in rows]
+        flat = np.array([term for terms in row_terms for term in terms], dtype=str)
+        vocab, codes = np.unique(flat, return_inverse=True)
+        arrays["terms_vocab"] = vocab
+        arrays["terms"] = codes.astype(np.int32).reshape(-1)
+        arrays["terms_indptr"] = np.concatenate(
+            ([0], np.cumsum([len(terms) for terms in row_terms], dtype=np.int64))
+        )
+        return cls(arrays)
+
+    @classmethod
+    def concat(cls, parts: List["Columns"]) -> "Columns":
+        """Une varias particiones fusionando sus vocabularios."""
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.encode([])
+        if len(parts) == 1:
+            return parts[0]
+        arrays = {
+            "day": np.concatenate([part["day"] for part in parts]),
+            "url": np.concatenate([part["url"] for part in parts]),
+        }
+        for column in ENCODED_COLUMNS + ("terms",):
+            arrays[f"{column}_vocab"], arrays[column] = _merge_dictionaries(
+                parts, column
+            )
+        offsets = np.cumsum([0] + [len(part["terms"]) for part in parts[:-1]])
+        arrays["terms_indptr"] = np.concatenate(
+            [[0]]
+            + [
+                part["terms_indptr"][1:] + offset
+                for part, offset in zip(parts, offsets)
+            ]
+        )
+        return cls(arrays)
+
+    def save(self, filename: str, **meta: Any) -> None:
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        tmp_filename = f"{filename}.tmp.npz"
+        np.savez(tmp_filename, **self.arrays, **{k: np.array(v) for k, v in meta.items()})
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(cls, filename: str) -> Tuple["Columns", Dict[str, np.ndarray]]:
+        """Devuelve las columnas y los metadatos guardados junto a ellas."""
+        with np.load(filename, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        meta = {key: arrays.pop(key) for key in list(arrays) if key.startswith("meta_")}
+        return cls(arrays), meta
+
+
+def _merge_dictionaries(
+    parts: List[Columns], column: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    vocab = np.unique(np.concatenate([part[f"{column}_vocab"] for part in parts]))
+    codes = [
+        np.searchsorted(vocab, part[f"{column}_vocab"]).astype(np.int32)[part[column]]
+        for part in parts
+    ]
+    return vocab, np.concatenate(codes)
+
+
+class Partition:
+    """Un CSV mensual del archivo con caché de sus días cerrados.
+
+    Los días anteriores a hoy ya no cambian: sus columnas codificadas se
+    guardan en `cache_dir` junto con el offset del CSV en que terminan. Al
+    volver a cargar, solo se leen los bytes posteriores (el día en curso), y
+    los días que se cerraron desde la última vez se añaden a la caché. Las
+    fechas se normalizan a ISO; las filas con fechas que no se reconocen se
+    descartan y se cuentan en `invalid_rows`.
+    """
+
+    def __init__(self, filename: str, cache_dir: str = STATS_CACHE_DIR):
+        self.filename = filename
+        self.cache_filename = os.path.join(
+            cache_dir, os.path.basename(filename) + ".npz"
+        )
+        self.cached_rows = 0
+        self.parsed_rows = 0
+        self.invalid_rows = 0
+
+    def _load_cache(self, file: IO[bytes]) -> Tuple[Optional[Columns], int]:
+        if not os.path.exists(self.cache_filename):
+            return None, 0
+        try:
+            closed, meta = Columns.load(self.cache_filename)
+        except (OSError, ValueError, KeyError):
+            return None, 0
+        offset = int(meta["meta_offset"])
+        # Si el CSV se reescribió (no solo creció), la caché no sirve
+        file.seek(max(0, offset - _CHECK_BYTES))
+        check = file.read(min(offset, _CHECK_BYTES))
+        if check != meta["meta_check"].tobytes():
+            return None, 0
+        return closed, offset
+
+    def save(self, closed: Columns, file: IO[bytes], offset: int) -> None:
+        """Guarda en la caché las filas de días cerrados, que terminan en `offset`."""
+        file.seek(max(0, offset - _CHECK_BYTES))
+        check = file.read(min(offset, _CHECK_BYTES))
+        closed.save(
+            self.cache_filename,
+            meta_offset=offset,
+            meta_check=np.frombuffer(check, dtype=np.uint8),
+        )
+
+    def load(self, today: Optional[date] = None) -> Columns:
+        today_iso = (today or date.today()).isoformat()
+        with open(self.filename, "rb") as file:
+            header_end, header = next(iter_records(file, 0), (0, b""))
+            headers = parse_record(header)
+
+            closed, offset = self._load_cache(file)
+            if closed is None:
+                offset = header_end
+            rows = []
+            ends = []
+            self.invalid_rows = 0
+            for end, record in iter_records(file, offset):
+                values = parse_record(record)
+                if len(values) != len(headers):
+                    continue
+                row = dict(zip(headers, values))
+                fecha = normalize_date(row["fecha"])
+                if fecha is None:
+                    self.invalid_rows += 1
+                    continue
+                row["fecha"] = fecha
+                rows.append(row)
+                ends.append(end)
+            self.parsed_rows = len(rows)
+
+            # Prefijo de filas de días cerrados (el CSV crece en orden de fecha)
+            split = 0
+            while split < len(rows) and rows[split]["fecha"] < today_iso:
+                split += 1
+            if split:
+                closed = Columns.concat(
+                    [closed or Columns.encode([]), Columns.encode(rows[:split])]
+                )
+                self.save(closed, file, ends[split - 1])
+
+        self.cached_rows = len(closed) if closed is not None else 0
+        return Columns.concat([closed or Columns.encode([]), Columns.encode(rows[split:])])
+
+
+class CoverageStats:
+    """Agregados de cobertura sobre todo el archivo de CSV mensuales.
+
+    Carga cada partición (con su caché de días cerrados), une las columnas y
+    calcula los informes con operaciones vectorizadas de NumPy sobre los
+    códigos enteros, sin recorrer las filas en Python.
+    """
+
+    def __init__(
+        self,
+        pattern: str = ARCHIVE_PATTERN,
+        cache_dir: str = STATS_CACHE_DIR,
+        today: Optional[date] = None,
+    ):
+        self.pattern = pattern
+        self.cache_dir = cache_dir
+        self.today = today
+        self.partitions: List[Partition] = []
+        self.columns = Columns.encode([])
+
+    def load(self) -> "CoverageStats":
+        self.partitions = [
+            Partition(filename, self.cache_dir)
+            for filename in sorted(glob.glob(self.pattern))
+        ]
+        self.columns = Columns.concat(
+            [partition.load(self.today) for partition in self.partitions]
+        )
+        return self
+
+    @property
+    def cached_rows(self) -> int:
+        return sum(partition.cached_rows for partition in self.partitions)
+
+    @property
+    def parsed_rows(self) -> int:
+        return sum(partition.parsed_rows for partition in self.partitions)
+
+    @property
+    def invalid_rows(self) -> int:
+        return sum(partition.invalid_rows for partition in self.partitions)
+
+    def _mask(
+        self, date_from: str = "", date_to: str = "", medios: Optional[List[str]] = None
+    ) -> np.ndarray:
+        """Filas dentro del rango de fechas (AAAA-MM o AAAA-MM-DD) y de los medios."""
+        day = self.columns["day"]
+        mask = np.ones(len(day), dtype=bool)
+        if date_from:
+            mask &= day >= _day_number(date_from, end=False)
+        if date_to:
+            mask &= day <= _day_number(date_to, end=True)
+        if medios:
+            vocab = np.char.lower(self.columns["medio_vocab"])
+            wanted = np.flatnonzero(np.isin(vocab, [medio.lower() for medio in medios]))
+            mask &= np.isin(self.columns["medio"], wanted)
+        return mask
+
+    def section_shares(
+        self, date_from: str = "", date_to: str = "", medios: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Titulares y proporción de cada sección por medio y día."""
+        mask = self._mask(date_from, date_to, medios)
+        n_medios = len(self.columns["medio_vocab"])
+        n_secciones = len(self.columns["seccion_vocab"])
+        group = (
+            self.columns["day"][mask].astype(np.int64) * n_medios
+            + self.columns["medio"][mask]
+        ) * n_secciones + self.columns["seccion"][mask]
+        keys, counts = np.unique(group, return_counts=True)
+        _, totals_index = np.unique(keys // n_secciones, return_inverse=True)
+        totals = np.bincount(totals_index, weights=counts)
+        shares = counts / totals[totals_index]
+
+        days = (keys // n_secciones // n_medios).astype("datetime64[D]")
+        medio = self.columns["medio_vocab"][(keys // n_secciones) % n_medios]
+        seccion = self.columns["seccion_vocab"][keys % n_secciones]
+        return [
+            {
+                "fecha": str(days[i]),
+                "medio": str(medio[i]),
+                "seccion": str(seccion[i]),
+                "titulares": int(counts[i]),
+                "proporcion": round(float(shares[i]), 4),
+            }
+            for i in range(len(keys))
+        ]
+
+    def dwell_times(
+        self, date_from: str = "", date_to: str = "", medios: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Días que cada noticia permanece en portada (del primero al último en
+        que aparece), resumidos por medio."""
+        mask = self._mask(date_from, date_to, medios)
+        urls = self.columns["url"][mask]
+        days = self.columns["day"][mask]
+        medio = self.columns["medio"][mask]
+        if not len(urls):
+            return []
+        order = np.lexsort((days, urls))
+        urls, days, medio = urls[order], days[order], medio[order]
+        starts = np.flatnonzero(np.concatenate(([True], urls[1:] != urls[:-1])))
+        ends = np.concatenate((starts[1:], [len(urls)])) - 1
+        dwell = days[ends] - days[starts] + 1
+        story_medio = medio[starts]
+
+        result = []
+        for code in np.unique(story_medio):
+            values = dwell[story_medio == code]
+            result.append(
+                {
+                    "medio": str(self.columns["medio_vocab"][code]),
+                    "noticias": int(len(values)),
+                    "dias_media": round(float(values.mean()), 2),
+                    "dias_mediana": float(np.median(values)),
+                    "dias_p90": float(np.percentile(values, 90)),
+                    "dias_max": int(values.max()),
+                }
+            )
+        return result
+
+    def _rows_with_terms(self, topic: str) -> np.ndarray:
+        """Índices de las filas cuyo titular contiene todos los términos del tema."""
+        vocab = self.columns["terms_vocab"]
+        indptr = self.columns["terms_indptr"]
+        rows: Optional[np.ndarray] = None
+        for term in index_terms(topic):
+            code = np.searchsorted(vocab, term)
+            if code >= len(vocab) or vocab[code] != term:
+                return np.array([], dtype=np.int64)
+            positions = np.flatnonzero(self.columns["terms"] == code)
+            found = np.searchsorted(indptr, positions, side="right") - 1
+            rows = found if rows is None else np.intersect1d(rows, found)
+        return rows if rows is not None else np.array([], dtype=np.int64)
+
+    def top_zones(
+        self,
+        topic: str,
+        top: int = 10,
+        date_from: str = "",
+        date_to: str = "",
+        medios: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Zonas de portada donde más aparece un tema, por medio."""
+        rows = self._rows_with_terms(topic)
+        rows = rows[self._mask(date_from, date_to, medios)[rows]]
+        n_zonas = len(self.columns["zona_portada_vocab"])
+        group = self.columns["medio"][rows].astype(np.int64) * n_zonas + self.columns[
+            "zona_portada"
+        ][rows]
+        keys, counts = np.unique(group, return_counts=True)
+
+        result = []
+        for code in np.unique(keys // n_zonas):
+            selected = keys // n_zonas == code
+            zone_counts = counts[selected]
+            zones = keys[selected] % n_zonas
+            total = zone_counts.sum()
+            for i in np.argsort(-zone_counts, kind="stable")[:top]:
+                result.append(
+                    {
+                        "medio": str(self.columns["medio_vocab"][code]),
+                        "zona_portada": str(self.columns["zona_portada_vocab"][zones[i]]),
+                        "titulares": int(zone_counts[i]),
+                        "proporcion": round(float(zone_counts[i] / total), 4),
+                    }
+                )
+        return result
+
+
+def _day_number(value: str, end: bool) -> int:
+    """Número de día de AAAA-MM-DD, o del primer/último día de AAAA-MM."""
+    if len(value) == 7:
+        month = np.datetime64(value, "M")
+        if end:
+            month = month + 1
+        return int((month.astype("datetime64[D]") - (1 if end else 0)).astype(np.int64))
+    return int(np.datetime64(value, "D").astype(np.int64))
@@ -0,0 +1,58 @@
+import time
+from typing import Optional
+
+from news_scraper.utils.constants import DEADLINE_RESERVE, FETCH_BUDGET_SHARE
+
+
+class DeadlineExceeded(Exception):
+    """Se agotó el presupuesto de tiempo del medio."""
+
+
+class OutletBudget:
+    """Presupuesto de tiempo de un medio, en segundos desde su arranque.
+
+    La descarga de la portada puede consumir hasta `fetch_share` del total; el
+    resto queda para parsear zonas y recorrer listados. Los scrapers lo
+    consultan entre etapas (cancelación cooperativa): lo ya extraído se
+    conserva y se escribe.
+    """
+
+    def __init__(self, seconds: float, fetch_share: float = FETCH_BUDGET_SHARE):
+        self.seconds = seconds
+        now = time.monotonic()
+        self.deadline = now + seconds
+        self.fetch_deadline = now + seconds * fetch_share
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def fetch_remaining(self, front_page: bool = True) -> float:
+        """Tiempo disponible para una descarga (los listados usan el total)."""
+        limit = self.fetch_deadline if front_page else self.deadline
+        return max(0.0, limit - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.deadline
+
+
+class RunBudget:
+    """Plazo total de una ejecución, repartido entre los medios pendientes.
+
+    Cada medio recibe la parte proporcional del tiempo que queda, así que lo
+    que no gasta un medio rápido lo aprovechan los siguientes. Se reserva
+    `reserve` segundos al final para volcar filas y resúmenes.
+    """
+
+    def __init__(self, seconds: float, reserve: float = DEADLINE_RESERVE):
+        self.seconds = seconds
+        self.deadline = time.monotonic() + max(0.0, seconds - reserve)
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def for_outlet(self, pending_outlets: int) -> Optional[OutletBudget]:
+        """Presupuesto del siguiente medio (None si ya no queda tiempo)."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            return None
+        return OutletBudget(remaining / max(1, pending_outlets))
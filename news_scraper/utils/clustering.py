@@ -0,0 +1,295 @@
+import hashlib
+import operator
+import os
+import random
+import sqlite3
+import threading
+import time
+from array import array
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from news_scraper.utils.constants import (
+    CLUSTER_BANDS,
+    CLUSTER_HEADERS,
+    CLUSTER_NUM_PERM,
+    CLUSTER_SHINGLE_SIZE,
+    CLUSTER_THRESHOLD,
+    CLUSTER_WINDOW_DAYS,
+    CLUSTERS_DB_FILENAME,
+    get_monthly_filename,
+)
+from news_scraper.utils.csv_writer import CSVWriter
+from news_scraper.utils.text import STOPWORDS, tokenize
+from news_scraper.utils.urls import canonicalize_url
+
+_MASK64 = (1 << 64) - 1
+# Segundos entre commits: cada inserción confirmada por separado domina el coste
+_COMMIT_INTERVAL = 5.0
+
+Signature = Tuple[int, ...]
+
+
+def shingles(text: str, size: int = CLUSTER_SHINGLE_SIZE) -> Set[int]:
+    """Fragmentos de `size` caracteres de cada palabra significativa, como hashes.
+
+    Las palabras se rodean de espacios y no se cruzan entre sí: dos titulares
+    con las mismas palabras en otro orden comparten casi todos los fragmentos.
+    """
+    result = set()
+    for word in tokenize(text):
+        if word in STOPWORDS:
+            continue
+        padded = f" {word} "
+        pieces = (
+            (padded,)
+            if len(padded) <= size
+            else (padded[i : i + size] for i in range(len(padded) - size + 1))
+        )
+        for piece in pieces:
+            digest = hashlib.blake2b(piece.encode("utf-8"), digest_size=8).digest()
+            result.add(int.from_bytes(digest, "little"))
+    return result
+
+
+class MinHasher:
+    """Firmas MinHash de `num_perm` funciones hash universales (a·x + b mod 2^64).
+
+    La fracción de posiciones iguales entre dos firmas estima la similitud de
+    Jaccard de los conjuntos de fragmentos. La semilla fija hace que las
+    firmas guardadas sigan siendo comparables entre ejecuciones.
+    """
+
+    def __init__(self, num_perm: int = CLUSTER_NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [
+            (rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(num_perm)
+        ]
+
+    def signature(self, pieces: Set[int]) -> Signature:
+        if not pieces:
+            return ()
+        # Se guardan los 32 bits altos, los de mejor calidad en a·x + b
+        return tuple(
+            min([(a * piece + b) & _MASK64 for piece in pieces]) >> 32
+            for a, b in self._params
+        )
+
+    @staticmethod
+    def similarity(first: Signature, second: Signature) -> float:
+        if not first or not second:
+            return 0.0
+        return sum(map(operator.eq, first, second)) / len(first)
+
+
+class StoryClusterer:
+    """Asigna a cada noticia nueva el identificador de su historia.
+
+    Las firmas MinHash de los titulares se indexan por bandas (LSH): dos
+    titulares que coinciden en todas las filas de alguna banda son candidatos
+    y solo esos se comparan, en lugar de cada titular contra todos. La noticia
+    se une a la historia de la candidata más parecida si supera `threshold`;
+    si no, abre una historia nueva. Solo se buscan candidatas en los últimos
+    `window_days` días, así que el coste por titular no crece con el archivo.
+
+    Las asignaciones son definitivas y se guardan en SQLite: una URL ya
+    agrupada conserva su historia en ejecuciones posteriores.
+    """
+
+    def __init__(
+        self,
+        filename: str = CLUSTERS_DB_FILENAME,
+        num_perm: int = CLUSTER_NUM_PERM,
+        bands: int = CLUSTER_BANDS,
+        threshold: float = CLUSTER_THRESHOLD,
+        window_days: int = CLUSTER_WINDOW_DAYS,
+    ):
+        if num_perm % bands:
+            raise ValueError(
+                f"num_perm ({num_perm}) debe ser múltiplo de bands ({bands})"
+            )
+        self.filename = filename
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.threshold = threshold
+        self.window_days = window_days
+        self.new_stories = 0
+        self.joined = 0
+        self.cross_outlet = 0
+        self._lock = threading.Lock()
+        # Índice en memoria de la ventana:
+        # banda -> URLs, URL -> (historia, medio, firma) y fecha -> URLs
+        self._buckets: Dict[int, List[str]] = {}
+        self._stories: Dict[str, Tuple[int, str, Signature]] = {}
+        self._by_day: Dict[str, List[str]] = {}
+        self._latest = ""
+        self._last_commit = time.monotonic()
+
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self._db = sqlite3.connect(filename, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS stories ("
+            "url TEXT PRIMARY KEY, medio TEXT, fecha TEXT, cluster INTEGER, "
+            "signature BLOB"
+            ") WITHOUT ROWID"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS stories_fecha ON stories (fecha)")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS stories_cluster ON stories (cluster)"
+        )
+        (last,) = self._db.execute("SELECT MAX(cluster) FROM stories").fetchone()
+        self._next_cluster = (last or 0) + 1
+        self._load_window()
+
+    def _load_window(self) -> None:
+        (latest,) = self._db.execute("SELECT MAX(fecha) FROM stories").fetchone()
+        if not latest:
+            return
+        self._latest = latest
+        for url, medio, fecha, cluster, blob in self._db.execute(
+            "SELECT url, medio, fecha, cluster, signature FROM stories "
+            "WHERE fecha >= ?",
+            (self._cutoff(latest),),
+        ):
+            self._index(url, medio, fecha, cluster, tuple(array("I", blob)))
+
+    def _cutoff(self, fecha: str) -> str:
+        cutoff = date.fromisoformat(fecha) - timedelta(days=self.window_days)
+        return cutoff.isoformat()
+
+    def _band_keys(self, signature: Signature) -> List[int]:
+        rows = self.rows_per_band
+        return [
+            hash((band, signature[band * rows : (band + 1) * rows]))
+            for band in range(self.bands)
+        ]
+
+    def _index(
+        self, url: str, medio: str, fecha: str, cluster: int, signature: Signature
+    ) -> None:
+        self._stories[url] = (cluster, medio, signature)
+        self._by_day.setdefault(fecha, []).append(url)
+        for key in self._band_keys(signature) if signature else ():
+            self._buckets.setdefault(key, []).append(url)
+
+    def _advance(self, fecha: str) -> None:
+        """Saca del índice los días que quedaron fuera de la ventana."""
+        if fecha <= self._latest:
+            return
+        self._latest = fecha
+        cutoff = self._cutoff(fecha)
+        for day in [day for day in self._by_day if day < cutoff]:
+            for url in self._by_day.pop(day):
+                _, _, signature = self._stories.pop(url)
+                for key in self._band_keys(signature) if signature else ():
+                    bucket = self._buckets[key]
+                    bucket.remove(url)
+                    if not bucket:
+                        del self._buckets[key]
+
+    def _best_match(self, signature: Signature) -> Optional[Tuple[str, float]]:
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        best = None
+        for url in candidates:
+            score = MinHasher.similarity(signature, self._stories[url][2])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (url, score)
+        return best
+
+    def _stored_cluster(self, url: str) -> Optional[int]:
+        story = self._stories.get(url)
+        if story is not None:
+            return story[0]
+        row = self._db.execute(
+            "SELECT cluster FROM stories WHERE url = ?", (url,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def assign(self, data: Dict[str, Any]) -> Optional[int]:
+        """Devuelve la historia de una noticia nueva, o None si ya estaba agrupada."""
+        url = canonicalize_url(data["url"])
+        with self._lock:
+            # Los sondeos repiten casi siempre las mismas URLs: se descartan
+            # antes de calcular la firma
+            if self._stored_cluster(url) is not None:
+                return None
+            signature = self.hasher.signature(shingles(data["titular"]))
+            self._advance(data["fecha"])
+
+            match = self._best_match(signature) if signature else None
+            if match is None:
+                cluster = self._next_cluster
+                self._next_cluster += 1
+                self.new_stories += 1
+            else:
+                cluster, medio, _ = self._stories[match[0]]
+                self.joined += 1
+                if medio != data["medio"]:
+                    self.cross_outlet += 1
+
+            self._index(url, data["medio"], data["fecha"], cluster, signature)
+            self._db.execute(
+                "INSERT INTO stories (url, medio, fecha, cluster, signature) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    url,
+                    data["medio"],
+                    data["fecha"],
+                    cluster,
+                    array("I", signature).tobytes(),
+                ),
+            )
+            if time.monotonic() - self._last_commit >= _COMMIT_INTERVAL:
+                self._db.commit()
+                self._last_commit = time.monotonic()
+            return cluster
+
+    def members(self, cluster: int) -> List[Tuple[str, str, str]]:
+        """(fecha, medio, url) de las noticias de una historia."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT fecha, medio, url FROM stories "
+                "WHERE cluster = ? ORDER BY fecha",
+                (cluster,),
+            ).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+
+class ClusterWriter:
+    """Writer que escribe en el CSV mensual de historias cada noticia nueva
+    con el identificador de su historia (rotando el fichero al cambiar de mes)."""
+
+    def __init__(self, clusterer: StoryClusterer):
+        self.clusterer = clusterer
+        self._writer: Optional[CSVWriter] = None
+        self._lock = threading.Lock()
+
+    def _get_writer(self) -> CSVWriter:
+        filename = get_monthly_filename("historias.csv")
+        with self._lock:
+            if self._writer is None or self._writer.filename != filename:
+                self._writer = CSVWriter(filename, CLUSTER_HEADERS)
+                self._writer.write_headers()
+            return self._writer
+
+    def append_data(self, data: Dict[str, Any]) -> None:
+        cluster = self.clusterer.assign(data)
+        if cluster is None:
+            return
+        self._get_writer().append_data(
+            {
+                "fecha": data["fecha"],
+                "medio": data["medio"],
+                "historia": cluster,
+                "url": canonicalize_url(data["url"]),
+                "titular": data["titular"],
+            }
+        )
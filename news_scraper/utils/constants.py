@@ -1,7 +1,132 @@
 from datetime import datetime
+from typing import Optional
 
-now = datetime.now()
-mes_y_anio = f"{now.strftime("%B")}-{now.year}"
 
-CSV_FILENAME = f"data/{mes_y_anio}-titulares.csv"
-LOG_FILENAME = f"data/{mes_y_anio}-titulares.log"
+def get_monthly_filename(suffix: str, when: Optional[datetime] = None) -> str:
+    """Devuelve la ruta del fichero mensual (p. ej. data/July-2025-titulares.csv)."""
+    when = when or datetime.now()
+    return f"data/{when.strftime('%B')}-{when.year}-{suffix}"
+
+
+CSV_FILENAME = get_monthly_filename("titulares.csv")
+LOG_FILENAME = get_monthly_filename("titulares.log")
+TIMINGS_FILENAME = get_monthly_filename("tiempos.jsonl")
+
+CSV_HEADERS = ["fecha", "medio", "titular", "zona_portada", "seccion", "url"]
+# Con --dedup, las zonas de una noticia repetida se unen en zona_portada
+ZONE_SEPARATOR = "|"
+
+# Eventos de portada (--diff): entra, sale, mueve, edita
+EVENT_HEADERS = [
+    "fecha_hora",
+    "medio",
+    "evento",
+    "url",
+    "zona_anterior",
+    "zona_portada",
+    "titular_anterior",
+    "titular",
+]
+SNAPSHOTS_FILENAME = "data/portadas.json"
+
+# Versiones de titulares (--versions)
+VERSIONS_DB_FILENAME = "data/versiones.sqlite3"
+VERSION_HEADERS = [
+    "fecha_hora",
+    "medio",
+    "url",
+    "version",
+    "titular",
+    "seccion",
+    "zona_portada",
+]
+
+# Agrupación de una misma noticia entre medios (--clusters)
+CLUSTERS_DB_FILENAME = "data/historias.sqlite3"
+CLUSTER_HEADERS = ["fecha", "medio", "historia", "url", "titular"]
+CLUSTER_SHINGLE_SIZE = 4  # caracteres por fragmento de palabra
+CLUSTER_NUM_PERM = 64  # funciones hash de la firma MinHash
+CLUSTER_BANDS = 32  # bandas LSH (CLUSTER_NUM_PERM / CLUSTER_BANDS filas cada una)
+CLUSTER_THRESHOLD = 0.35  # similitud de Jaccard estimada para unir a una historia
+CLUSTER_WINDOW_DAYS = 3  # días hacia atrás en los que se buscan candidatas
+
+# Índice invertido de titulares (--index y subcomando search)
+SEARCH_DB_FILENAME = "data/indice.sqlite3"
+SEARCH_FLUSH_DOCS = 5000  # documentos en memoria antes de escribir los postings
+SEARCH_DEFAULT_LIMIT = 50
+SEARCH_HEADERS = ["fecha", "medio", "titular", "url"]
+
+# Estadísticas de cobertura (subcomando stats)
+ARCHIVE_PATTERN = "data/*-titulares.csv"
+STATS_CACHE_DIR = "data/cache"
+
+# Frecuencia de términos por día y medio (--terms y subcomando terms)
+TERMS_DB_FILENAME = "data/terminos.sqlite3"
+TERMS_FLUSH_ROWS = 20000  # contadores en memoria antes de escribirlos
+TERM_SERIES_HEADERS = ["termino", "fecha", "medio", "titulares", "total", "proporcion"]
+
+# Índice lateral de los CSV mensuales (CSVReader)
+CSV_INDEX_SUFFIX = ".idx"
+CSV_INDEX_COLUMNS = ("fecha", "medio")
+
+# Importación masiva de archivos históricos (subcomando import)
+IMPORT_CHUNK_BYTES = 8 * 1024 * 1024  # bytes leídos de una vez de cada CSV
+IMPORT_STORES = ("search", "terms", "stats", "csv-index")
+IMPORT_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d")
+# Nombre de cada medio según su forma plegada (minúsculas, sin tildes ni espacios)
+OUTLET_NAMES = {"quedigital": "QueDigital", "0223": "0223", "lacapital": "La capital"}
+
+# Ingesta de portadas archivadas en WARC (subcomando warc)
+WARC_PENDING_PER_WORKER = 4  # capturas en vuelo por proceso de parseo
+# Zona horaria de los medios: fija el día de cada captura archivada
+OUTLETS_TIMEZONE = "America/Argentina/Buenos_Aires"
+
+# Índice persistente de URLs ya vistas (--new-only)
+SEEN_DB_FILENAME = "data/vistas.sqlite3"
+SEEN_BLOOM_FILENAME = "data/vistas.bloom"
+SEEN_BLOOM_CAPACITY = 1_000_000
+SEEN_BLOOM_ERROR_RATE = 0.001
+
+# Páginas de listado (secciones y paginación)
+DEFAULT_CRAWL_DEPTH = 0  # páginas por listado; 0 = solo la portada
+DEFAULT_FETCH_WORKERS = 8
+DEFAULT_CONNECTIONS_PER_HOST = 2
+
+# Pipeline por etapas (subcomando pipeline)
+DEFAULT_PIPELINE_FETCH_WORKERS = 6
+DEFAULT_PIPELINE_PARSE_WORKERS = 2
+DEFAULT_PIPELINE_ENRICH_WORKERS = 1
+DEFAULT_PIPELINE_QUEUE_SIZE = 32
+PIPELINE_METRICS_FILENAME = get_monthly_filename("pipeline.jsonl")
+
+# Reintentos y circuito por medio
+RETRY_ATTEMPTS = 3  # intentos totales por descarga
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+BREAKER_THRESHOLD = 3  # fallos seguidos que abren el circuito
+BREAKER_COOLDOWN = 1800  # segundos que se omite el medio
+CIRCUIT_STATE_FILENAME = "data/circuit_state.json"
+
+# Plazo total (--deadline): reserva final y parte de cada medio para la descarga
+DEADLINE_RESERVE = 5.0
+FETCH_BUDGET_SHARE = 0.6
+
+# Cortesía con los medios: peticiones por segundo y ráfaga máxima por host
+DEFAULT_HOST_RATE = 1.0
+DEFAULT_HOST_BURST = 3
+
+# Memoria
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # una portada real ronda 0.5-1.5 MB
+
+# Modo servicio (python -m news_scraper serve)
+DEFAULT_POLL_INTERVAL = 15 * 60  # segundos entre sondeos de un mismo medio
+DEFAULT_POLL_JITTER = 0.1  # fracción aleatoria (+/-) aplicada a cada intervalo
+
+# Sondeo adaptativo según la rotación de titulares en portada
+SCHEDULER_STATE_FILENAME = "data/scheduler_state.json"
+DEFAULT_MIN_POLL_INTERVAL = 2 * 60
+DEFAULT_MAX_POLL_INTERVAL = 2 * 60 * 60
+CHURN_HIGH = 0.15  # por encima, se acorta el intervalo
+CHURN_LOW = 0.02  # por debajo, se alarga el intervalo
+INTERVAL_SHRINK = 0.5
+INTERVAL_GROW = 1.5
@@ -0,0 +1,220 @@
+import csv
+import heapq
+import mmap
+import os
+from array import array
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from news_scraper.utils.constants import CSV_INDEX_COLUMNS, CSV_INDEX_SUFFIX
+
+# (fecha, medio) de un grupo de filas
+IndexKey = Tuple[str, ...]
+
+
+def iter_records(file: IO[bytes], offset: int) -> Iterator[Tuple[int, bytes]]:
+    """Registros CSV desde `offset` como (offset final, bytes).
+
+    Un salto de línea dentro de un campo entre comillas no cierra el registro:
+    el registro termina cuando el número de comillas acumuladas es par.
+    """
+    file.seek(offset)
+    record = b""
+    quotes = 0
+    for line in file:
+        record += line
+        quotes += line.count(b'"')
+        offset += len(line)
+        if quotes % 2 == 0:
+            yield offset, record
+            record = b""
+            quotes = 0
+
+
+def parse_record(record: bytes) -> List[str]:
+    return next(csv.reader([record.decode("utf-8")]), [])
+
+
+class CSVIndex:
+    """Índice lateral (`<csv>.idx`) con el offset y la longitud de cada fila.
+
+    Es un fichero de texto de solo añadido, una línea por fila con los
+    valores de `columns` separados por tabuladores, así que CSVWriter lo
+    actualiza con cada fila sin reescribir nada. Si el índice no cubre todo
+    el CSV (filas escritas antes de existir, o un corte entre ambas
+    escrituras), refresh() indexa lo que falta o lo reconstruye.
+    """
+
+    def __init__(
+        self, csv_filename: str, columns: Tuple[str, ...] = CSV_INDEX_COLUMNS
+    ):
+        self.csv_filename = csv_filename
+        self.filename = csv_filename + CSV_INDEX_SUFFIX
+        self.columns = columns
+
+    def _line(self, key: IndexKey, offset: int, length: int) -> str:
+        return "\t".join((*key, str(offset), str(length))) + "\n"
+
+    def append(self, key: IndexKey, offset: int, length: int) -> None:
+        with open(self.filename, mode="a", encoding="utf-8") as file:
+            file.write(self._line(key, offset, length))
+
+    def load(self) -> Dict[IndexKey, Tuple[array, array]]:
+        """Offsets y longitudes de las filas de cada grupo, en orden de fichero."""
+        groups: Dict[IndexKey, Tuple[array, array]] = {}
+        if not os.path.exists(self.filename):
+            return groups
+        with open(self.filename, encoding="utf-8") as file:
+            for line in file:
+                *key, offset, length = line.rstrip("\n").split("\t")
+                offsets, lengths = groups.setdefault(
+                    tuple(key), (array("Q"), array("Q"))
+                )
+                offsets.append(int(offset))
+                lengths.append(int(length))
+        return groups
+
+    def _scan(
+        self, file: IO[bytes], headers: List[str], start: int
+    ) -> Iterator[Tuple[IndexKey, int, int]]:
+        positions = [headers.index(column) for column in self.columns]
+        for end, record in iter_records(file, start):
+            values = parse_record(record)
+            if len(values) == len(headers):
+                key = tuple(values[i] for i in positions)
+                yield key, end - len(record), len(record)
+
+    def refresh(self) -> Dict[IndexKey, Tuple[array, array]]:
+        """Pone el índice al día con el CSV y lo devuelve cargado."""
+        with open(self.csv_filename, "rb") as file:
+            header_end, header = next(iter_records(file, 0), (0, b""))
+            headers = parse_record(header)
+            if not all(column in headers for column in self.columns):
+                return {}
+            size = os.fstat(file.fileno()).st_size
+
+            groups = self.load()
+            covered = sum(sum(lengths) for _, lengths in groups.values())
+            end = max(
+                (offsets[-1] + lengths[-1] for offsets, lengths in groups.values()),
+                default=header_end,
+            )
+            # Las filas indexadas deben ocupar sin huecos el CSV desde la cabecera
+            contiguous = end - header_end == covered and end <= size
+            if not contiguous:
+                tmp_filename = f"{self.filename}.tmp"
+                with open(tmp_filename, mode="w", encoding="utf-8") as index:
+                    for key, offset, length in self._scan(file, headers, header_end):
+                        index.write(self._line(key, offset, length))
+                os.replace(tmp_filename, self.filename)
+                return self.load()
+
+            if end < size:
+                with open(self.filename, mode="a", encoding="utf-8") as index:
+                    for key, offset, length in self._scan(file, headers, end):
+                        index.write(self._line(key, offset, length))
+                        offsets, lengths = groups.setdefault(
+                            key, (array("Q"), array("Q"))
+                        )
+                        offsets.append(offset)
+                        lengths.append(length)
+        return groups
+
+
+class CSVReader:
+    """Lectura aleatoria de un CSV mensual con mmap y su índice lateral.
+
+    Solo se decodifican las filas pedidas, de forma perezosa: leer un día o
+    un medio no recorre el resto del fichero.
+
+        with CSVReader("data/July-2025-titulares.csv") as reader:
+            for row in reader.rows(fecha="2025-07-14", medio="0223"):
+                ...
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.index = CSVIndex(filename)
+        self.groups = self.index.refresh()
+        self._file = open(filename, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap: Optional[mmap.mmap] = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if size
+            else None
+        )
+        _, header = next(iter_records(self._file, 0), (0, b""))
+        self.headers = parse_record(header)
+
+    def __enter__(self) -> "CSVReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets, _ in self.groups.values())
+
+    def keys(self) -> List[IndexKey]:
+        return sorted(self.groups)
+
+    def dates(self) -> List[str]:
+        return sorted({key[0] for key in self.groups})
+
+    def medios(self) -> List[str]:
+        return sorted({key[1] for key in self.groups})
+
+    def count(
+        self,
+        fecha: Optional[str] = None,
+        medio: Optional[str] = None,
+        date_from: str = "",
+        date_to: str = "",
+    ) -> int:
+        """Filas que cumplen el filtro, sin leer el CSV."""
+        return sum(
+            len(self.groups[key][0])
+            for key in self._select(fecha, medio, date_from, date_to)
+        )
+
+    def _select(
+        self,
+        fecha: Optional[str],
+        medio: Optional[str],
+        date_from: str,
+        date_to: str,
+    ) -> List[IndexKey]:
+        if fecha:
+            date_from = date_to = fecha
+        return [
+            key
+            for key in self.groups
+            if (not date_from or key[0] >= date_from)
+            and (not date_to or key[0] <= date_to)
+            and (medio is None or key[1].lower() == medio.lower())
+        ]
+
+    def row_at(self, offset: int, length: int) -> Dict[str, str]:
+        assert self._mmap is not None
+        record = self._mmap[offset : offset + length]
+        return dict(zip(self.headers, parse_record(record)))
+
+    def rows(
+        self,
+        fecha: Optional[str] = None,
+        medio: Optional[str] = None,
+        date_from: str = "",
+        date_to: str = "",
+    ) -> Iterator[Dict[str, str]]:
+        """Filas de un día (`fecha`) o rango de días y, opcionalmente, un medio,
+        en el orden del fichero."""
+        selected = [
+            zip(*self.groups[key])
+            for key in self._select(fecha, medio, date_from, date_to)
+        ]
+        for offset, length in heapq.merge(*selected):
+            yield self.row_at(offset, length)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
@@ -1,12 +1,21 @@
 import csv
+import io
 import os
-from typing import Dict, List
+import threading
+from typing import Dict, List, Optional
+
+from news_scraper.utils.csv_reader import CSVIndex
 
 
 class CSVWriter:
-    def __init__(self, filename: str, headers: List[str]):
+    """Añade filas a un CSV. Con `index`, mantiene además su índice lateral
+    de offsets por (fecha, medio) para CSVReader."""
+
+    def __init__(self, filename: str, headers: List[str], index: bool = False):
         self.filename = filename
         self.headers = headers
+        self.index: Optional[CSVIndex] = CSVIndex(filename) if index else None
+        self._lock = threading.Lock()
 
     def write_headers(self):
         if not os.path.exists(self.filename):
@@ -15,6 +24,33 @@ class CSVWriter:
                 writer.writeheader()
 
     def append_data(self, data: Dict[str, str]):
-        with open(self.filename, mode="a", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(file, fieldnames=self.headers)
-            writer.writerow(data)
+        # El lock permite compartir el writer entre los hilos del modo servicio
+        with self._lock:
+            if self.index is None:
+                with open(
+                    self.filename, mode="a", newline="", encoding="utf-8"
+                ) as file:
+                    writer = csv.DictWriter(file, fieldnames=self.headers)
+                    writer.writerow(data)
+                return
+
+            # La fila se serializa antes para conocer su offset y su longitud en bytes
+            buffer = io.StringIO(newline="")
+            csv.DictWriter(buffer, fieldnames=self.headers).writerow(data)
+            record = buffer.getvalue().encode("utf-8")
+            with open(self.filename, mode="ab") as file:
+                offset = file.tell()
+                file.write(record)
+            key = tuple(str(data[column]) for column in self.index.columns)
+            self.index.append(key, offset, len(record))
+
+
+class MultiWriter:
+    """Reparte cada fila entre varios writers (CSV principal, versiones...)."""
+
+    def __init__(self, *writers):
+        self.writers = writers
+
+    def append_data(self, data: Dict[str, str]):
+        for writer in self.writers:
+            writer.append_data(data)
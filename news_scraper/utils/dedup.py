@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Optional
+
+from news_scraper.utils.constants import ZONE_SEPARATOR
+from news_scraper.utils.urls import canonicalize_url
+
+
+class Deduplicator:
+    """Fusiona los titulares repetidos de una ejecución por URL canónica.
+
+    Se usa como un writer: append_data() acumula en un dict (una búsqueda por
+    fila, coste lineal en el total) y flush() escribe una fila por noticia en
+    el writer envuelto, con la URL canónica y todas sus zonas en
+    `zona_portada` separadas por ZONE_SEPARATOR, en orden de aparición.
+    """
+
+    def __init__(self, writer: Optional[Any] = None):
+        self.writer = writer
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._zones: Dict[str, List[str]] = {}
+        self.duplicates = 0
+
+    def append_data(self, data: Dict[str, Any]) -> bool:
+        """Añade una fila; devuelve False si la noticia ya estaba."""
+        url = canonicalize_url(data["url"])
+        zones = self._zones.get(url)
+        if zones is None:
+            self._rows[url] = {**data, "url": url}
+            self._zones[url] = [data["zona_portada"]]
+            return True
+        self.duplicates += 1
+        if data["zona_portada"] not in zones:
+            zones.append(data["zona_portada"])
+        return False
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return [
+            {**row, "zona_portada": ZONE_SEPARATOR.join(self._zones[url])}
+            for url, row in self._rows.items()
+        ]
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Escribe las filas fusionadas en el writer envuelto y vacía el estado."""
+        rows = self.rows()
+        if self.writer is not None:
+            for row in rows:
+                self.writer.append_data(row)
+        self._rows.clear()
+        self._zones.clear()
+        return rows
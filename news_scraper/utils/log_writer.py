@@ -1,19 +1,81 @@
+import json
 import os
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Atributos propios de LogRecord; el resto llega por `extra` (outlet, zone, count...)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """Formatea cada registro como una línea JSON con sus campos estructurados."""
+
+    def format(self, record):
+        data = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _LazyQueueHandler(QueueHandler):
+    """QueueHandler que encola el registro sin formatearlo.
+
+    El QueueHandler estándar formatea el mensaje en el hilo que llama a
+    logger.info(); aquí todo el formateo ocurre en el hilo del QueueListener.
+    """
+
+    def prepare(self, record):
+        return record
 
 
 class LogWriter:
-    def __init__(self, log_file, name="scrapper"):
+    def __init__(self, log_file, name="scrapper", structured=True):
         self.log_file = log_file
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
+        self._listener = None
+        self._queue_handler = None
 
         if not self.logger.hasHandlers():
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
             handler = logging.FileHandler(log_file, encoding="utf-8")
-            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+            if structured:
+                formatter = JSONFormatter()
+            else:
+                formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
             handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+
+            # La escritura en disco se hace en el hilo del listener, no en el
+            # camino caliente del scraping
+            log_queue = queue.SimpleQueue()
+            self._queue_handler = _LazyQueueHandler(log_queue)
+            self._listener = QueueListener(
+                log_queue, handler, respect_handler_level=True
+            )
+            self._listener.start()
+            self.logger.addHandler(self._queue_handler)
 
     def get_logger(self):
         return self.logger
+
+    def close(self):
+        """Vacía la cola pendiente en el fichero y desengancha el handler.
+
+        Hay que llamarlo al final de cada ejecución: en Lambda el proceso se
+        congela al volver del handler y la cola no se vaciaría.
+        """
+        if self._listener:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self.logger.removeHandler(self._queue_handler)
+            self._listener = None
+            self._queue_handler = None
@@ -0,0 +1,126 @@
+import cProfile
+import logging
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Tuple
+
+# Funciones que interesan en el resumen: zonas de los scrapers y BeautifulSoup
+_HOT_PATHS = (f"{os.sep}bs4{os.sep}", f"{os.sep}soupsieve{os.sep}")
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(" ", "_")
+
+
+class ScraperProfiler:
+    """Ejecuta cada scraper bajo cProfile y tracemalloc y guarda los informes.
+
+    Por cada medio escribe `<medio>.pstats` (abrible con `python -m pstats` o
+    snakeviz) y `<medio>-memoria.txt` con las `top_n` líneas que más memoria
+    reservaron.
+    """
+
+    def __init__(self, output_dir: str, top_n: int = 20):
+        self.output_dir = output_dir
+        self.top_n = top_n
+        # (tipo, medio, función, llamadas, tiempo propio, tiempo acumulado)
+        self._hot_functions: List[Tuple[str, str, str, int, float, float]] = []
+
+    @classmethod
+    def next_to_log(cls, log_file: str, top_n: int = 20) -> "ScraperProfiler":
+        """Crea un perfilador que escribe en <log>-perfiles/<fecha-hora>/."""
+        base = os.path.splitext(log_file)[0]
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        return cls(f"{base}-perfiles{os.sep}{stamp}", top_n)
+
+    @contextmanager
+    def profile(self, outlet: str) -> Iterator[None]:
+        os.makedirs(self.output_dir, exist_ok=True)
+        profiler = cProfile.Profile()
+        tracemalloc.start()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            stats_file = os.path.join(self.output_dir, f"{_slug(outlet)}.pstats")
+            profiler.dump_stats(stats_file)
+            self._collect_hot_functions(outlet, pstats.Stats(profiler))
+            self._write_allocations(outlet, snapshot, peak)
+
+    def _collect_hot_functions(self, outlet: str, stats: pstats.Stats) -> None:
+        for (filename, lineno, funcname), values in stats.stats.items():  # type: ignore[attr-defined]
+            _, ncalls, tottime, cumtime, _ = values
+            if funcname.startswith("_parse_"):
+                kind = "zona"
+            elif any(path in filename for path in _HOT_PATHS):
+                kind = "bs4"
+            else:
+                continue
+            # p. ej. bs4/element.py:2723(find_all)
+            short = os.sep.join(filename.split(os.sep)[-2:])
+            label = f"{short}:{lineno}({funcname})"
+            self._hot_functions.append((kind, outlet, label, ncalls, tottime, cumtime))
+
+    def _write_allocations(
+        self, outlet: str, snapshot: tracemalloc.Snapshot, peak: int
+    ) -> None:
+        snapshot = snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        filename = os.path.join(self.output_dir, f"{_slug(outlet)}-memoria.txt")
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(f"{outlet}: pico de memoria {peak / 1024:.1f} KB\n")
+            file.write(f"Top {self.top_n} líneas por memoria aún reservada:\n")
+            for stat in snapshot.statistics("lineno")[: self.top_n]:
+                file.write(f"{stat}\n")
+
+    def summary(self, kind: str) -> List[Tuple[str, str, str, int, float, float]]:
+        """Funciones calientes de un tipo ("zona" o "bs4") por tiempo acumulado."""
+        rows = [row for row in self._hot_functions if row[0] == kind]
+        return sorted(rows, key=lambda row: row[5], reverse=True)[: self.top_n]
+
+    def write_summary(self, logger: logging.Logger) -> None:
+        """Escribe las tablas resumen en resumen.txt y en el log."""
+        if not self._hot_functions:
+            return
+        lines = []
+        for kind, title in (
+            ("zona", "Métodos _parse_* más costosos"),
+            ("bs4", "Llamadas a BeautifulSoup/soupsieve más costosas"),
+        ):
+            rows = self.summary(kind)
+            lines.append(title)
+            lines.append(
+                f"{'medio':<12}{'función':<60}{'llamadas':>10}"
+                f"{'propio s':>10}{'acum. s':>10}"
+            )
+            for _, outlet, label, ncalls, tottime, cumtime in rows:
+                lines.append(
+                    f"{outlet:<12}{label[:59]:<60}{ncalls:>10}"
+                    f"{tottime:>10.4f}{cumtime:>10.4f}"
+                )
+                logger.info(
+                    f"[{outlet}] Perfil {label}: {cumtime * 1000:.1f} ms acumulados "
+                    f"({ncalls} llamadas)",
+                    extra={
+                        "outlet": outlet,
+                        "function": label,
+                        "count": ncalls,
+                        "duration_ms": round(cumtime * 1000, 3),
+                    },
+                )
+            lines.append("")
+
+        with open(
+            os.path.join(self.output_dir, "resumen.txt"), "w", encoding="utf-8"
+        ) as file:
+            file.write("\n".join(lines))
+        logger.info(f"Perfiles guardados en {self.output_dir}")
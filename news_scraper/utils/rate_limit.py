@@ -0,0 +1,262 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Set
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from news_scraper.utils.budget import DeadlineExceeded
+from news_scraper.utils.constants import DEFAULT_HOST_BURST, DEFAULT_HOST_RATE
+
+# Respuestas que suelen llegar con Retry-After
+_THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Segundos indicados por una cabecera Retry-After (número o fecha HTTP)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Cubo de fichas: `rate` peticiones por segundo con ráfagas de hasta `burst`.
+
+    reserve() descuenta la ficha al momento y devuelve cuánto hay que esperar,
+    de modo que la espera se hace fuera del lock y las peticiones concurrentes
+    al mismo host quedan en fila. Si la espera supera `max_wait`, no descuenta
+    nada y devuelve None.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.blocked_until)
+            elapsed = max(0.0, start - self.updated)
+            tokens = min(self.burst, self.tokens + elapsed * self.rate) - 1
+            wait = start - now
+            if tokens < 0:
+                wait += -tokens / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self.tokens = tokens
+            self.updated = max(self.updated, start)
+            return wait
+
+    def block(self, seconds: float) -> None:
+        """No entrega fichas hasta dentro de `seconds` (Retry-After)."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def slow_down(self, rate: float) -> None:
+        """Reduce el ritmo sin ráfagas (Crawl-delay de robots.txt)."""
+        with self._lock:
+            if rate < self.rate:
+                self.rate = rate
+                self.burst = 1
+                self.tokens = min(self.tokens, 1.0)
+
+
+class HostRateLimiter:
+    """Un cubo de fichas por host, compartido por todos los scrapers.
+
+    Solo espera el hilo que pide al host limitado; el resto de hosts siguen a
+    su ritmo. Con rate=0 no se limita nada. Dentro de deadline(), la espera
+    de cada hilo queda acotada por el plazo de su medio.
+    """
+
+    def __init__(self, rate: float = DEFAULT_HOST_RATE, burst: int = DEFAULT_HOST_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._robots_checked: Set[str] = set()
+        # Crawl-delay de cada host: robots.txt se lee una vez por proceso y el
+        # retraso debe sobrevivir a configure()
+        self._crawl_delays: Dict[str, float] = {}
+        # host -> [peticiones, esperas, segundos esperados, espera máxima]
+        self._stats: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        # Plazo (time.monotonic()) de la descarga en curso de cada hilo
+        self._local = threading.local()
+
+    def configure(self, rate: float, burst: int) -> None:
+        with self._lock:
+            self.rate = rate
+            self.burst = burst
+            self._buckets.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+                delay = self._crawl_delays.get(host)
+                if delay:
+                    bucket.slow_down(1 / delay)
+            return bucket
+
+    def needs_robots(self, host: str) -> bool:
+        """True la primera vez que se consulta un host (y lo marca como visto)."""
+        with self._lock:
+            if host in self._robots_checked:
+                return False
+            self._robots_checked.add(host)
+            return True
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        """Acota a `seconds` las esperas de acquire() de este hilo (--deadline)."""
+        previous = getattr(self._local, "deadline", None)
+        self._local.deadline = time.monotonic() + seconds
+        try:
+            yield
+        finally:
+            self._local.deadline = previous
+
+    def remaining(self) -> Optional[float]:
+        """Segundos hasta el plazo de este hilo, o None si no tiene plazo."""
+        deadline = getattr(self._local, "deadline", None)
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def acquire(self, host: str, max_wait: Optional[float] = None) -> float:
+        """Espera hasta poder pedir al host y devuelve los segundos esperados.
+
+        Si la espera (Retry-After, Crawl-delay) supera `max_wait`, lanza
+        DeadlineExceeded sin dormir ni gastar la ficha.
+        """
+        if not self.enabled:
+            return 0.0
+        wait = self._bucket(host).reserve(max_wait)
+        if wait is None:
+            raise DeadlineExceeded(
+                f"La espera del limitador para {host} supera el plazo del medio"
+            )
+        if wait > 0:
+            time.sleep(wait)
+        with self._lock:
+            stats = self._stats.setdefault(host, [0, 0, 0.0, 0.0])
+            stats[0] += 1
+            if wait > 0:
+                stats[1] += 1
+                stats[2] += wait
+                stats[3] = max(stats[3], wait)
+        return wait
+
+    def defer(self, host: str, seconds: float) -> None:
+        if self.enabled and seconds > 0:
+            self._bucket(host).block(seconds)
+
+    def set_crawl_delay(self, host: str, delay: float) -> None:
+        if delay <= 0:
+            return
+        with self._lock:
+            self._crawl_delays[host] = delay
+        if self.enabled:
+            self._bucket(host).slow_down(1 / delay)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Métricas de espera por host."""
+        with self._lock:
+            return {
+                host: {
+                    "requests": requests_count,
+                    "waits": waits,
+                    "wait_s": round(total, 3),
+                    "max_wait_s": round(maximum, 3),
+                }
+                for host, (requests_count, waits, total, maximum) in self._stats.items()
+            }
+
+    def log_summary(self, logger: logging.Logger) -> None:
+        for host, stats in self.summary().items():
+            if not stats["waits"]:
+                continue
+            logger.info(
+                f"[{host}] Limitador: {stats['waits']} de {stats['requests']} "
+                f"peticiones esperaron {stats['wait_s']:.1f} s "
+                f"(máx {stats['max_wait_s']:.1f} s)",
+                extra={
+                    "host": host,
+                    "count": stats["requests"],
+                    "duration_ms": round(stats["wait_s"] * 1000, 3),
+                },
+            )
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Adaptador de requests que pasa cada petición por el limitador por host.
+
+    La primera petición a un host lee su robots.txt para aplicar Crawl-delay,
+    y las respuestas 429/503 con Retry-After bloquean el host ese tiempo.
+    """
+
+    def __init__(self, limiter: "HostRateLimiter", **kwargs):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+
+    def _check_robots(self, request: requests.PreparedRequest, **kwargs) -> None:
+        parsed = urlparse(request.url)
+        robots = requests.Request(
+            "GET",
+            f"{parsed.scheme}://{parsed.netloc}/robots.txt",
+            headers={"User-Agent": request.headers.get("User-Agent", "*")},
+        ).prepare()
+        try:
+            self.limiter.acquire(parsed.netloc, self.limiter.remaining())
+            response = super().send(robots, **{**kwargs, "stream": False})
+        except requests.RequestException:
+            return
+        if response.status_code != 200:
+            return
+        parser = RobotFileParser()
+        parser.parse(response.text.splitlines())
+        delay = parser.crawl_delay(request.headers.get("User-Agent", "*"))
+        if delay:
+            self.limiter.set_crawl_delay(parsed.netloc, float(delay))
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).netloc
+        if self.limiter.enabled and self.limiter.needs_robots(host):
+            self._check_robots(request, **kwargs)
+
+        self.limiter.acquire(host, self.limiter.remaining())
+        response = super().send(request, **kwargs)
+
+        if response.status_code in _THROTTLE_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                self.limiter.defer(host, retry_after)
+        return response
+
+
+# Limitador compartido por todas las sesiones de los scrapers
+rate_limiter = HostRateLimiter()
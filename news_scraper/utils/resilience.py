@@ -0,0 +1,173 @@
+import json
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+from news_scraper.utils.constants import (
+    BREAKER_COOLDOWN,
+    BREAKER_THRESHOLD,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+
+# Estados HTTP que indican un fallo pasajero del servidor
+_TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+
+def is_transient(error: Exception) -> bool:
+    """True si el error merece un reintento (red, timeout o 5xx/429)."""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in _TRANSIENT_STATUSES
+    return False
+
+
+class CircuitOpenError(Exception):
+    """El circuito del medio está abierto: no se intenta la descarga."""
+
+
+class RetryPolicy:
+    """Reintentos con backoff exponencial y jitter completo para peticiones GET.
+
+    El intento n (desde 0) espera un tiempo aleatorio entre 0 y
+    min(max_delay, base_delay * 2**n), para que varios clientes no reintenten
+    al mismo tiempo.
+    """
+
+    def __init__(
+        self,
+        attempts: int = RETRY_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+    ):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        return attempt + 1 < self.attempts and is_transient(error)
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """Circuito de un medio: se abre tras `threshold` fallos pasajeros seguidos.
+
+    Abierto, el medio se omite hasta que pasa `cooldown`; entonces se deja
+    pasar un único intento (semiabierto) que lo cierra si sale bien o lo
+    vuelve a abrir si falla; mientras dura, el resto de peticiones se
+    rechazan. Usa la hora del sistema para poder persistirse entre
+    ejecuciones.
+    """
+
+    def __init__(
+        self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN
+    ):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        # Hilo que tiene la petición de prueba del estado semiabierto
+        self._probe: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "cerrado"
+        if time.time() - self.opened_at >= self.cooldown:
+            return "semiabierto"
+        return "abierto"
+
+    def is_open(self) -> bool:
+        """True si el medio debe omitirse ahora. No consume la prueba."""
+        state = self.state
+        if state == "semiabierto":
+            return self._probe is not None
+        return state == "abierto"
+
+    def allow(self) -> bool:
+        """True si se puede hacer una petición; en semiabierto, solo la primera
+        hasta que se registra su resultado."""
+        with self._lock:
+            state = self.state
+            if state == "cerrado":
+                return True
+            if state == "abierto" or self._probe is not None:
+                return False
+            self._probe = threading.get_ident()
+            return True
+
+    def release(self) -> None:
+        """Devuelve la prueba si terminó sin resultado (error no pasajero, plazo)."""
+        with self._lock:
+            if self._probe == threading.get_ident():
+                self._probe = None
+
+    def retry_in(self) -> float:
+        """Segundos hasta que el circuito deje pasar un intento."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - time.time())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probe = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._probe = None
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = time.time()
+
+
+class CircuitBreakers:
+    """Circuitos por medio, persistidos en JSON entre ejecuciones."""
+
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        threshold: int = BREAKER_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+    ):
+        self.filename = filename
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, outlet: str) -> CircuitBreaker:
+        if outlet not in self.breakers:
+            self.breakers[outlet] = CircuitBreaker(self.threshold, self.cooldown)
+        return self.breakers[outlet]
+
+    def load(self) -> None:
+        if not self.filename or not os.path.exists(self.filename):
+            return
+        with open(self.filename, encoding="utf-8") as file:
+            for outlet, saved in json.load(file).get("outlets", {}).items():
+                breaker = self.get(outlet)
+                breaker.failures = saved.get("failures", 0)
+                breaker.opened_at = saved.get("opened_at")
+
+    def save(self) -> None:
+        if not self.filename:
+            return
+        os.makedirs(os.path.dirname(self.filename) or ".", exist_ok=True)
+        outlets = {
+            outlet: {"failures": breaker.failures, "opened_at": breaker.opened_at}
+            for outlet, breaker in self.breakers.items()
+        }
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as file:
+            json.dump({"outlets": outlets}, file, ensure_ascii=False)
+        os.replace(tmp_filename, self.filename)
@@ -0,0 +1,278 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from news_scraper.utils.constants import SEARCH_DB_FILENAME, SEARCH_FLUSH_DOCS
+from news_scraper.utils.text import content_hash, index_terms
+from news_scraper.utils.urls import canonicalize_url
+
+# Segundos máximos que una fila indexada espera en memoria (modo servicio)
+_FLUSH_INTERVAL = 5.0
+# Documentos por consulta al recuperar resultados
+_FETCH_CHUNK = 500
+
+# (término, periodo AAAA-MM, medio)
+PostingKey = Tuple[str, str, str]
+
+
+def encode_deltas(doc_ids: Iterable[int], previous: int = 0) -> bytes:
+    """Codifica identificadores crecientes como diferencias en varint (LEB128).
+
+    Los identificadores de una lista de postings son consecutivos o casi, así
+    que la mayoría de diferencias ocupa un solo byte.
+    """
+    out = bytearray()
+    for doc_id in doc_ids:
+        delta = doc_id - previous
+        previous = doc_id
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_deltas(data: bytes) -> List[int]:
+    doc_ids = []
+    current = 0
+    delta = 0
+    shift = 0
+    for byte in data:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += delta
+        doc_ids.append(current)
+        delta = 0
+        shift = 0
+    return doc_ids
+
+
+def _chunks(doc_ids: List[int]) -> Iterable[List[int]]:
+    for start in range(0, len(doc_ids), _FETCH_CHUNK):
+        yield doc_ids[start : start + _FETCH_CHUNK]
+
+
+def _marks(chunk: List[int]) -> str:
+    return ",".join("?" * len(chunk))
+
+
+class SearchIndex:
+    """Índice invertido en SQLite sobre los titulares.
+
+    Cada titular distinto (URL + texto) es un documento con un identificador
+    creciente. Por cada término, mes y medio se guarda una lista de postings
+    con los identificadores codificados como diferencias en varint; los
+    documentos nuevos se añaden al final del blob sin reescribir lo anterior.
+    Una búsqueda solo lee los blobs de sus términos en el rango de meses y
+    medios pedido.
+    """
+
+    def __init__(self, filename: str = SEARCH_DB_FILENAME):
+        self.filename = filename
+        self.added = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[PostingKey, List[int]] = {}
+        self._pending_docs = 0
+        self._last_flush = time.monotonic()
+
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self._db = sqlite3.connect(filename, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            "doc INTEGER PRIMARY KEY, key INTEGER UNIQUE, fecha TEXT, medio TEXT, "
+            "url TEXT, titular TEXT"
+            ")"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            "term TEXT, periodo TEXT, medio TEXT, last_doc INTEGER, "
+            "count INTEGER, data BLOB, PRIMARY KEY (term, periodo, medio)"
+            ") WITHOUT ROWID"
+        )
+
+    def add(self, data: Dict[str, Any], terms: Optional[List[str]] = None) -> bool:
+        """Indexa una fila; devuelve False si ese titular de esa URL ya estaba.
+
+        `terms` son los términos del titular si ya se calcularon (importación).
+        """
+        url = canonicalize_url(data["url"])
+        key = content_hash(url, data["titular"])
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO docs (key, fecha, medio, url, titular) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, data["fecha"], data["medio"], url, data["titular"]),
+            )
+            if not cursor.rowcount:
+                return False
+            doc_id = cursor.lastrowid
+            periodo = data["fecha"][:7]
+            if terms is None:
+                terms = index_terms(data["titular"])
+            for term in terms:
+                self._pending.setdefault((term, periodo, data["medio"]), []).append(
+                    doc_id
+                )
+            self.added += 1
+            self._pending_docs += 1
+            if (
+                self._pending_docs >= SEARCH_FLUSH_DOCS
+                or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL
+            ):
+                self._flush()
+            return True
+
+    def _flush(self) -> None:
+        for (term, periodo, medio), doc_ids in self._pending.items():
+            row = self._db.execute(
+                "SELECT last_doc, data FROM postings "
+                "WHERE term = ? AND periodo = ? AND medio = ?",
+                (term, periodo, medio),
+            ).fetchone()
+            if row is None:
+                self._db.execute(
+                    "INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        term,
+                        periodo,
+                        medio,
+                        doc_ids[-1],
+                        len(doc_ids),
+                        encode_deltas(doc_ids),
+                    ),
+                )
+            else:
+                # Los identificadores nuevos siempre son mayores: basta añadir
+                # sus diferencias al final (en Python: || de SQLite devuelve texto)
+                last_doc, data = row
+                self._db.execute(
+                    "UPDATE postings SET last_doc = ?, count = count + ?, data = ? "
+                    "WHERE term = ? AND periodo = ? AND medio = ?",
+                    (
+                        doc_ids[-1],
+                        len(doc_ids),
+                        data + encode_deltas(doc_ids, last_doc),
+                        term,
+                        periodo,
+                        medio,
+                    ),
+                )
+        self._db.commit()
+        self._pending.clear()
+        self._pending_docs = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _matching_docs(
+        self,
+        term: str,
+        periodo_from: str,
+        periodo_to: str,
+        medios: Optional[List[str]],
+    ) -> set:
+        # Un término terminado en * busca por prefijo ("inund*")
+        if term.endswith("*"):
+            prefix = term[:-1]
+            condition = "term >= ? AND term < ?"
+            params: List[Any] = [prefix, prefix + "\U0010ffff"]
+        else:
+            condition = "term = ?"
+            params = [term]
+        sql = (
+            f"SELECT medio, data FROM postings WHERE {condition} "
+            "AND periodo >= ? AND periodo <= ?"
+        )
+        params += [periodo_from, periodo_to]
+        doc_ids: set = set()
+        for medio, data in self._db.execute(sql, params):
+            if medios is None or medio.lower() in medios:
+                doc_ids.update(decode_deltas(data))
+        return doc_ids
+
+    def search(
+        self,
+        query: str,
+        date_from: str = "",
+        date_to: str = "",
+        medios: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[int, List[Dict[str, str]]]:
+        """Titulares que contienen todos los términos de `query`, del más reciente
+        al más antiguo. Devuelve (total de coincidencias, filas hasta `limit`).
+
+        `date_from` y `date_to` aceptan AAAA-MM o AAAA-MM-DD; los medios se
+        comparan sin distinguir mayúsculas.
+        """
+        terms = [
+            word + "*" if token.endswith("*") else word
+            for token in query.split()
+            for word in index_terms(token)
+        ]
+        if not terms:
+            return 0, []
+        wanted = [medio.lower() for medio in medios] if medios else None
+        periodo_from = date_from[:7] or "0000-00"
+        periodo_to = date_to[:7] or "9999-99"
+
+        with self._lock:
+            self._flush()
+            doc_ids: Optional[set] = None
+            # Primero los términos más largos, que suelen ser los más raros: si
+            # la intersección se vacía no se leen los demás
+            for term in sorted(set(terms), key=len, reverse=True):
+                matches = self._matching_docs(term, periodo_from, periodo_to, wanted)
+                doc_ids = matches if doc_ids is None else doc_ids & matches
+                if not doc_ids:
+                    return 0, []
+
+            # Los meses de los extremos pueden incluir días fuera del rango
+            day_from = date_from if len(date_from) > 7 else ""
+            day_to = date_to if len(date_to) > 7 else "9999-99-99"
+            dated = []
+            for chunk in _chunks(list(doc_ids)):
+                dated.extend(
+                    self._db.execute(
+                        f"SELECT fecha, doc FROM docs WHERE doc IN ({_marks(chunk)}) "
+                        "AND fecha >= ? AND fecha <= ?",
+                        (*chunk, day_from, day_to),
+                    )
+                )
+            dated.sort(reverse=True)
+            selected = [doc for _, doc in dated[:limit]]
+
+            found: Dict[int, Dict[str, str]] = {}
+            for chunk in _chunks(selected):
+                for doc, fecha, medio, url, titular in self._db.execute(
+                    "SELECT doc, fecha, medio, url, titular FROM docs "
+                    f"WHERE doc IN ({_marks(chunk)})",
+                    chunk,
+                ):
+                    found[doc] = {
+                        "fecha": fecha,
+                        "medio": medio,
+                        "titular": titular,
+                        "url": url,
+                    }
+        return len(dated), [found[doc] for doc in selected]
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._db.close()
+
+
+class IndexWriter:
+    """Writer que añade cada fila al índice de búsqueda."""
+
+    def __init__(self, index: SearchIndex):
+        self.index = index
+
+    def append_data(self, data: Dict[str, Any]) -> None:
+        self.index.add(data)
@@ -0,0 +1,207 @@
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from news_scraper.utils.constants import (
+    SEEN_BLOOM_CAPACITY,
+    SEEN_BLOOM_ERROR_RATE,
+    SEEN_BLOOM_FILENAME,
+    SEEN_DB_FILENAME,
+)
+from news_scraper.utils.urls import canonicalize_url
+
+# Cabecera del fichero del filtro: firma, bits, funciones hash, elementos añadidos
+_BLOOM_HEADER = struct.Struct("<4sQIQ")
+_BLOOM_MAGIC = b"NSBF"
+# Segundos entre commits: un proceso que muere no pierde más que esto
+_COMMIT_INTERVAL = 5.0
+
+
+class BloomFilter:
+    """Filtro de Bloom de tamaño fijo sobre un bytearray.
+
+    Un "no" es seguro; un "sí" puede ser un falso positivo (con probabilidad
+    `error_rate` mientras no se supere `capacity`) y hay que confirmarlo.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # Doble hashing: k posiciones a partir de dos enteros de 64 bits
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def save(self, filename: str) -> None:
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, "wb") as file:
+            file.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, self.bits, self.hashes, self.count))
+            file.write(self._array)
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(
+        cls, filename: str, capacity: int, error_rate: float
+    ) -> Optional["BloomFilter"]:
+        """Lee un filtro guardado; None si no existe o no encaja con los parámetros."""
+        if not os.path.exists(filename):
+            return None
+        bloom = cls(capacity, error_rate)
+        with open(filename, "rb") as file:
+            header = file.read(_BLOOM_HEADER.size)
+            if len(header) != _BLOOM_HEADER.size:
+                return None
+            magic, bits, hashes, count = _BLOOM_HEADER.unpack(header)
+            if magic != _BLOOM_MAGIC or bits != bloom.bits or hashes != bloom.hashes:
+                return None
+            data = file.read()
+        if len(data) != len(bloom._array):
+            return None
+        bloom._array[:] = data
+        bloom.count = count
+        return bloom
+
+
+class SeenIndex:
+    """Índice persistente de URLs canónicas ya publicadas por cada medio.
+
+    La tabla SQLite es la fuente exacta (first_seen/last_seen por URL). Un
+    filtro de Bloom en memoria responde sin tocar el disco a la gran mayoría
+    de URLs nuevas y solo los "quizá vista" se confirman en SQLite. Si el
+    filtro se llena, se reconstruye con el doble de capacidad a partir de la
+    tabla, de modo que la tasa de falsos positivos no crece con los años.
+
+    Los cambios se confirman cada _COMMIT_INTERVAL segundos; el filtro solo
+    se guarda al cerrar y, si no cuadra con la tabla, se reconstruye.
+    """
+
+    def __init__(
+        self,
+        db_filename: str = SEEN_DB_FILENAME,
+        bloom_filename: str = SEEN_BLOOM_FILENAME,
+        capacity: int = SEEN_BLOOM_CAPACITY,
+        error_rate: float = SEEN_BLOOM_ERROR_RATE,
+    ):
+        self.db_filename = db_filename
+        self.bloom_filename = bloom_filename
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.new = 0
+        self.repeated = 0
+        self._lock = threading.Lock()
+        self._last_commit = time.monotonic()
+
+        os.makedirs(os.path.dirname(db_filename) or ".", exist_ok=True)
+        self._db = sqlite3.connect(db_filename, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "url TEXT PRIMARY KEY, medio TEXT, first_seen TEXT, last_seen TEXT"
+            ") WITHOUT ROWID"
+        )
+        self._bloom = self._load_bloom()
+
+    def _load_bloom(self) -> BloomFilter:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM seen").fetchone()
+        while count >= self.capacity:
+            self.capacity *= 2
+        bloom = BloomFilter.load(self.bloom_filename, self.capacity, self.error_rate)
+        if bloom is None or bloom.count != count:
+            bloom = self._rebuild_bloom()
+        return bloom
+
+    def _rebuild_bloom(self) -> BloomFilter:
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        for (url,) in self._db.execute("SELECT url FROM seen"):
+            bloom.add(url)
+        return bloom
+
+    def _contains(self, url: str) -> bool:
+        if url not in self._bloom:
+            return False
+        return (
+            self._db.execute("SELECT 1 FROM seen WHERE url = ?", (url,)).fetchone()
+            is not None
+        )
+
+    def observe(self, data: Dict[str, Any]) -> bool:
+        """Registra una aparición; devuelve True si la URL no se había visto nunca.
+
+        Para las ya vistas actualiza last_seen con la fecha de la fila.
+        """
+        url = canonicalize_url(data["url"])
+        fecha = data["fecha"]
+        with self._lock:
+            is_new = not self._contains(url)
+            if is_new:
+                self._db.execute(
+                    "INSERT INTO seen (url, medio, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?)",
+                    (url, data["medio"], fecha, fecha),
+                )
+                self._bloom.add(url)
+                self.new += 1
+                if self._bloom.full:
+                    self.capacity *= 2
+                    self._bloom = self._rebuild_bloom()
+            else:
+                self._db.execute(
+                    "UPDATE seen SET last_seen = ? WHERE url = ? AND last_seen < ?",
+                    (fecha, url, fecha),
+                )
+                self.repeated += 1
+            if time.monotonic() - self._last_commit >= _COMMIT_INTERVAL:
+                self._db.commit()
+                self._last_commit = time.monotonic()
+            return is_new
+
+    def last_seen(self, url: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT last_seen FROM seen WHERE url = ?", (canonicalize_url(url),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+            self._bloom.save(self.bloom_filename)
+
+
+class NewOnlyWriter:
+    """Writer que solo deja pasar la primera aparición de cada URL."""
+
+    def __init__(self, writer: Any, index: SeenIndex):
+        self.writer = writer
+        self.index = index
+
+    def append_data(self, data: Dict[str, Any]) -> None:
+        if self.index.observe(data):
+            self.writer.append_data(data)
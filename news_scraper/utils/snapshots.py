@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from news_scraper.utils.constants import (
+    EVENT_HEADERS,
+    SNAPSHOTS_FILENAME,
+    ZONE_SEPARATOR,
+    get_monthly_filename,
+)
+from news_scraper.utils.csv_writer import CSVWriter
+from news_scraper.utils.urls import canonicalize_url
+
+# URL canónica -> (zonas separadas por ZONE_SEPARATOR, titular)
+Snapshot = Dict[str, Tuple[str, str]]
+
+
+def build_snapshot(rows: List[Dict[str, Any]]) -> Snapshot:
+    """Portada como mapa por URL canónica, con todas las zonas de cada noticia."""
+    zones: Dict[str, List[str]] = {}
+    titles: Dict[str, str] = {}
+    for row in rows:
+        url = canonicalize_url(row["url"])
+        placements = zones.setdefault(url, [])
+        for zone in row["zona_portada"].split(ZONE_SEPARATOR):
+            if zone not in placements:
+                placements.append(zone)
+        titles.setdefault(url, row["titular"])
+    return {url: (ZONE_SEPARATOR.join(zones[url]), titles[url]) for url in zones}
+
+
+def diff_snapshots(previous: Snapshot, current: Snapshot) -> List[Dict[str, str]]:
+    """Eventos entre dos portadas consecutivas, en un recorrido de cada mapa.
+
+    entra: la URL no estaba; sale: ya no está; mueve: cambiaron sus zonas;
+    edita: cambió el titular.
+    """
+    events = []
+    for url, (zones, title) in current.items():
+        before = previous.get(url)
+        if before is None:
+            events.append(_event("entra", url, "", zones, "", title))
+            continue
+        previous_zones, previous_title = before
+        if previous_zones != zones:
+            events.append(_event("mueve", url, previous_zones, zones, "", title))
+        if previous_title != title:
+            events.append(_event("edita", url, "", zones, previous_title, title))
+    for url, (zones, title) in previous.items():
+        if url not in current:
+            events.append(_event("sale", url, zones, "", title, ""))
+    return events
+
+
+def _event(
+    kind: str,
+    url: str,
+    previous_zones: str,
+    zones: str,
+    previous_title: str,
+    title: str,
+) -> Dict[str, str]:
+    return {
+        "evento": kind,
+        "url": url,
+        "zona_anterior": previous_zones,
+        "zona_portada": zones,
+        "titular_anterior": previous_title,
+        "titular": title,
+    }
+
+
+class EventWriter:
+    """Writer del CSV mensual de eventos (rota el fichero al cambiar de mes)."""
+
+    def __init__(self):
+        self._writer: Optional[CSVWriter] = None
+        self._lock = threading.Lock()
+
+    def _get_writer(self) -> CSVWriter:
+        filename = get_monthly_filename("eventos.csv")
+        with self._lock:
+            if self._writer is None or self._writer.filename != filename:
+                self._writer = CSVWriter(filename, EVENT_HEADERS)
+                self._writer.write_headers()
+            return self._writer
+
+    def append_data(self, data: Dict[str, Any]) -> None:
+        self._get_writer().append_data(data)
+
+
+class SnapshotDiffer:
+    """Compara cada portada con la anterior del mismo medio y escribe los eventos.
+
+    La última portada de cada medio se persiste en JSON, así que las
+    ejecuciones diarias y los sondeos del modo servicio se encadenan. Los
+    eventos van a su propio writer (CSV de eventos), con fecha y hora.
+
+    También acepta filas sueltas con append_data() y las compara por medio
+    al llamar a flush() (modo pipeline).
+    """
+
+    def __init__(
+        self,
+        writer: Any,
+        filename: str = SNAPSHOTS_FILENAME,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.writer = writer
+        self.filename = filename
+        self.logger = logger or logging.getLogger("scraper")
+        self.snapshots: Dict[str, Snapshot] = {}
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, encoding="utf-8") as file:
+            saved = json.load(file).get("outlets", {})
+        self.snapshots = {
+            outlet: {url: (zones, title) for url, (zones, title) in snapshot.items()}
+            for outlet, snapshot in saved.items()
+        }
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.filename) or ".", exist_ok=True)
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as file:
+            json.dump({"outlets": self.snapshots}, file, ensure_ascii=False)
+        os.replace(tmp_filename, self.filename)
+
+    def observe(
+        self, outlet: str, rows: List[Dict[str, Any]], when: Optional[datetime] = None
+    ) -> List[Dict[str, str]]:
+        """Compara la portada completa `rows` con la anterior y escribe los eventos.
+
+        La primera portada de un medio solo se guarda como referencia. Una
+        portada vacía (fallo de descarga) se ignora para no emitir salidas falsas.
+        """
+        if not rows:
+            return []
+        current = build_snapshot(rows)
+        timestamp = (when or datetime.now()).isoformat(timespec="seconds")
+        with self._lock:
+            previous = self.snapshots.get(outlet)
+            self.snapshots[outlet] = current
+            events = diff_snapshots(previous, current) if previous is not None else []
+            for event in events:
+                self.writer.append_data(
+                    {"fecha_hora": timestamp, "medio": outlet, **event}
+                )
+            self.save()
+
+        if events:
+            counts: Dict[str, int] = {}
+            for event in events:
+                counts[event["evento"]] = counts.get(event["evento"], 0) + 1
+            self.logger.info(
+                f"[{outlet}] Cambios en portada: "
+                + ", ".join(f"{kind}={count}" for kind, count in counts.items()),
+                extra={"outlet": outlet, "count": len(events), **counts},
+            )
+        return events
+
+    def append_data(self, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._pending.setdefault(data["medio"], []).append(data)
+
+    def flush(self, skip: Iterable[str] = ()) -> None:
+        """Compara las portadas acumuladas, salvo las de los medios de `skip`
+        (portadas incompletas)."""
+        skip = set(skip)
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for outlet, rows in pending.items():
+            if outlet in skip:
+                self.logger.warning(
+                    f"[{outlet}] Portada incompleta: no se compara con la anterior",
+                    extra={"outlet": outlet},
+                )
+                continue
+            self.observe(outlet, rows)
+
@@ -0,0 +1,242 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from news_scraper.utils.constants import TERMS_DB_FILENAME, TERMS_FLUSH_ROWS
+from news_scraper.utils.text import content_hash, index_terms
+from news_scraper.utils.urls import canonicalize_url
+
+# Segundos máximos que los contadores esperan en memoria (modo servicio)
+_FLUSH_INTERVAL = 5.0
+# Identificador reservado: total de titulares del medio en el día
+_TOTAL = 0
+# Días que se recuerdan las URLs ya contadas (una noticia sigue en portada)
+_COUNTED_DAYS = 2
+
+
+def _day_number(fecha: str) -> int:
+    return date.fromisoformat(fecha).toordinal()
+
+
+def _day_from_number(day: int) -> str:
+    return date.fromordinal(day).isoformat()
+
+
+class TermCounts:
+    """Cuántos titulares de cada medio contienen cada término, por día.
+
+    Los contadores son dispersos: solo se guardan los (término, día, medio)
+    distintos de cero, con términos y medios codificados como enteros y el
+    día como número de día, en una tabla WITHOUT ROWID ordenada por término.
+    La serie temporal de un término es así una lectura por rango de clave,
+    sin volver a tokenizar ningún titular. Cada noticia cuenta una vez por
+    día aunque aparezca en varias zonas o sondeos.
+    """
+
+    def __init__(self, filename: str = TERMS_DB_FILENAME):
+        self.filename = filename
+        self.counted = 0
+        self._lock = threading.Lock()
+        self._pending: Counter = Counter()
+        self._last_flush = time.monotonic()
+
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self._db = sqlite3.connect(filename, check_same_thread=False)
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS terms ("
+            "  id INTEGER PRIMARY KEY, term TEXT UNIQUE);"
+            "CREATE TABLE IF NOT EXISTS medios ("
+            "  id INTEGER PRIMARY KEY, medio TEXT UNIQUE);"
+            "CREATE TABLE IF NOT EXISTS counts ("
+            "  term INTEGER, day INTEGER, medio INTEGER, count INTEGER,"
+            "  PRIMARY KEY (term, day, medio)) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS counted ("
+            "  key INTEGER, day INTEGER, PRIMARY KEY (key, day)) WITHOUT ROWID;"
+        )
+        self._terms: Dict[str, int] = dict(
+            self._db.execute("SELECT term, id FROM terms")
+        )
+        self._medios: Dict[str, int] = dict(
+            self._db.execute("SELECT medio, id FROM medios")
+        )
+        # Las URLs contadas solo hacen falta para el día en curso
+        (latest,) = self._db.execute("SELECT MAX(day) FROM counted").fetchone()
+        if latest:
+            self._db.execute(
+                "DELETE FROM counted WHERE day < ?", (latest - _COUNTED_DAYS,)
+            )
+            self._db.commit()
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._terms.get(term)
+        if term_id is None:
+            # Los identificadores empiezan en 1: el 0 es el total del día
+            term_id = self._terms[term] = len(self._terms) + 1
+            self._db.execute(
+                "INSERT INTO terms (id, term) VALUES (?, ?)", (term_id, term)
+            )
+        return term_id
+
+    def _medio_id(self, medio: str) -> int:
+        medio_id = self._medios.get(medio)
+        if medio_id is None:
+            medio_id = self._medios[medio] = len(self._medios) + 1
+            self._db.execute(
+                "INSERT INTO medios (id, medio) VALUES (?, ?)", (medio_id, medio)
+            )
+        return medio_id
+
+    def add(self, data: Dict[str, Any], terms: Optional[List[str]] = None) -> bool:
+        """Cuenta los términos de una fila; False si la noticia ya contó ese día.
+
+        `terms` son los términos del titular si ya se calcularon (importación).
+        """
+        day = _day_number(data["fecha"])
+        key = content_hash(canonicalize_url(data["url"]))
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO counted (key, day) VALUES (?, ?)", (key, day)
+            )
+            if not cursor.rowcount:
+                return False
+            medio_id = self._medio_id(data["medio"])
+            self._pending[_TOTAL, day, medio_id] += 1
+            if terms is None:
+                terms = index_terms(data["titular"])
+            for term in terms:
+                self._pending[self._term_id(term), day, medio_id] += 1
+            self.counted += 1
+            if (
+                len(self._pending) >= TERMS_FLUSH_ROWS
+                or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL
+            ):
+                self._flush()
+            return True
+
+    def _flush(self) -> None:
+        self._db.executemany(
+            "INSERT INTO counts (term, day, medio, count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (term, day, medio) "
+            "DO UPDATE SET count = count + excluded.count",
+            (
+                (term, day, medio, count)
+                for (term, day, medio), count in self._pending.items()
+            ),
+        )
+        self._db.commit()
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def days(self) -> Set[Tuple[str, str]]:
+        """(fecha, medio) que ya tienen titulares contados."""
+        with self._lock:
+            self._flush()
+            names = {medio_id: medio for medio, medio_id in self._medios.items()}
+            return {
+                (_day_from_number(day), names[medio])
+                for day, medio in self._db.execute(
+                    "SELECT day, medio FROM counts WHERE term = ?", (_TOTAL,)
+                )
+            }
+
+    def series(
+        self,
+        term: str,
+        date_from: str = "",
+        date_to: str = "",
+        medios: Optional[List[str]] = None,
+        by_month: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Serie temporal de un término: por día (o mes) y medio, titulares que
+        lo contienen, total de titulares y proporción.
+
+        Los días y medios sin titulares no aparecen; los días con titulares
+        pero sin el término aparecen con 0. `date_from` y `date_to` aceptan
+        AAAA-MM o AAAA-MM-DD.
+        """
+        terms = index_terms(term)
+        if len(terms) != 1:
+            raise ValueError(
+                f"'{term}' no es un término indexable (una sola palabra)"
+            )
+        first = _day_number(_month_start(date_from)) if date_from else 0
+        last = _day_number(_month_end(date_to)) if date_to else date.max.toordinal()
+
+        with self._lock:
+            self._flush()
+            names = {medio_id: medio for medio, medio_id in self._medios.items()}
+            wanted = set(names)
+            if medios:
+                lowered = [medio.lower() for medio in medios]
+                wanted = {i for i, medio in names.items() if medio.lower() in lowered}
+            # Un término que nunca apareció tiene la serie a cero
+            term_id = self._terms.get(terms[0], -1)
+            hits = {
+                (day, medio): count
+                for day, medio, count in self._db.execute(
+                    "SELECT day, medio, count FROM counts "
+                    "WHERE term = ? AND day BETWEEN ? AND ?",
+                    (term_id, first, last),
+                )
+            }
+            totals = self._db.execute(
+                "SELECT day, medio, count FROM counts "
+                "WHERE term = ? AND day BETWEEN ? AND ? ORDER BY day, medio",
+                (_TOTAL, first, last),
+            ).fetchall()
+
+        points: Dict[Tuple[str, int], List[int]] = {}
+        for day, medio, total in totals:
+            if medio not in wanted:
+                continue
+            fecha = _day_from_number(day)
+            period = fecha[:7] if by_month else fecha
+            point = points.setdefault((period, medio), [0, 0])
+            point[0] += hits.get((day, medio), 0)
+            point[1] += total
+        return [
+            {
+                "termino": terms[0],
+                "fecha": fecha,
+                "medio": names[medio],
+                "titulares": count,
+                "total": total,
+                "proporcion": round(count / total, 4) if total else 0.0,
+            }
+            for (fecha, medio), (count, total) in points.items()
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._db.close()
+
+
+def _month_start(value: str) -> str:
+    return f"{value}-01" if len(value) == 7 else value
+
+
+def _month_end(value: str) -> str:
+    if len(value) != 7:
+        return value
+    first = date.fromisoformat(f"{value}-01")
+    next_month = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return (next_month - timedelta(days=1)).isoformat()
+
+
+class TermCountWriter:
+    """Writer que actualiza los contadores de términos con cada fila."""
+
+    def __init__(self, counts: TermCounts):
+        self.counts = counts
+
+    def append_data(self, data: Dict[str, Any]) -> None:
+        self.counts.add(data)
@@ -0,0 +1,44 @@
+import hashlib
+import re
+import unicodedata
+from typing import List
+
+_WORD_RE = re.compile(r"\w+")
+
+# Palabras vacías frecuentes en titulares; no distinguen una noticia de otra
+STOPWORDS = frozenset(
+    """
+    a al ante bajo con contra de del desde durante e el en entre es esta este
+    fue ha hay la las le les lo los mas o para pero por que se segun sin sobre
+    son su sus tras u un una uno y ya
+    """.split()
+)
+
+
+def normalize_text(text: str) -> str:
+    """Texto comparable: sin mayúsculas ni espacios de más."""
+    return " ".join(text.casefold().split())
+
+
+def fold_accents(text: str) -> str:
+    """Minúsculas y sin tildes ni diéresis ("Víctima" -> "victima")."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    """Palabras del texto en minúsculas y sin tildes, en orden."""
+    return _WORD_RE.findall(fold_accents(text))
+
+
+def index_terms(text: str) -> List[str]:
+    """Términos de búsqueda: palabras sin tildes ni palabras vacías, sin repetir."""
+    return list(dict.fromkeys(word for word in tokenize(text) if word not in STOPWORDS))
+
+
+def content_hash(*parts: str) -> int:
+    """Hash de 64 bits (blake2b) del contenido normalizado de varios campos."""
+    data = "\x1f".join(normalize_text(part or "") for part in parts)
+    return int.from_bytes(
+        hashlib.blake2b(data.encode("utf-8"), digest_size=8).digest(), "big", signed=True
+    )
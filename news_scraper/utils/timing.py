@@ -0,0 +1,99 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, ContextManager, Dict, Tuple
+
+# Contexto compartido cuando la instrumentación está desactivada: no mide nada
+# ni reserva memoria, así que el coste es una llamada a método.
+_NULL_STAGE = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("_timings", "_key", "_start")
+
+    def __init__(self, timings: "StageTimings", key: Tuple[str, str]):
+        self._timings = timings
+        self._key = key
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._timings.record(self._key, time.perf_counter() - self._start)
+        return False
+
+
+class StageTimings:
+    """Acumula los tiempos de cada etapa (fetch, decode, parse, _parse_*, write)
+    por medio durante una ejecución."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.started = datetime.now()
+        self._stats: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def stage(self, outlet: str, name: str) -> ContextManager:
+        """Context manager que mide la etapa `name` del medio `outlet`."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, (outlet, name))
+
+    def record(self, key: Tuple[str, str], elapsed: float) -> None:
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = [1, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = max(stats[2], elapsed)
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumen estructurado: {medio: {etapa: {count, total_s, max_s}}}."""
+        outlets: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (outlet, name), (count, total, maximum) in self._stats.items():
+                outlets.setdefault(outlet, {})[name] = {
+                    "count": count,
+                    "total_s": round(total, 6),
+                    "max_s": round(maximum, 6),
+                }
+        return {
+            "started": self.started.isoformat(timespec="seconds"),
+            "outlets": outlets,
+        }
+
+    def log_summary(self, logger: logging.Logger) -> None:
+        if not self.enabled:
+            return
+        for outlet, stages in self.summary()["outlets"].items():
+            for name, stats in sorted(
+                stages.items(), key=lambda item: item[1]["total_s"], reverse=True
+            ):
+                logger.info(
+                    f"[{outlet}] Tiempo {name}: {stats['total_s'] * 1000:.1f} ms "
+                    f"({stats['count']} llamadas, máx {stats['max_s'] * 1000:.1f} ms)",
+                    extra={
+                        "outlet": outlet,
+                        "stage": name,
+                        "count": stats["count"],
+                        "duration_ms": round(stats["total_s"] * 1000, 3),
+                    },
+                )
+
+    def write_json(self, filename: str) -> None:
+        """Añade el resumen de la ejecución como una línea JSON al fichero."""
+        if not self.enabled:
+            return
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        with open(filename, mode="a", encoding="utf-8") as file:
+            file.write(json.dumps(self.summary(), ensure_ascii=False) + "\n")
+
+
+NULL_TIMINGS = StageTimings(enabled=False)
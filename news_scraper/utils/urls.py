@@ -0,0 +1,67 @@
+import sys
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Parámetros de seguimiento que no identifican la noticia
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "ref",
+        "ref_src",
+        "amp",
+        "outputType",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "__twitter", "_ga")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking(param: str) -> bool:
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=65536)
+def canonicalize_url(url: str) -> str:
+    """Forma canónica de la URL de una noticia.
+
+    Usa https, pasa el host a minúsculas sin puerto por defecto, quita los
+    parámetros de seguimiento (utm_*, fbclid...), ordena el resto, elimina el
+    fragmento y la barra final. El resultado se interna: las URLs repetidas
+    comparten el mismo objeto str y se comparan por identidad en los dict.
+
+    Una URL malformada (puerto no numérico, IPv6 sin cerrar) se devuelve tal
+    cual, sin espacios alrededor.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return sys.intern(url)
+    scheme = parts.scheme.lower()
+    if scheme in ("http", "https"):
+        scheme = "https"
+
+    host = (parts.hostname or "").rstrip(".")
+    if port and port not in _DEFAULT_PORTS.values():
+        host = f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_tracking(key)
+        )
+    )
+    return sys.intern(urlunsplit((scheme, host, path, query, "")))
@@ -0,0 +1,108 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from news_scraper.utils.constants import (
+    VERSION_HEADERS,
+    VERSIONS_DB_FILENAME,
+    get_monthly_filename,
+)
+from news_scraper.utils.csv_writer import CSVWriter
+from news_scraper.utils.text import content_hash
+from news_scraper.utils.urls import canonicalize_url
+
+# Segundos entre commits: un proceso que muere no pierde más que esto
+_COMMIT_INTERVAL = 5.0
+
+
+class VersionTracker:
+    """Versión vigente de cada noticia según el hash de su titular y sección.
+
+    Los hashes se cargan en un dict al arrancar y se comparan en memoria; a
+    SQLite solo se escribe cuando una noticia es nueva o cambia, así que el
+    volumen de escritura crece con las ediciones y no con los sondeos. Los
+    cambios se confirman cada _COMMIT_INTERVAL segundos y al cerrar.
+    """
+
+    def __init__(self, filename: str = VERSIONS_DB_FILENAME):
+        self.filename = filename
+        self.edits = 0
+        self._lock = threading.Lock()
+        # URL canónica -> (hash, versión)
+        self._versions: Dict[str, Tuple[int, int]] = {}
+        self._last_commit = time.monotonic()
+
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self._db = sqlite3.connect(filename, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS versions ("
+            "url TEXT PRIMARY KEY, hash INTEGER, version INTEGER"
+            ") WITHOUT ROWID"
+        )
+        for url, digest, version in self._db.execute(
+            "SELECT url, hash, version FROM versions"
+        ):
+            self._versions[url] = (digest, version)
+
+    def observe(self, data: Dict[str, Any]) -> Optional[int]:
+        """Devuelve el número de versión si la fila es nueva o cambió, o None."""
+        url = canonicalize_url(data["url"])
+        digest = content_hash(data["titular"], data["seccion"])
+        with self._lock:
+            current = self._versions.get(url)
+            if current is not None and current[0] == digest:
+                return None
+            version = current[1] + 1 if current else 1
+            if current:
+                self.edits += 1
+            self._versions[url] = (digest, version)
+            self._db.execute(
+                "INSERT OR REPLACE INTO versions (url, hash, version) VALUES (?, ?, ?)",
+                (url, digest, version),
+            )
+            if time.monotonic() - self._last_commit >= _COMMIT_INTERVAL:
+                self._db.commit()
+                self._last_commit = time.monotonic()
+            return version
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+
+class VersionWriter:
+    """Writer que solo escribe las versiones nuevas de cada noticia en el CSV
+    mensual de versiones (rotando el fichero al cambiar de mes)."""
+
+    def __init__(self, tracker: VersionTracker):
+        self.tracker = tracker
+        self._writer: Optional[CSVWriter] = None
+        self._lock = threading.Lock()
+
+    def _get_writer(self) -> CSVWriter:
+        filename = get_monthly_filename("versiones.csv")
+        with self._lock:
+            if self._writer is None or self._writer.filename != filename:
+                self._writer = CSVWriter(filename, VERSION_HEADERS)
+                self._writer.write_headers()
+            return self._writer
+
+    def append_data(self, data: Dict[str, Any]) -> None:
+        version = self.tracker.observe(data)
+        if version is None:
+            return
+        self._get_writer().append_data(
+            {
+                "fecha_hora": datetime.now().isoformat(timespec="seconds"),
+                "medio": data["medio"],
+                "url": canonicalize_url(data["url"]),
+                "version": version,
+                "titular": data["titular"],
+                "seccion": data["seccion"],
+                "zona_portada": data["zona_portada"],
+            }
+        )
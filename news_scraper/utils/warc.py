@@ -0,0 +1,156 @@
+import gzip
+import os
+import re
+import zlib
+from datetime import datetime
+from typing import IO, Callable, Dict, Iterator, Optional, Tuple
+
+# Declaración de codificación en las primeras líneas del HTML
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w.:-]+)""", re.IGNORECASE)
+_SNIFF_BYTES = 4096
+
+
+class WarcFormatError(ValueError):
+    """El fichero no sigue el formato WARC (ISO 28500)."""
+
+
+class WarcRecord:
+    """Registro WARC: cabeceras (en minúsculas) y bloque de contenido.
+
+    `content` es None si el registro se saltó sin leer su contenido.
+    """
+
+    def __init__(self, headers: Dict[str, str], content: Optional[bytes] = None):
+        self.headers = headers
+        self.content = content
+
+    @property
+    def type(self) -> str:
+        return self.headers.get("warc-type", "")
+
+    @property
+    def target_uri(self) -> str:
+        # WARC 1.0 permite la URI entre < >
+        return self.headers.get("warc-target-uri", "").strip("<>")
+
+    @property
+    def date(self) -> Optional[datetime]:
+        """Momento de la captura (WARC-Date), con zona horaria."""
+        value = self.headers.get("warc-date", "")
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+
+def open_warc(filename: str) -> IO[bytes]:
+    """Abre un .warc o un .warc.gz (un miembro gzip por registro o uno solo)."""
+    if filename.endswith(".gz"):
+        return gzip.open(filename, "rb")  # type: ignore[return-value]
+    return open(filename, "rb")
+
+
+def iter_records(
+    file: IO[bytes], accept: Optional[Callable[[WarcRecord], bool]] = None
+) -> Iterator[WarcRecord]:
+    """Recorre los registros de un WARC sin cargar el fichero en memoria.
+
+    Solo se lee el contenido de los registros que `accept` acepta a la vista
+    de sus cabeceras; los demás (imágenes, vídeos, otras páginas) se saltan.
+    """
+    while True:
+        line = file.readline()
+        if not line:
+            return
+        if not line.strip():
+            # Separador CRLF CRLF entre registros
+            continue
+        if not line.startswith(b"WARC/"):
+            raise WarcFormatError(f"Cabecera de registro inválida: {line[:40]!r}")
+
+        headers: Dict[str, str] = {}
+        for line in iter(file.readline, b""):
+            line = line.rstrip(b"\r\n")
+            if not line:
+                break
+            name, _, value = line.decode("utf-8", "replace").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise WarcFormatError(
+                f"Content-Length inválido: {headers.get('content-length')!r}"
+            ) from None
+
+        record = WarcRecord(headers)
+        if accept is None or accept(record):
+            record.content = file.read(length)
+        else:
+            file.seek(length, os.SEEK_CUR)
+        yield record
+
+
+def _dechunk(body: bytes) -> bytes:
+    """Cuerpo con Transfer-Encoding: chunked ya unido."""
+    out = bytearray()
+    position = 0
+    while position < len(body):
+        end = body.find(b"\r\n", position)
+        if end < 0:
+            break
+        size = int(body[position:end].split(b";")[0].strip() or b"0", 16)
+        if size == 0:
+            break
+        out += body[end + 2 : end + 2 + size]
+        position = end + 2 + size + 2
+    return bytes(out)
+
+
+def _decompress(body: bytes, encoding: str) -> bytes:
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+    except (OSError, EOFError, zlib.error):
+        # Algunos archivos guardan el cuerpo ya descomprimido
+        pass
+    return body
+
+
+def parse_http_response(block: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    """(estado, cabeceras en minúsculas, cuerpo) de un registro response.
+
+    El cuerpo se devuelve sin Transfer-Encoding chunked ni compresión gzip o
+    deflate.
+    """
+    head, separator, body = block.partition(b"\r\n\r\n")
+    if not separator:
+        head, _, body = block.partition(b"\n\n")
+    lines = head.decode("iso-8859-1").splitlines()
+    try:
+        status = int(lines[0].split()[1])
+    except (IndexError, ValueError):
+        raise WarcFormatError(f"Respuesta HTTP inválida: {head[:40]!r}") from None
+
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        body = _dechunk(body)
+    body = _decompress(body, headers.get("content-encoding", "").strip().lower())
+    return status, headers, body
+
+
+def http_charset(headers: Dict[str, str], body: bytes) -> Optional[str]:
+    """Codificación de la respuesta: la de Content-Type o la del <meta> del HTML."""
+    for part in headers.get("content-type", "").split(";")[1:]:
+        name, _, value = part.partition("=")
+        if name.strip().lower() == "charset" and value.strip():
+            return value.strip().strip("\"'")
+    match = _META_CHARSET_RE.search(body[:_SNIFF_BYTES])
+    return match.group(1).decode("ascii") if match else None
@@ -0,0 +1,180 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+from urllib.parse import urlsplit
+from zoneinfo import ZoneInfo
+
+from news_scraper.scrapers.base import NewsScraper
+from news_scraper.utils.constants import OUTLETS_TIMEZONE, WARC_PENDING_PER_WORKER
+from news_scraper.utils.urls import canonicalize_url
+from news_scraper.utils.warc import (
+    WarcFormatError,
+    WarcRecord,
+    http_charset,
+    iter_records,
+    open_warc,
+    parse_http_response,
+)
+
+# Scrapers instanciados en cada proceso de parseo (uno por clase)
+_PROCESS_SCRAPERS: Dict[Type[NewsScraper], NewsScraper] = {}
+
+
+def homepage_key(url: str) -> str:
+    """Clave de una portada que no distingue http/https, www ni la barra final."""
+    parts = urlsplit(canonicalize_url(url))
+    host = parts.netloc.removeprefix("www.")
+    return f"{host}{parts.path}?{parts.query}"
+
+
+def parse_capture(
+    scraper_class: Type[NewsScraper], html: str, fecha: str
+) -> List[Dict[str, Any]]:
+    """Extrae los titulares de una portada archivada con la fecha de la captura."""
+    # Dentro del proceso hijo no viaja la instancia (sesión, logger): se crea una
+    scraper = _PROCESS_SCRAPERS.get(scraper_class)
+    if scraper is None:
+        scraper = _PROCESS_SCRAPERS[scraper_class] = scraper_class()
+    scraper.capture_date = fecha
+    try:
+        return scraper.parse_html(html)
+    finally:
+        scraper.capture_date = None
+
+
+class Capture:
+    """Portada de un medio encontrada en un WARC."""
+
+    def __init__(
+        self,
+        scraper_class: Type[NewsScraper],
+        uri: str,
+        captured_at: datetime,
+        html: Optional[str],
+    ):
+        self.scraper_class = scraper_class
+        self.uri = uri
+        self.captured_at = captured_at
+        # Día de la captura en la hora de los medios, no en la del host
+        self.fecha = (
+            captured_at.astimezone(ZoneInfo(OUTLETS_TIMEZONE)).date().isoformat()
+        )
+        self.html = html
+        self.error: Optional[str] = None
+
+
+class WarcIngest:
+    """Titulares de portadas archivadas en ficheros WARC, sin acceso a la red.
+
+    Los WARC se leen en streaming y solo se cargan las respuestas cuya URI es
+    la portada (`url`) de un scraper registrado. Cada captura se parsea en un
+    proceso aparte con el parse_html() del scraper y su fecha, de modo que
+    las capturas de distintos ficheros y días se procesan en paralelo; los
+    resultados se devuelven en el orden de lectura. Por defecto se toma una
+    captura por medio y día, como una ejecución diaria.
+    """
+
+    def __init__(
+        self,
+        scraper_classes: Iterable[Type[NewsScraper]],
+        workers: Optional[int] = None,
+        all_captures: bool = False,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.all_captures = all_captures
+        self._homepages: Dict[str, Type[NewsScraper]] = {}
+        for scraper_class in scraper_classes:
+            scraper = scraper_class()
+            try:
+                self._homepages[homepage_key(scraper.url)] = scraper_class
+            finally:
+                scraper.close()
+        self._done: Set[Tuple[Type[NewsScraper], str]] = set()
+        self.records = 0
+        self.captures_found = 0
+        self.repeated = 0  # capturas de un medio y día ya procesados
+        self.invalid = 0  # redirecciones, errores HTTP o respuestas ilegibles
+
+    def _accept(self, record: WarcRecord) -> bool:
+        return (
+            record.type == "response"
+            and homepage_key(record.target_uri) in self._homepages
+        )
+
+    def _capture(self, record: WarcRecord) -> Optional[Capture]:
+        captured_at = record.date
+        if captured_at is None or record.content is None:
+            self.invalid += 1
+            return None
+        scraper_class = self._homepages[homepage_key(record.target_uri)]
+        capture = Capture(scraper_class, record.target_uri, captured_at, None)
+        key = (scraper_class, capture.fecha)
+        if not self.all_captures and key in self._done:
+            self.repeated += 1
+            return None
+        try:
+            status, headers, body = parse_http_response(record.content)
+        except WarcFormatError:
+            self.invalid += 1
+            return None
+        if status != 200:
+            self.invalid += 1
+            return None
+
+        self._done.add(key)
+        encoding = scraper_class.RESPONSE_ENCODING or http_charset(headers, body)
+        capture.html = NewsScraper._decode(body, encoding)
+        return capture
+
+    def captures(self, filenames: Iterable[str]) -> Iterator[Capture]:
+        """Portadas de los medios registrados en los WARC, en orden de lectura."""
+        for filename in filenames:
+            with open_warc(filename) as file:
+                for record in iter_records(file, self._accept):
+                    self.records += 1
+                    if record.content is None:
+                        continue
+                    capture = self._capture(record)
+                    if capture is not None:
+                        self.captures_found += 1
+                        yield capture
+
+    def run(self, filenames: Iterable[str]) -> Iterator[Tuple[Capture, List[Dict]]]:
+        """Parsea las capturas en paralelo; devuelve (captura, titulares)."""
+        pending: Deque[Tuple[Capture, Future]] = deque()
+        # Capturas en vuelo acotadas: el HTML de años de portadas no cabe en memoria
+        max_pending = self.workers * WARC_PENDING_PER_WORKER
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for capture in self.captures(filenames):
+                future = executor.submit(
+                    parse_capture, capture.scraper_class, capture.html, capture.fecha
+                )
+                capture.html = None
+                pending.append((capture, future))
+                while len(pending) >= max_pending:
+                    yield self._result(*pending.popleft())
+            while pending:
+                yield self._result(*pending.popleft())
+
+    def _result(
+        self, capture: Capture, future: Future
+    ) -> Tuple[Capture, List[Dict[str, Any]]]:
+        try:
+            return capture, future.result()
+        except Exception as e:
+            # Una portada antigua con otra maqueta no detiene la ingesta
+            capture.error = f"{type(e).__name__}: {e}"
+            return capture, []
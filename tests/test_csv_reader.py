@@ -0,0 +1,91 @@
+import csv
+
+from news_scraper.utils.csv_reader import CSVIndex, CSVReader
+
+HEADERS = ["fecha", "medio", "titular", "zona_portada", "seccion", "url"]
+
+
+def _write(filename, rows, mode="a"):
+    with open(filename, mode=mode, newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        if mode == "w":
+            writer.writerow(HEADERS)
+        writer.writerows(rows)
+
+
+def _row(fecha, medio, n):
+    return [fecha, medio, f"Titular {n}", "apertura", "", f"https://m.com/{n}"]
+
+
+def _indexed(groups):
+    return {key: len(offsets) for key, (offsets, _) in groups.items()}
+
+
+def test_refresh_builds_the_index(tmp_path):
+    filename = str(tmp_path / "titulares.csv")
+    _write(filename, [_row("2025-07-01", "A", 1), _row("2025-07-01", "B", 2)], "w")
+
+    groups = CSVIndex(filename).refresh()
+    assert _indexed(groups) == {("2025-07-01", "A"): 1, ("2025-07-01", "B"): 1}
+
+
+def test_refresh_appends_the_tail(tmp_path):
+    filename = str(tmp_path / "titulares.csv")
+    _write(filename, [_row("2025-07-01", "A", 1)], "w")
+    index = CSVIndex(filename)
+    index.refresh()
+    with open(index.filename, encoding="utf-8") as file:
+        before = file.read()
+
+    _write(filename, [_row("2025-07-02", "A", 2), _row("2025-07-02", "A", 3)])
+    groups = index.refresh()
+    assert _indexed(groups) == {("2025-07-01", "A"): 1, ("2025-07-02", "A"): 2}
+    # Las líneas ya indexadas no se reescriben
+    with open(index.filename, encoding="utf-8") as file:
+        assert file.read().startswith(before)
+    assert _indexed(index.load()) == _indexed(groups)
+
+
+def test_refresh_rebuilds_an_index_with_a_gap(tmp_path):
+    filename = str(tmp_path / "titulares.csv")
+    _write(filename, [_row("2025-07-01", "A", n) for n in range(3)], "w")
+    index = CSVIndex(filename)
+    index.refresh()
+    with open(index.filename, encoding="utf-8") as file:
+        lines = file.readlines()
+    # Sin la segunda fila, el índice ya no cubre el CSV sin huecos
+    with open(index.filename, mode="w", encoding="utf-8") as file:
+        file.writelines([lines[0], lines[2]])
+
+    groups = index.refresh()
+    assert _indexed(groups) == {("2025-07-01", "A"): 3}
+    with open(index.filename, encoding="utf-8") as file:
+        assert file.readlines() == lines
+
+
+def test_refresh_rebuilds_an_index_past_the_end_of_the_csv(tmp_path):
+    filename = str(tmp_path / "titulares.csv")
+    _write(filename, [_row("2025-07-01", "A", n) for n in range(3)], "w")
+    index = CSVIndex(filename)
+    index.refresh()
+    # El CSV se reescribió más corto después de indexarlo
+    _write(filename, [_row("2025-07-05", "B", 9)], "w")
+
+    assert _indexed(index.refresh()) == {("2025-07-05", "B"): 1}
+
+
+def test_refresh_without_index_columns(tmp_path):
+    filename = tmp_path / "otro.csv"
+    filename.write_text("a,b\n1,2\n", encoding="utf-8")
+    assert CSVIndex(str(filename)).refresh() == {}
+
+
+def test_reader_rows_with_quoted_newlines(tmp_path):
+    filename = str(tmp_path / "titulares.csv")
+    multiline = ["2025-07-01", "A", "Dos\nlíneas, con coma", "", "", "https://m.com/x"]
+    _write(filename, [_row("2025-07-01", "B", 1), multiline], "w")
+
+    with CSVReader(filename) as reader:
+        assert len(reader) == 2
+        rows = list(reader.rows(medio="a"))
+    assert [row["titular"] for row in rows] == ["Dos\nlíneas, con coma"]
@@ -0,0 +1,74 @@
+import io
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from news_scraper.scrapers.base import NewsScraper
+from news_scraper.utils.budget import DeadlineExceeded, OutletBudget
+from news_scraper.utils.rate_limit import HostRateLimiter, rate_limiter
+
+HOST = "medio.com"
+
+
+class _Scraper(NewsScraper):
+    def _get_parsing_methods(self):
+        return []
+
+
+def test_reserve_over_max_wait_keeps_the_token():
+    limiter = HostRateLimiter(rate=1, burst=1)
+    limiter.defer(HOST, 20)
+
+    with limiter.deadline(1.0):
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            limiter.acquire(HOST, limiter.remaining())
+        assert time.monotonic() - started < 1.0
+
+    # La ficha no se gastó: fuera del bloqueo sigue disponible
+    limiter._bucket(HOST).blocked_until = 0.0
+    assert limiter.acquire(HOST) == 0.0
+
+
+def test_blocked_bucket_waits_without_deadline():
+    limiter = HostRateLimiter(rate=100, burst=1)
+    limiter.defer(HOST, 0.05)
+
+    assert limiter.remaining() is None
+    assert 0 < limiter.acquire(HOST, limiter.remaining()) <= 0.05
+
+
+def test_deadline_is_per_block():
+    limiter = HostRateLimiter()
+    with limiter.deadline(5.0):
+        assert 0 < limiter.remaining() <= 5.0
+    assert limiter.remaining() is None
+
+
+def test_fetch_stops_at_the_outlet_deadline(monkeypatch):
+    def throttled(adapter, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 503
+        response.headers["Retry-After"] = "20"
+        response.raw = io.BytesIO(b"")
+        response.url = request.url
+        response.request = request
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, "send", throttled)
+    monkeypatch.setattr(rate_limiter, "_robots_checked", {HOST})
+    rate, burst = rate_limiter.rate, rate_limiter.burst
+    rate_limiter.configure(rate=100, burst=5)
+    try:
+        scraper = _Scraper("Medio", f"https://{HOST}/")
+        scraper.budget = OutletBudget(2.0, fetch_share=1.0)
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            scraper._fetch_html(scraper.url)
+        # El Retry-After de 20 s no se duerme más allá del plazo
+        assert time.monotonic() - started < 2.0
+        assert scraper.truncated == "fetch"
+    finally:
+        rate_limiter.configure(rate, burst)
@@ -0,0 +1,42 @@
+import pytest
+
+from news_scraper.utils.search_index import decode_deltas, encode_deltas
+
+
+@pytest.mark.parametrize(
+    "doc_ids",
+    [
+        [],
+        [0],
+        [1],
+        [1, 2, 3, 4],
+        [5, 5, 5],
+        [127, 128, 255, 256, 16383, 16384],
+        [1, 2**32, 2**63],
+    ],
+)
+def test_deltas_round_trip(doc_ids):
+    assert decode_deltas(encode_deltas(doc_ids)) == doc_ids
+
+
+def test_consecutive_ids_take_one_byte_each():
+    doc_ids = list(range(1000, 1100))
+    # Solo el primero (1000) necesita dos bytes
+    assert len(encode_deltas(doc_ids)) == 101
+
+
+def test_varint_boundaries():
+    assert encode_deltas([127]) == b"\x7f"
+    assert encode_deltas([128]) == b"\x80\x01"
+    assert encode_deltas([300]) == b"\xac\x02"
+
+
+def test_appended_list_decodes_as_one():
+    # Un bloque añadido se codifica desde el último identificador ya guardado
+    head = encode_deltas([3, 10, 200])
+    tail = encode_deltas([201, 5000], previous=200)
+    assert decode_deltas(head + tail) == [3, 10, 200, 201, 5000]
+
+
+def test_decode_empty():
+    assert decode_deltas(b"") == []
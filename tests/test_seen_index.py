@@ -0,0 +1,48 @@
+from news_scraper.utils.seen_index import BloomFilter, SeenIndex
+
+
+def test_bloom_filter_save_and_load(tmp_path):
+    filename = str(tmp_path / "vistas.bloom")
+    bloom = BloomFilter(1000, 0.01)
+    urls = [f"https://medio.com/nota/{i}" for i in range(200)]
+    for url in urls:
+        bloom.add(url)
+    bloom.save(filename)
+
+    loaded = BloomFilter.load(filename, 1000, 0.01)
+    assert loaded is not None
+    assert loaded.count == 200
+    assert all(url in loaded for url in urls)
+    assert loaded._array == bloom._array
+
+
+def test_bloom_filter_load_rejects_other_parameters(tmp_path):
+    filename = str(tmp_path / "vistas.bloom")
+    BloomFilter(1000, 0.01).save(filename)
+
+    assert BloomFilter.load(filename, 5000, 0.01) is None
+    assert BloomFilter.load(str(tmp_path / "no-existe.bloom"), 1000, 0.01) is None
+
+
+def test_bloom_filter_load_rejects_truncated_file(tmp_path):
+    filename = tmp_path / "vistas.bloom"
+    BloomFilter(1000, 0.01).save(str(filename))
+    filename.write_bytes(filename.read_bytes()[:-1])
+
+    assert BloomFilter.load(str(filename), 1000, 0.01) is None
+
+
+def test_seen_index_survives_reopen(tmp_path):
+    db_filename = str(tmp_path / "vistas.sqlite3")
+    bloom_filename = str(tmp_path / "vistas.bloom")
+    row = {"url": "http://medio.com/nota/1/", "fecha": "2025-07-01", "medio": "M"}
+
+    index = SeenIndex(db_filename, bloom_filename, capacity=100)
+    assert index.observe(row)
+    assert not index.observe({**row, "fecha": "2025-07-02"})
+    index.close()
+
+    index = SeenIndex(db_filename, bloom_filename, capacity=100)
+    assert not index.observe(row)
+    assert index.last_seen("https://medio.com/nota/1") == "2025-07-02"
+    index.close()
@@ -0,0 +1,97 @@
+from news_scraper.utils.snapshots import (
+    SnapshotDiffer,
+    build_snapshot,
+    diff_snapshots,
+)
+
+
+def _row(url, zona, titular):
+    return {"url": url, "zona_portada": zona, "titular": titular, "medio": "M"}
+
+
+class _Events:
+    def __init__(self):
+        self.rows = []
+
+    def append_data(self, data):
+        self.rows.append(data)
+
+
+def test_build_snapshot_merges_zones_by_canonical_url():
+    snapshot = build_snapshot(
+        [
+            _row("http://medio.com/a/", "apertura", "A"),
+            _row("https://medio.com/a?utm_source=x", "mas_leidas", "A bis"),
+            _row("https://medio.com/b", "ultimas", "B"),
+        ]
+    )
+    assert snapshot == {
+        "https://medio.com/a": ("apertura|mas_leidas", "A"),
+        "https://medio.com/b": ("ultimas", "B"),
+    }
+
+
+def test_diff_snapshots_events():
+    previous = {
+        "https://m.com/queda": ("apertura", "Queda"),
+        "https://m.com/mueve": ("ultimas", "Mueve"),
+        "https://m.com/edita": ("ultimas", "Antes"),
+        "https://m.com/sale": ("ultimas", "Sale"),
+    }
+    current = {
+        "https://m.com/queda": ("apertura", "Queda"),
+        "https://m.com/mueve": ("apertura", "Mueve"),
+        "https://m.com/edita": ("ultimas", "Después"),
+        "https://m.com/entra": ("ultimas", "Entra"),
+    }
+    events = {(e["evento"], e["url"]): e for e in diff_snapshots(previous, current)}
+
+    assert set(events) == {
+        ("mueve", "https://m.com/mueve"),
+        ("edita", "https://m.com/edita"),
+        ("entra", "https://m.com/entra"),
+        ("sale", "https://m.com/sale"),
+    }
+    assert events["mueve", "https://m.com/mueve"]["zona_anterior"] == "ultimas"
+    assert events["mueve", "https://m.com/mueve"]["zona_portada"] == "apertura"
+    assert events["edita", "https://m.com/edita"]["titular_anterior"] == "Antes"
+    assert events["sale", "https://m.com/sale"]["titular_anterior"] == "Sale"
+    assert events["sale", "https://m.com/sale"]["titular"] == ""
+
+
+def test_diff_snapshots_move_and_edit_together():
+    previous = {"https://m.com/a": ("ultimas", "Antes")}
+    current = {"https://m.com/a": ("apertura", "Después")}
+    assert [e["evento"] for e in diff_snapshots(previous, current)] == [
+        "mueve",
+        "edita",
+    ]
+
+
+def test_diff_identical_snapshots_is_empty():
+    snapshot = {"https://m.com/a": ("apertura", "A")}
+    assert diff_snapshots(snapshot, dict(snapshot)) == []
+
+
+def test_differ_first_page_is_only_stored(tmp_path):
+    events = _Events()
+    differ = SnapshotDiffer(events, filename=str(tmp_path / "portadas.json"))
+    differ.observe("M", [_row("https://m.com/a", "apertura", "A")])
+    assert events.rows == []
+
+    differ.observe("M", [_row("https://m.com/b", "apertura", "B")])
+    assert sorted(e["evento"] for e in events.rows) == ["entra", "sale"]
+
+
+def test_differ_flush_skips_partial_outlets(tmp_path):
+    events = _Events()
+    differ = SnapshotDiffer(events, filename=str(tmp_path / "portadas.json"))
+    differ.observe("M", [_row("https://m.com/a", "apertura", "A")])
+
+    differ.append_data(_row("https://m.com/b", "apertura", "B"))
+    differ.flush(skip={"M"})
+    assert events.rows == []
+
+    # La portada incompleta no sustituye a la anterior
+    differ.observe("M", [_row("https://m.com/a", "apertura", "A")])
+    assert events.rows == []
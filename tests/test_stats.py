@@ -0,0 +1,33 @@
+import csv
+from datetime import date
+
+from news_scraper.stats import Partition
+
+HEADERS = ["fecha", "medio", "titular", "zona_portada", "seccion", "url"]
+
+
+def _write(filename, rows):
+    with open(filename, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(HEADERS)
+        writer.writerows(rows)
+
+
+def _row(fecha, n):
+    return [fecha, "M", f"Titular {n}", "apertura", "", f"https://m.com/{n}"]
+
+
+def test_partition_normalizes_dates_and_skips_invalid(tmp_path):
+    filename = str(tmp_path / "titulares.csv")
+    _write(
+        filename,
+        [_row("01/03/2019", 1), _row("ayer", 2), _row("2019-03-02 10:30", 3)],
+    )
+    partition = Partition(filename, cache_dir=str(tmp_path / "cache"))
+
+    columns = partition.load(today=date(2019, 3, 2))
+    days = columns["day"].astype("datetime64[D]").astype(str).tolist()
+    assert days == ["2019-03-01", "2019-03-02"]
+    assert partition.invalid_rows == 1
+    # El día cerrado quedó en caché con su fecha ya normalizada
+    assert partition.cached_rows == 1
@@ -0,0 +1,21 @@
+from news_scraper.utils.versions import VersionTracker
+
+
+def _row(titular, seccion="Policiales"):
+    return {"url": "http://medio.com/nota/1/", "titular": titular, "seccion": seccion}
+
+
+def test_versions_survive_reopen(tmp_path):
+    filename = str(tmp_path / "versiones.sqlite3")
+
+    tracker = VersionTracker(filename)
+    assert tracker.observe(_row("Antes")) == 1
+    assert tracker.observe(_row("Antes")) is None
+    tracker.close()
+
+    # close() confirma lo que quedaba pendiente del intervalo de commit
+    tracker = VersionTracker(filename)
+    assert tracker.observe(_row("Antes")) is None
+    assert tracker.observe(_row("Después")) == 2
+    assert tracker.edits == 1
+    tracker.close()
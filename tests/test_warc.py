@@ -0,0 +1,125 @@
+import gzip
+import io
+import zlib
+
+import pytest
+
+from news_scraper.utils.warc import (
+    WarcFormatError,
+    http_charset,
+    iter_records,
+    open_warc,
+    parse_http_response,
+)
+
+
+def _record(warc_type, uri, block, date="2025-07-14T09:30:00Z"):
+    head = (
+        f"WARC/1.0\r\n"
+        f"WARC-Type: {warc_type}\r\n"
+        f"WARC-Target-URI: {uri}\r\n"
+        f"WARC-Date: {date}\r\n"
+        f"Content-Length: {len(block)}\r\n"
+        f"\r\n"
+    ).encode()
+    return head + block + b"\r\n\r\n"
+
+
+def _response(body, *headers):
+    head = "\r\n".join(("HTTP/1.1 200 OK", *headers)).encode("latin-1")
+    return head + b"\r\n\r\n" + body
+
+
+def test_iter_records_reads_headers_and_content():
+    data = _record("response", "https://medio.com/", _response(b"<html></html>"))
+    data += _record("request", "https://medio.com/", b"GET / HTTP/1.1\r\n\r\n")
+    records = list(iter_records(io.BytesIO(data)))
+
+    assert [record.type for record in records] == ["response", "request"]
+    assert records[0].target_uri == "https://medio.com/"
+    assert records[0].date.isoformat() == "2025-07-14T09:30:00+00:00"
+    assert parse_http_response(records[0].content)[2] == b"<html></html>"
+
+
+def test_iter_records_skips_content_not_accepted():
+    data = _record("resource", "https://medio.com/logo.png", b"\x89PNG" * 100)
+    data += _record("response", "https://medio.com/", _response(b"portada"))
+    records = list(
+        iter_records(io.BytesIO(data), lambda record: record.type == "response")
+    )
+
+    assert records[0].content is None
+    assert parse_http_response(records[1].content)[2] == b"portada"
+
+
+def test_target_uri_between_angle_brackets():
+    data = _record("response", "<https://medio.com/>", _response(b""))
+    (record,) = iter_records(io.BytesIO(data))
+    assert record.target_uri == "https://medio.com/"
+
+
+def test_invalid_date_is_none():
+    data = _record("response", "https://medio.com/", b"", date="ayer")
+    (record,) = iter_records(io.BytesIO(data))
+    assert record.date is None
+
+
+def test_invalid_record_header():
+    with pytest.raises(WarcFormatError):
+        list(iter_records(io.BytesIO(b"HTTP/1.1 200 OK\r\n\r\n")))
+
+
+def test_open_warc_gzip_member_per_record(tmp_path):
+    filename = tmp_path / "captura.warc.gz"
+    first = _record("response", "https://a.com/", _response(b"A"))
+    second = _record("response", "https://b.com/", _response(b"B"))
+    filename.write_bytes(gzip.compress(first) + gzip.compress(second))
+
+    with open_warc(str(filename)) as file:
+        uris = [record.target_uri for record in iter_records(file)]
+    assert uris == ["https://a.com/", "https://b.com/"]
+
+
+def test_parse_chunked_response():
+    body = b"4\r\nHola\r\n7;ext=1\r\n, mundo\r\n0\r\n\r\n"
+    status, headers, parsed = parse_http_response(
+        _response(body, "Transfer-Encoding: chunked")
+    )
+    assert status == 200
+    assert headers["transfer-encoding"] == "chunked"
+    assert parsed == b"Hola, mundo"
+
+
+def test_parse_gzip_and_chunked_response():
+    compressed = gzip.compress("<p>Año</p>".encode("utf-8"))
+    body = b"%x\r\n%s\r\n0\r\n\r\n" % (len(compressed), compressed)
+    _, _, parsed = parse_http_response(
+        _response(body, "Transfer-Encoding: chunked", "Content-Encoding: gzip")
+    )
+    assert parsed.decode("utf-8") == "<p>Año</p>"
+
+
+def test_parse_raw_deflate_response():
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    body = compressor.compress(b"portada") + compressor.flush()
+    _, _, parsed = parse_http_response(_response(body, "Content-Encoding: deflate"))
+    assert parsed == b"portada"
+
+
+def test_body_already_decompressed_is_kept():
+    _, _, parsed = parse_http_response(
+        _response(b"<html>", "Content-Encoding: gzip")
+    )
+    assert parsed == b"<html>"
+
+
+def test_invalid_status_line():
+    with pytest.raises(WarcFormatError):
+        parse_http_response(b"basura\r\n\r\n")
+
+
+def test_http_charset():
+    content_type = {"content-type": 'text/html; charset="ISO-8859-1"'}
+    assert http_charset(content_type, b"") == "ISO-8859-1"
+    assert http_charset({}, b'<head><meta charset="windows-1252">') == "windows-1252"
+    assert http_charset({"content-type": "text/html"}, b"<html>") is None
@@ -0,0 +1,15 @@
+from datetime import datetime, timezone
+
+from news_scraper.scrapers.base import NewsScraper
+from news_scraper.warc_ingest import Capture
+
+
+def test_capture_date_in_outlet_timezone():
+    # 02:30 UTC es todavía el día anterior en Buenos Aires (UTC-3)
+    captured_at = datetime(2019, 3, 2, 2, 30, tzinfo=timezone.utc)
+    capture = Capture(NewsScraper, "https://medio.com/", captured_at, None)
+    assert capture.fecha == "2019-03-01"
+
+    captured_at = datetime(2019, 3, 2, 3, 30, tzinfo=timezone.utc)
+    capture = Capture(NewsScraper, "https://medio.com/", captured_at, None)
+    assert capture.fecha == "2019-03-02"